@@ -8,23 +8,99 @@ data is kept under ``JSON/`` and can safely survive bot restarts.
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from itertools import islice
 import json
 import logging
 from pathlib import Path
+import random
 import re
-from typing import Any
+import time
+from typing import Any, Literal
 
-import aiohttp
 import discord
 from discord.ext import commands, tasks
 
+from COGS._habbo_api import DEFAULT_HOTEL, hotel_base_url, hotel_from_identifier
+from COGS._habbo_collections import (
+    COLLECTION_SOURCES,
+    DETAIL_COLLECTIONS,
+    DETAILS_UNAVAILABLE_STATUSES,
+    collection_ids,
+    describe_items,
+    diff_collections,
+    item_names,
+    profile_digest,
+)
+from COGS._habbo_delivery import DestinationCache, NotificationOutbox
+from COGS._habbo_history import ChangeIndex
+from COGS._habbo_id_index import IdPage, TrackedIdIndex
+from COGS._habbo_observations import ProfileObservation, ProfileObservationBus
+from COGS._habbo_series import SERIES_FIELDS, SeriesStore
+
 
 LOGGER = logging.getLogger(__name__)
+# Tracker storage lives in the bot root's JSON directory.
+JSON_DIR = Path(__file__).resolve().parent.parent / "JSON"
 DEFAULT_CHANNEL_ID = 1528811302087032954
 DEFAULT_MENTION_USER_ID = 298121351871594497
-CHECK_INTERVAL_MINUTES = 5
 HABBO_ID_PATTERN = re.compile(r"^[a-z]{2,5}-[a-f0-9]{16,64}$", re.IGNORECASE)
+# IDs are polled by tier: a profile that changed recently (per the change log)
+# is likely to change again soon, while one that has been quiet for weeks is
+# not. (tier, last change within seconds or None for the rest, poll interval
+# in minutes). "poll_intervals_minutes" in the tracker config overrides the
+# intervals, e.g. {"hot": 1, "warm": 20, "cold": 240}. Any detected change
+# promotes an ID to hot immediately.
+POLL_TIERS = (
+    ("hot", 24 * 60 * 60, 2),
+    ("warm", 7 * 24 * 60 * 60, 15),
+    ("cold", None, 120),
+)
+# Newly added IDs start warm, as if their last change had just left the hot
+# window: a bulk add of hundreds of hot IDs would take the whole per-hotel
+# budget the tracker shares with the watcher for a day.
+NEW_ID_QUIET_SECONDS = POLL_TIERS[0][1] + 1
+# The background task wakes this often and fetches only the IDs that are due.
+POLL_TICK_SECONDS = 60
+# Profile lookups in flight at once during a scan ("scan_concurrency" in the
+# tracker config overrides it). Request pacing and Retry-After pauses come
+# from the shared per-hotel limiter, so this only overlaps response latency;
+# an ID that hits a 429 is queued again once after the hotel's pause.
+SCAN_CONCURRENCY = 4
+SCAN_RATE_LIMIT_RETRIES = 1
+CHANGE_HISTORY_LIMIT = 5000
+# /habboidlist pages; the buttons stop working after the timeout.
+LIST_PAGE_SIZE = 20
+LIST_VIEW_TIMEOUT_SECONDS = 180
+# Bulk add/remove accept IDs separated by whitespace, commas or semicolons,
+# typed or in an attached text file.
+BULK_ID_LIMIT = 500
+BULK_ATTACHMENT_MAX_BYTES = 64 * 1024
+BULK_ID_SEPARATORS = re.compile(r"[\s,;]+")
+BULK_SUMMARY_LINES = 25
+# Changes touching only these fields are routine activity rather than profile
+# edits. "trivial_changes" in the tracker config decides what happens to them:
+# "summarise" (default) lists those profiles in one summary embed per scan,
+# "filter" drops them from alerts (the change log keeps them) and "alert"
+# treats them like any other change. "trivial_fields" overrides the fields.
+TRIVIAL_FIELDS = ("lastAccessTime", "online")
+TRIVIAL_CHANGE_MODES = ("summarise", "filter", "alert")
+TRIVIAL_SUMMARY_LIMIT = 40
+# Badge and group lists cost one detail request each. They are refetched when
+# the profile digest changes or after this long ("collection_refresh_hours"
+# in the tracker config overrides it).
+COLLECTION_REFRESH_HOURS = 24
+# After a failed detail request the ID waits this long before the next try,
+# doubling per consecutive failure up to the refresh interval.
+COLLECTION_RETRY_MINUTES = 15
+# /habboidhistory sends one embed per page and stops after the last page;
+# a narrower field or "since" filter reaches further back.
+HISTORY_PAGE_SIZE = 10
+HISTORY_MAX_PAGES = 5
+HISTORY_VALUE_LIMIT = 120
+RELATIVE_SINCE_PATTERN = re.compile(r"^(\d+)\s*([mhdw])$", re.IGNORECASE)
+RELATIVE_SINCE_UNITS = {"m": "minutes", "h": "hours", "d": "days", "w": "weeks"}
+DEFAULT_TREND_WINDOW = "7d"
 
 # API properties that are useful to humans and stable enough to compare. New
 # simple API properties are also captured by profile_snapshot, making "etc."
@@ -41,7 +117,11 @@ FIELD_LABELS = {
     "currentLevelCompletePercent": "Level progress",
     "totalExperience": "Experience",
     "starGemCount": "Star gems",
+    "selectedBadges": "Selected badges",
+    "badges": "Badges",
+    "groups": "Groups",
 }
+# List properties are compared as sets by _habbo_collections, not as scalars.
 IGNORED_PROPERTIES = {"uniqueId", "selectedBadges", "groups", "badges"}
 
 
@@ -50,25 +130,56 @@ class HabboIdTracker(commands.Cog):
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=20))
+        # Profiles come through the bot-wide observation bus shared with the
+        # watcher: one rate budget per hotel (from the ID prefix), one cache.
+        self.observations = ProfileObservationBus.for_bot(bot)
+        self._notifications_posted = 0
+        # Change embeds are held until the scan that produced them finishes,
+        # then queued on the outbox together; only the first message mentions.
+        self._pending_alerts: list[discord.Embed] = []
+        self._trivial_alerts: list[tuple[str, str, list[str]]] = []
+        self._mention_due: int | None = None
+        self.outbox = NotificationOutbox(self.resolve_alert_destination, invalidate=self.invalidate_alert_destination)
+        # Wall-clock epoch seconds per ID; rebuilt from the change log on load.
+        self._last_change_at: dict[str, float] = {}
+        self._next_poll_at: dict[str, float] = {}
+        # The scan lock only stops scans overlapping; the state lock orders JSON
+        # writes, so add/remove never wait for a scan to finish.
         self._scan_lock = asyncio.Lock()
-        root = Path(__file__).resolve().parent.parent / "JSON"
+        self._state_lock = asyncio.Lock()
+        root = JSON_DIR
         self.ids_file = root / "habbo_tracked_ids.json"
         self.snapshots_file = root / "habbo_id_snapshots.json"
         self.changes_file = root / "habbo_id_changes.json"
         self.config_file = root / "habbo_id_tracker_config.json"
+        self.collections_file = root / "habbo_id_collections.json"
+        # Numeric fields (experience, level, star gems) as per-ID binary series.
+        self.series = SeriesStore(root / "habbo_id_series")
         self.tracked_ids = self._load_json(self.ids_file, {})
         self.snapshots = self._load_json(self.snapshots_file, {})
         self.changes = self._load_json(self.changes_file, [])
+        self.collections = self._load_json(self.collections_file, {})
+        self.id_index = TrackedIdIndex(self.tracked_ids)
+        self._collections_in_flight: set[str] = set()
+        # IDs the running scan looks up and diffs itself.
+        self._scan_ids: set[str] = set()
         self.config = self._load_json(
             self.config_file,
             {"channel_id": DEFAULT_CHANNEL_ID, "mention_user_id": DEFAULT_MENTION_USER_ID},
         )
+        self.change_index = ChangeIndex(self.changes)
+        self.rebuild_poll_schedule()
+        self._unsubscribe_observations = self.observations.subscribe(self.on_profile_observed)
         self.profile_check.start()
 
     async def cog_unload(self):
         self.profile_check.cancel()
-        await self.session.close()
+        self._unsubscribe_observations()
+        # Let diffs already started on published profiles queue their alerts.
+        await self.observations.drain()
+        self.flush_alerts()
+        await self.outbox.close()
+        await self.observations.close_when_unused()
 
     @staticmethod
     def _load_json(path: Path, default: Any) -> Any:
@@ -88,17 +199,57 @@ class HabboIdTracker(commands.Cog):
     @staticmethod
     def _save_json(path: Path, value: Any) -> None:
         """Atomically replace a JSON file to avoid half-written state files."""
+        HabboIdTracker._write_text(path, json.dumps(value, indent=2, sort_keys=True))
+
+    @staticmethod
+    def _write_text(path: Path, text: str) -> None:
         path.parent.mkdir(parents=True, exist_ok=True)
         temporary = path.with_suffix(path.suffix + ".tmp")
-        temporary.write_text(json.dumps(value, indent=2, sort_keys=True), encoding="utf-8")
+        temporary.write_text(text, encoding="utf-8")
         temporary.replace(path)
 
+    async def save_state(self, include_changes: bool = True) -> None:
+        """Persist tracked IDs, snapshots, change history and series rows off the event loop.
+
+        Payloads are serialized before the first await, so each write is a
+        consistent snapshot; the state lock keeps an older write from landing
+        after a newer one.
+        """
+        async with self._state_lock:
+            if len(self.changes) > CHANGE_HISTORY_LIMIT:
+                self.change_index.discard(self.changes[:-CHANGE_HISTORY_LIMIT])
+                self.changes = self.changes[-CHANGE_HISTORY_LIMIT:]
+            files = [
+                (self.ids_file, self.tracked_ids),
+                (self.snapshots_file, self.snapshots),
+                (self.collections_file, self.collections),
+            ]
+            if include_changes:
+                files.append((self.changes_file, self.changes))
+            payloads = [(path, json.dumps(value, indent=2, sort_keys=True)) for path, value in files]
+            series = self.series
+            series_rows = series.take_pending()
+
+            def write():
+                for path, text in payloads:
+                    self._write_text(path, text)
+                if series_rows:
+                    series.write(series_rows)
+
+            try:
+                await asyncio.to_thread(write)
+            finally:
+                if series_rows:
+                    series.finish_write(series_rows)
+
     @staticmethod
     def normalize_habbo_id(habbo_id: str) -> str:
         """Validate and normalize a Habbo unique ID supplied in Discord."""
         normalized = habbo_id.strip().lower()
         if not HABBO_ID_PATTERN.fullmatch(normalized):
             raise ValueError("That does not look like a Habbo ID (example: `hhus-452093bfeba8168bb70ea408bea12112`).")
+        if hotel_from_identifier(normalized) is None:
+            raise ValueError(f"`{normalized.split('-', 1)[0]}` is not a supported Habbo hotel prefix.")
         return normalized
 
     @staticmethod
@@ -119,19 +270,105 @@ class HabboIdTracker(commands.Cog):
             if old.get(key) != new.get(key)
         }
 
-    async def fetch_profile(self, habbo_id: str) -> dict[str, Any] | None:
-        """Fetch one US Habbo profile; None means unavailable/non-public."""
-        url = f"https://www.habbo.com/api/public/users/{habbo_id}"
+    @staticmethod
+    def hotel_url(habbo_id: str) -> str:
+        return hotel_base_url(hotel_from_identifier(habbo_id) or DEFAULT_HOTEL)
+
+    async def fetch_profile_result(self, habbo_id: str, max_age: float = 0.0) -> tuple[int | None, dict[str, Any] | None]:
+        """Fetch one profile from its own hotel; returns ``(status, profile)``."""
+        status, profile = await self.observations.fetch_unique_id(habbo_id, max_age=max_age)
+        if status is not None and status not in (200, 404, 403, 429):
+            LOGGER.warning("Habbo returned HTTP %s for %s", status, habbo_id)
+        return status, profile
+
+    async def fetch_profile(self, habbo_id: str, max_age: float = 0.0) -> dict[str, Any] | None:
+        """Fetch one profile; None means unavailable/non-public."""
+        return (await self.fetch_profile_result(habbo_id, max_age))[1]
+
+    def collection_refresh_seconds(self) -> float:
         try:
-            async with self.session.get(url) as response:
-                if response.status == 200:
-                    payload = await response.json()
-                    return payload if isinstance(payload, dict) else None
-                if response.status not in (404, 403):
-                    LOGGER.warning("Habbo returned HTTP %s for %s", response.status, habbo_id)
-        except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
-            LOGGER.warning("Habbo lookup failed for %s: %s", habbo_id, exc)
-        return None
+            return max(1.0, float(self.config.get("collection_refresh_hours", COLLECTION_REFRESH_HOURS))) * 3600
+        except (TypeError, ValueError):
+            return COLLECTION_REFRESH_HOURS * 3600
+
+    async def fetch_collections(self, habbo_id: str) -> dict[str, Any]:
+        """Fetch the badge and group lists; collections that failed are left out.
+
+        Collections Habbo refuses outright (hidden profile, 403/404) are listed
+        under ``"unavailable"``.
+        """
+        base = f"{self.hotel_url(habbo_id)}/api/public/users/{habbo_id}"
+        fetched: dict[str, Any] = {}
+        unavailable = []
+        for field in DETAIL_COLLECTIONS:
+            endpoint, key = COLLECTION_SOURCES[field]
+            status, items = await self.observations.api.get_json(f"{base}/{endpoint}")
+            if status in DETAILS_UNAVAILABLE_STATUSES:
+                unavailable.append(field)
+                continue
+            if status != 200 or not isinstance(items, list):
+                continue
+            fetched[field] = collection_ids(items, key)
+            if field == "groups":
+                # Group IDs are opaque; keep names so alerts stay readable after a leave.
+                fetched["names"] = item_names(items, key)
+        if unavailable:
+            fetched["unavailable"] = unavailable
+        return fetched
+
+    def collection_retry_seconds(self, failures: int) -> float:
+        return min(COLLECTION_RETRY_MINUTES * 60 * 2 ** max(0, failures - 1), self.collection_refresh_seconds())
+
+    async def collection_changes(self, habbo_id: str, profile: dict[str, Any]) -> dict[str, dict[str, list[str]]]:
+        """Update the ID's collection snapshot and return set differences.
+
+        The first snapshot of each collection is a baseline and reports nothing.
+        Every fetch attempt is recorded: a failed detail request backs off
+        (``retry_at``) instead of being retried on each observation, and
+        details Habbo refuses (``unavailable``) wait for the refresh interval.
+        """
+        collections = self.collections
+        if habbo_id in self._collections_in_flight:
+            # The pass fetching the details diffs them, selected badges included.
+            return {}
+        old = collections.get(habbo_id) or {}
+        new = dict(old)
+        new["selectedBadges"] = collection_ids(profile.get("selectedBadges"), COLLECTION_SOURCES["selectedBadges"][1])
+        digest = profile_digest(profile)
+        now = time.time()
+        checked_at = self._parse_time(old.get("checked_at"))
+        retry_at = self._parse_time(old.get("retry_at"))
+        stale = checked_at is None or now - checked_at >= self.collection_refresh_seconds()
+        if retry_at is not None:
+            due = now >= retry_at
+        elif old.get("unavailable"):
+            due = stale
+        else:
+            due = digest != old.get("digest") or stale
+        in_flight = self._collections_in_flight
+        if due:
+            in_flight.add(habbo_id)
+            try:
+                fetched = await self.fetch_collections(habbo_id)
+            finally:
+                in_flight.discard(habbo_id)
+            new.update(fetched)
+            new["digest"] = digest
+            new["checked_at"] = datetime.fromtimestamp(now, timezone.utc).isoformat()
+            if not fetched.get("unavailable"):
+                new.pop("unavailable", None)
+            answered = set(fetched) | set(fetched.get("unavailable", ()))
+            if not answered.issuperset(DETAIL_COLLECTIONS):
+                failures = int(old.get("failures") or 0) + 1
+                new["failures"] = failures
+                new["retry_at"] = datetime.fromtimestamp(now + self.collection_retry_seconds(failures), timezone.utc).isoformat()
+            else:
+                new.pop("failures", None)
+                new.pop("retry_at", None)
+            if habbo_id not in self.tracked_ids:
+                return {}
+        collections[habbo_id] = new
+        return diff_collections(old, new, COLLECTION_SOURCES)
 
     @staticmethod
     def _display_value(value: Any) -> str:
@@ -152,64 +389,477 @@ class HabboIdTracker(commands.Cog):
         )
         avatar = profile.get("figureString")
         if avatar:
-            embed.set_thumbnail(url=f"https://www.habbo.com/habbo-imaging/avatarimage?figure={avatar}&size=l")
+            embed.set_thumbnail(url=f"{self.hotel_url(habbo_id)}/habbo-imaging/avatarimage?figure={avatar}&size=l")
         for key, values in list(differences.items())[:25]:
             label = FIELD_LABELS.get(key, key.replace("_", " ").title())
+            if "added" in values:
+                added, removed = describe_items(values["added"]), describe_items(values["removed"])
+                embed.add_field(name=label, value=f"**Added:** {added[:450]}\n**Removed:** {removed[:450]}", inline=False)
+                continue
             old_value = self._display_value(values["old"])
             new_value = self._display_value(values["new"])
             embed.add_field(name=label, value=f"**Before:** {old_value[:450]}\n**Now:** {new_value[:450]}", inline=False)
         embed.set_footer(text=f"{len(differences)} change(s) detected")
         return embed
 
-    async def _notification_channel(self):
-        channel_id = int(self.config.get("channel_id", DEFAULT_CHANNEL_ID))
-        channel = self.bot.get_channel(channel_id)
-        if channel is None:
+    @staticmethod
+    def resolve_field(value: str, known_fields=()) -> str:
+        """Map a field key or its label (any case) to the key used in the change log."""
+        wanted = value.strip().lower()
+        for key, label in FIELD_LABELS.items():
+            if wanted in (key.lower(), label.lower()):
+                return key
+        for key in known_fields:
+            if wanted == key.lower():
+                return key
+        raise ValueError(f"Unknown field `{value.strip()}`. Try one of: {', '.join(FIELD_LABELS)}.")
+
+    @staticmethod
+    def parse_since(value: str, now: datetime | None = None) -> float:
+        """Parse ``7d``/``12h``/``30m``/``2w`` or an ISO date into epoch seconds."""
+        now = now or datetime.now(timezone.utc)
+        text = value.strip()
+        relative = RELATIVE_SINCE_PATTERN.fullmatch(text)
+        if relative:
+            amount, unit = int(relative.group(1)), RELATIVE_SINCE_UNITS[relative.group(2).lower()]
+            return (now - timedelta(**{unit: amount})).timestamp()
+        try:
+            parsed = datetime.fromisoformat(text)
+        except ValueError:
+            raise ValueError("Use a relative age like `7d`, `12h` or `30m`, or a date like `2026-03-01`.") from None
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed.timestamp()
+
+    def format_history_entry(self, entry: dict[str, Any], field: str | None = None) -> str:
+        detected_at = self._parse_time(entry.get("detected_at"))
+        when = f"<t:{int(detected_at)}:f>" if detected_at is not None else str(entry.get("detected_at"))
+        lines = [when]
+        changes = entry.get("changes") or {}
+        for key in [field] if field else list(changes):
+            values = changes.get(key) or {}
+            label = FIELD_LABELS.get(key, key.replace("_", " ").title())
+            if "added" in values:
+                added = describe_items(values["added"])[:HISTORY_VALUE_LIMIT]
+                removed = describe_items(values["removed"])[:HISTORY_VALUE_LIMIT]
+                lines.append(f"• **{label}:** added {added}; removed {removed}")
+                continue
+            old_value = self._display_value(values.get("old"))[:HISTORY_VALUE_LIMIT]
+            new_value = self._display_value(values.get("new"))[:HISTORY_VALUE_LIMIT]
+            lines.append(f"• **{label}:** {old_value} → {new_value}")
+        return "\n".join(lines)
+
+    def build_history_embed(
+        self,
+        habbo_id: str,
+        entries: list[dict[str, Any]],
+        field: str | None,
+        page: int,
+        pages: int,
+        total: int,
+    ) -> discord.Embed:
+        """Build one page of /habboidhistory; ``field`` limits each entry to that field."""
+        name = self.tracked_ids.get(habbo_id, {}).get("name") or "Unknown Habbo"
+        heading = f"Unique ID: `{habbo_id}`"
+        if field:
+            heading += f"\nField: {FIELD_LABELS.get(field, field)}"
+        description = heading + "\n\n" + "\n\n".join(self.format_history_entry(entry, field) for entry in entries)
+        embed = discord.Embed(title=f"Habbo profile history: {name}", description=description[:4096], colour=discord.Colour.blurple())
+        embed.set_footer(text=f"Page {page}/{pages} · {total} matching change(s), newest first")
+        return embed
+
+    @staticmethod
+    def _format_number(value: float) -> str:
+        return f"{value:,.0f}" if float(value).is_integer() else f"{value:,.2f}"
+
+    def build_trend_embed(self, habbo_id: str, window: str, trends: dict[str, dict[str, float]]) -> discord.Embed:
+        name = self.tracked_ids.get(habbo_id, {}).get("name") or "Unknown Habbo"
+        embed = discord.Embed(
+            title=f"Habbo profile trend: {name}",
+            description=f"Unique ID: `{habbo_id}`\nWindow: {window}",
+            colour=discord.Colour.blurple(),
+        )
+        for field in SERIES_FIELDS:
+            trend = trends.get(field)
+            if trend is None:
+                continue
+            embed.add_field(
+                name=FIELD_LABELS.get(field, field),
+                value=(
+                    f"{self._format_number(trend['first'])} → {self._format_number(trend['last'])}\n"
+                    f"{trend['delta']:+,.2f} ({trend['per_day']:+,.2f}/day)"
+                ),
+                inline=False,
+            )
+        points = max(trend["points"] for trend in trends.values())
+        embed.set_footer(text=f"{points} data point(s)")
+        return embed
+
+    def _notification_channel_id(self) -> int:
+        return int(self.config.get("channel_id", DEFAULT_CHANNEL_ID))
+
+    async def resolve_alert_destination(self, destination: tuple[str, int]):
+        """Resolve the alert channel through the bot-wide destination cache."""
+        channel = await DestinationCache.for_bot(self.bot).resolve(destination)
+        return ScanAlertTarget(self, channel) if channel is not None else None
+
+    def invalidate_alert_destination(self, destination: tuple[str, int], exc: Exception):
+        """Drop the cached channel after Discord reports it Forbidden/NotFound."""
+        DestinationCache.for_bot(self.bot).invalidate(destination, exc)
+
+    def trivial_change_mode(self) -> str:
+        mode = str(self.config.get("trivial_changes", TRIVIAL_CHANGE_MODES[0])).lower()
+        return mode if mode in TRIVIAL_CHANGE_MODES else TRIVIAL_CHANGE_MODES[0]
+
+    def is_trivial_change(self, differences: dict[str, Any]) -> bool:
+        fields = self.config.get("trivial_fields")
+        fields = set(fields) if isinstance(fields, list) else set(TRIVIAL_FIELDS)
+        return set(differences) <= fields
+
+    def build_trivial_summary_embed(self, trivial: list[tuple[str, str, list[str]]]) -> discord.Embed:
+        """Summarise profiles whose only changes were routine activity."""
+        lines = [
+            f"• **{name}** — {', '.join(FIELD_LABELS.get(field, field) for field in fields)}"
+            for name, _habbo_id, fields in trivial[:TRIVIAL_SUMMARY_LIMIT]
+        ]
+        if len(trivial) > TRIVIAL_SUMMARY_LIMIT:
+            lines.append(f"… and {len(trivial) - TRIVIAL_SUMMARY_LIMIT} more")
+        embed = discord.Embed(
+            title="Routine Habbo profile activity",
+            description="\n".join(lines)[:4096],
+            colour=discord.Colour.blurple(),
+            timestamp=datetime.now(timezone.utc),
+        )
+        embed.set_footer(text=f"{len(trivial)} profile(s) with activity-only changes")
+        return embed
+
+    def _scanning(self) -> bool:
+        return self._scan_lock.locked()
+
+    def queue_alert(self, habbo_id: str, profile: dict[str, Any], differences: dict[str, dict[str, Any]]) -> bool:
+        """Hold a change alert for the current scan's grouped message; False if not alerted."""
+        mode = self.trivial_change_mode()
+        if mode != "alert" and self.is_trivial_change(differences):
+            if mode == "summarise":
+                name = profile.get("name") or self.tracked_ids.get(habbo_id, {}).get("name") or habbo_id
+                self._trivial_alerts.append((name, habbo_id, sorted(differences)))
+            return False
+        self._pending_alerts.append(self.build_change_embed(habbo_id, profile, differences))
+        if not self._scanning():
+            # Observed outside a scan (e.g. by the watcher): nothing to group with.
+            self.flush_alerts()
+        return True
+
+    def flush_alerts(self) -> int:
+        """Queue held change embeds and the routine-activity summary; returns embeds queued.
+
+        The outbox packs them into messages of up to ten embeds and sends them
+        on its own worker; the first message carries the single mention.
+        """
+        embeds, self._pending_alerts = self._pending_alerts, []
+        trivial, self._trivial_alerts = self._trivial_alerts, []
+        if embeds:
+            self._mention_due = int(self.config.get("mention_user_id", DEFAULT_MENTION_USER_ID))
+        if trivial:
+            embeds.append(self.build_trivial_summary_embed(trivial))
+        destination = ("channel", self._notification_channel_id())
+        for embed in embeds:
+            self.outbox.enqueue(embed, [destination])
+        return len(embeds)
+
+    async def process_profile(self, habbo_id: str, profile: dict[str, Any]) -> bool:
+        """Diff one observed profile against its snapshot; return whether a change alert was queued.
+
+        Each observation must be processed once: a second pass started while
+        the first is still fetching collections would diff them again, so
+        scan_profiles and on_profile_observed split the IDs between them.
+        """
+        if habbo_id not in self.tracked_ids:
+            # Removed while its lookup was in flight.
+            return False
+        self.series.record(habbo_id, profile)
+        new_snapshot = self.profile_snapshot(profile)
+        old_snapshot = self.snapshots.get(habbo_id)
+        self.snapshots[habbo_id] = new_snapshot
+        self.tracked_ids[habbo_id]["name"] = profile.get("name")
+        self.id_index.rename(habbo_id, profile.get("name"))
+        differences = self.compare_snapshots(old_snapshot, new_snapshot) if old_snapshot is not None else {}
+        differences.update(await self.collection_changes(habbo_id, profile))
+        if not differences or habbo_id not in self.tracked_ids:
+            return False
+        detected_at = datetime.now(timezone.utc)
+        entry = {"habbo_id": habbo_id, "detected_at": detected_at.isoformat(), "changes": differences}
+        self.changes.append(entry)
+        self.change_index.add(entry)
+        self.record_change(habbo_id, detected_at.timestamp())
+        if not self.queue_alert(habbo_id, profile, differences):
+            return False
+        self._notifications_posted += 1
+        return True
+
+    async def on_profile_observed(self, observation: ProfileObservation):
+        """Diff a tracked profile as soon as any cog fetches it."""
+        habbo_id = str(observation.profile.get("uniqueId") or "").lower()
+        if habbo_id not in self.tracked_ids or habbo_id in self._scan_ids:
+            # The running scan diffs its own lookups.
+            return
+        await self.process_profile(habbo_id, observation.profile)
+        # Another cog's fetch counts as this ID's poll.
+        self.schedule_poll(habbo_id)
+        if not self._scan_lock.locked():
+            # A running scan saves once when it finishes.
+            await self.save_state()
+
+    def rebuild_poll_schedule(self, now: float | None = None):
+        """Derive each ID's last change from the change log and spread the first polls.
+
+        Each ID falls due at a random point within its tier's interval, so a
+        load or reload does not make every tracked ID due at once.
+        """
+        now = time.time() if now is None else now
+        last_change_at: dict[str, float] = {}
+        for habbo_id, item in self.tracked_ids.items():
+            # A newly added ID starts warm until it has been quiet for a while.
+            added_at = self._parse_time(item.get("added_at")) if isinstance(item, dict) else None
+            if added_at is not None:
+                last_change_at[habbo_id] = added_at - NEW_ID_QUIET_SECONDS
+        for change in self.changes:
+            detected_at = self._parse_time(change.get("detected_at")) if isinstance(change, dict) else None
+            habbo_id = change.get("habbo_id") if isinstance(change, dict) else None
+            if detected_at is not None and habbo_id in self.tracked_ids:
+                last_change_at[habbo_id] = max(last_change_at.get(habbo_id, 0.0), detected_at)
+        self._last_change_at = last_change_at
+        self._next_poll_at = {}
+        for habbo_id in self.tracked_ids:
+            self.schedule_poll(habbo_id, now, spread=True)
+
+    @staticmethod
+    def _parse_time(value: Any) -> float | None:
+        try:
+            return datetime.fromisoformat(str(value)).timestamp()
+        except (TypeError, ValueError):
+            return None
+
+    def poll_intervals(self) -> dict[str, float]:
+        """Return the poll interval in seconds for each tier, honouring the config."""
+        configured = self.config.get("poll_intervals_minutes")
+        configured = configured if isinstance(configured, dict) else {}
+        intervals = {}
+        for tier, _window, default_minutes in POLL_TIERS:
             try:
-                channel = await self.bot.fetch_channel(channel_id)
-            except (discord.HTTPException, discord.NotFound, discord.Forbidden):
-                LOGGER.exception("Cannot access configured Habbo tracker channel %s", channel_id)
-                return None
-        return channel
-
-    async def scan_profiles(self) -> int:
-        """Scan all IDs, persist snapshots/history, and post changed profiles."""
-        notifications = 0
+                intervals[tier] = max(1.0, float(configured.get(tier, default_minutes))) * 60
+            except (TypeError, ValueError):
+                intervals[tier] = default_minutes * 60
+        return intervals
+
+    def poll_tier(self, habbo_id: str, now: float | None = None) -> str:
+        now = time.time() if now is None else now
+        quiet_for = now - self._last_change_at.get(habbo_id, float("-inf"))
+        for tier, window, _minutes in POLL_TIERS:
+            if window is None or quiet_for <= window:
+                return tier
+        return POLL_TIERS[-1][0]
+
+    def poll_interval(self, habbo_id: str, now: float | None = None) -> float:
+        return self.poll_intervals()[self.poll_tier(habbo_id, now)]
+
+    def record_change(self, habbo_id: str, detected_at: float):
+        """Promote an ID to the hot tier as soon as a change is seen."""
+        self._last_change_at[habbo_id] = detected_at
+        self._next_poll_at[habbo_id] = detected_at + self.poll_interval(habbo_id, detected_at)
+
+    def schedule_poll(self, habbo_id: str, now: float | None = None, spread: bool = False):
+        """Schedule the next poll one interval ahead, or at a random point within it with ``spread``."""
+        now = time.time() if now is None else now
+        interval = self.poll_interval(habbo_id, now)
+        self._next_poll_at[habbo_id] = now + (random.uniform(0, interval) if spread else interval)
+
+    def due_ids(self, now: float | None = None) -> list[str]:
+        """Return tracked IDs whose next poll is due, most overdue first."""
+        now = time.time() if now is None else now
+        next_poll_at = self._next_poll_at
+        due = [habbo_id for habbo_id in self.tracked_ids if next_poll_at.get(habbo_id, 0.0) <= now]
+        return sorted(due, key=lambda habbo_id: next_poll_at.get(habbo_id, 0.0))
+
+    def tier_counts(self, now: float | None = None) -> dict[str, int]:
+        counts = {tier: 0 for tier, _window, _minutes in POLL_TIERS}
+        for habbo_id in self.tracked_ids:
+            counts[self.poll_tier(habbo_id, now)] += 1
+        return counts
+
+    def scan_concurrency(self) -> int:
+        try:
+            return max(1, int(self.config.get("scan_concurrency", SCAN_CONCURRENCY)))
+        except (TypeError, ValueError):
+            return SCAN_CONCURRENCY
+
+    async def scan_profiles(self, due_only: bool = True, max_age: float | None = None) -> int:
+        """Scan due IDs (or all), persist snapshots/history, and post changed profiles.
+
+        Lookups run with bounded concurrency and each result is diffed as soon
+        as it arrives. By default an ID reuses another cog's observation from
+        within its own poll interval. The bus also publishes the scan's fresh
+        fetches, but on_profile_observed skips IDs the scan owns so each
+        observation is diffed once. Alerts are grouped and handed to the outbox when
+        the scan ends. Returns the number of profiles alerted.
+        """
+        posted_before = self._notifications_posted
         async with self._scan_lock:
-            for habbo_id in list(self.tracked_ids):
-                profile = await self.fetch_profile(habbo_id)
-                if profile is None:
-                    # Network/API failures must not be mistaken for profile privacy changes.
-                    continue
-                new_snapshot = self.profile_snapshot(profile)
-                old_snapshot = self.snapshots.get(habbo_id)
-                self.snapshots[habbo_id] = new_snapshot
-                self.tracked_ids[habbo_id]["name"] = profile.get("name")
-                if old_snapshot is None:
-                    continue
-                differences = self.compare_snapshots(old_snapshot, new_snapshot)
-                if not differences:
-                    continue
-                detected_at = datetime.now(timezone.utc).isoformat()
-                self.changes.append({"habbo_id": habbo_id, "detected_at": detected_at, "changes": differences})
-                channel = await self._notification_channel()
-                if channel:
-                    mention_id = int(self.config.get("mention_user_id", DEFAULT_MENTION_USER_ID))
-                    await channel.send(
-                        content=f"<@{mention_id}>",
-                        embed=self.build_change_embed(habbo_id, profile, differences),
-                        allowed_mentions=discord.AllowedMentions(users=True, roles=False, everyone=False),
-                    )
-                    notifications += 1
-            # Bound history size while retaining a useful audit trail on disk.
-            self.changes = self.changes[-5000:]
-            self._save_json(self.ids_file, self.tracked_ids)
-            self._save_json(self.snapshots_file, self.snapshots)
-            self._save_json(self.changes_file, self.changes)
-        return notifications
-
-    @tasks.loop(minutes=CHECK_INTERVAL_MINUTES)
+            semaphore = asyncio.Semaphore(self.scan_concurrency())
+
+            async def lookup(habbo_id: str):
+                reuse_within = self.poll_interval(habbo_id) if max_age is None else max_age
+                async with semaphore:
+                    return habbo_id, await self.fetch_profile_result(habbo_id, reuse_within)
+
+            retries: dict[str, int] = {}
+            habbo_ids = self.due_ids() if due_only else list(self.tracked_ids)
+            # The scan diffs these itself; on_profile_observed leaves them alone.
+            self._scan_ids.update(habbo_ids)
+            pending = {asyncio.ensure_future(lookup(habbo_id)) for habbo_id in habbo_ids}
+            try:
+                while pending:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        habbo_id, (status, profile) = task.result()
+                        if status == 429 and retries.get(habbo_id, 0) < SCAN_RATE_LIMIT_RETRIES:
+                            # The hotel's limiter already holds requests for Retry-After.
+                            retries[habbo_id] = retries.get(habbo_id, 0) + 1
+                            pending.add(asyncio.ensure_future(lookup(habbo_id)))
+                            continue
+                        self.schedule_poll(habbo_id)
+                        if profile is None:
+                            # Network/API failures must not be mistaken for profile privacy changes.
+                            continue
+                        await self.process_profile(habbo_id, profile)
+            finally:
+                for task in pending:
+                    task.cancel()
+                self._scan_ids.clear()
+                # One grouped alert for the whole scan, sent off the scan path.
+                self.flush_alerts()
+            await self.save_state()
+        return self._notifications_posted - posted_before
+
+    def start_tracking(self, habbo_id: str, profile: dict[str, Any]):
+        self.tracked_ids[habbo_id] = {"name": profile.get("name"), "added_at": datetime.now(timezone.utc).isoformat()}
+        self.snapshots[habbo_id] = self.profile_snapshot(profile)
+        self.id_index.add(habbo_id, profile.get("name"))
+        # New IDs start in the warm tier; their profile was just fetched, and
+        # spreading the next poll keeps a bulk add from falling due together.
+        now = time.time()
+        self._last_change_at[habbo_id] = now - NEW_ID_QUIET_SECONDS
+        self.schedule_poll(habbo_id, now, spread=True)
+
+    def stop_tracking(self, habbo_id: str) -> bool:
+        """Forget an ID's state (its change log and series stay); False if it was not tracked."""
+        if self.tracked_ids.pop(habbo_id, None) is None:
+            return False
+        self.id_index.remove(habbo_id)
+        self.snapshots.pop(habbo_id, None)
+        self.collections.pop(habbo_id, None)
+        self._last_change_at.pop(habbo_id, None)
+        self._next_poll_at.pop(habbo_id, None)
+        return True
+
+    @staticmethod
+    def split_id_list(text: str) -> list[str]:
+        """Split typed or uploaded IDs, keeping the first occurrence of each."""
+        return list(dict.fromkeys(item for item in BULK_ID_SEPARATORS.split(text or "") if item))
+
+    async def collect_bulk_ids(self, ctx: commands.Context, habbo_ids: str, attachment) -> list[str]:
+        """Gather IDs from the argument and an attachment (or the text command's first upload)."""
+        raw = habbo_ids or ""
+        if attachment is None:
+            message = getattr(ctx, "message", None)
+            attachments = getattr(message, "attachments", None) or []
+            attachment = attachments[0] if attachments else None
+        if attachment is not None:
+            if attachment.size > BULK_ATTACHMENT_MAX_BYTES:
+                raise ValueError(f"The attached file is larger than {BULK_ATTACHMENT_MAX_BYTES // 1024} KB.")
+            try:
+                data = await attachment.read()
+            except discord.HTTPException as exc:
+                raise ValueError(f"I could not download the attached file ({exc}); please try again.") from exc
+            raw += "\n" + data.decode("utf-8", errors="replace")
+        items = self.split_id_list(raw)
+        if not items:
+            raise ValueError("Give one or more Habbo IDs, separated by spaces, commas or new lines, or attach a text file.")
+        if len(items) > BULK_ID_LIMIT:
+            raise ValueError(f"At most {BULK_ID_LIMIT} IDs can be handled at once; {len(items)} were given.")
+        return items
+
+    async def add_many(self, raw_ids: list[str]) -> dict[str, str]:
+        """Validate, fetch concurrently and start tracking; returns an outcome per input.
+
+        Lookups share the scan's concurrency bound and the per-hotel limiter;
+        state is persisted once at the end.
+        """
+        results: dict[str, str] = {}
+        to_fetch: dict[str, str] = {}  # normalized -> the input it came from
+        for raw_id in raw_ids:
+            try:
+                normalized = self.normalize_habbo_id(raw_id)
+            except ValueError:
+                results[raw_id] = "invalid ID"
+                continue
+            if normalized in self.tracked_ids:
+                results[raw_id] = "already tracked"
+            elif normalized in to_fetch:
+                results[raw_id] = "duplicate"
+            else:
+                to_fetch[normalized] = raw_id
+        semaphore = asyncio.Semaphore(self.scan_concurrency())
+
+        async def lookup(habbo_id: str):
+            async with semaphore:
+                return await self.fetch_profile_result(habbo_id)
+
+        fetched = await asyncio.gather(*(lookup(habbo_id) for habbo_id in to_fetch))
+        for (habbo_id, raw_id), (status, profile) in zip(to_fetch.items(), fetched):
+            if profile is not None:
+                self.start_tracking(habbo_id, profile)
+                results[raw_id] = f"added ({profile.get('name') or 'Unknown'})"
+            elif status == 429:
+                results[raw_id] = "rate limited, try again later"
+            elif status in (403, 404):
+                results[raw_id] = "no public profile"
+            else:
+                results[raw_id] = "lookup failed"
+        if any(outcome.startswith("added") for outcome in results.values()):
+            await self.save_state(include_changes=False)
+        return {raw_id: results[raw_id] for raw_id in raw_ids}
+
+    async def remove_many(self, raw_ids: list[str]) -> dict[str, str]:
+        results = {}
+        for raw_id in raw_ids:
+            try:
+                normalized = self.normalize_habbo_id(raw_id)
+            except ValueError:
+                results[raw_id] = "invalid ID"
+                continue
+            results[raw_id] = "removed" if self.stop_tracking(normalized) else "not tracked"
+        if "removed" in results.values():
+            await self.save_state(include_changes=False)
+        return results
+
+    @staticmethod
+    def format_bulk_summary(results: dict[str, str]) -> str:
+        counts: dict[str, int] = {}
+        for outcome in results.values():
+            key = outcome.split(" (", 1)[0]
+            counts[key] = counts.get(key, 0) + 1
+        header = f"Checked {len(results)} ID(s): " + ", ".join(f"{count} {outcome}" for outcome, count in counts.items())
+        lines = [f"• `{raw_id}` — {outcome}" for raw_id, outcome in list(results.items())[:BULK_SUMMARY_LINES]]
+        if len(results) > BULK_SUMMARY_LINES:
+            lines.append(f"… and {len(results) - BULK_SUMMARY_LINES} more")
+        return (header + "\n" + "\n".join(lines))[:2000]
+
+    @tasks.loop(seconds=POLL_TICK_SECONDS)
     async def profile_check(self):
+        if self._scan_lock.locked():
+            # A long scan (or a manual check) is still running; catch up next tick.
+            return
         await self.scan_profiles()
 
     @profile_check.before_loop
@@ -232,10 +882,8 @@ class HabboIdTracker(commands.Cog):
         if profile is None:
             await ctx.send("I could not find a public Habbo profile with that ID.", ephemeral=True)
             return
-        self.tracked_ids[normalized] = {"name": profile.get("name"), "added_at": datetime.now(timezone.utc).isoformat()}
-        self.snapshots[normalized] = self.profile_snapshot(profile)
-        self._save_json(self.ids_file, self.tracked_ids)
-        self._save_json(self.snapshots_file, self.snapshots)
+        self.start_tracking(normalized, profile)
+        await self.save_state(include_changes=False)
         await ctx.send(f"Now tracking **{profile.get('name', 'Unknown')}** (`{normalized}`).", ephemeral=True)
 
     @commands.hybrid_command(name="habboidremove", description="Stop tracking a Habbo unique ID.")
@@ -247,22 +895,108 @@ class HabboIdTracker(commands.Cog):
         except ValueError as exc:
             await ctx.send(str(exc), ephemeral=True)
             return
-        if self.tracked_ids.pop(normalized, None) is None:
+        if not self.stop_tracking(normalized):
             await ctx.send(f"`{normalized}` is not tracked.", ephemeral=True)
             return
-        self.snapshots.pop(normalized, None)
-        self._save_json(self.ids_file, self.tracked_ids)
-        self._save_json(self.snapshots_file, self.snapshots)
+        await self.save_state(include_changes=False)
         await ctx.send(f"Stopped tracking `{normalized}`.", ephemeral=True)
 
-    @commands.hybrid_command(name="habboidlist", description="List every tracked Habbo unique ID.")
-    async def list_habbo_ids(self, ctx: commands.Context):
-        """List IDs with the latest known name."""
+    @commands.hybrid_command(name="habboidaddmany", description="Start tracking many Habbo unique IDs at once.")
+    @commands.is_owner()
+    async def add_habbo_ids(self, ctx: commands.Context, attachment: discord.Attachment | None = None, *, habbo_ids: str = ""):
+        """Add IDs typed as a list or uploaded as a text file, one result line per ID."""
+        # Downloading an attachment can outlast Discord's interaction deadline.
+        await ctx.defer(ephemeral=True)
+        try:
+            items = await self.collect_bulk_ids(ctx, habbo_ids, attachment)
+        except ValueError as exc:
+            await ctx.send(str(exc), ephemeral=True)
+            return
+        results = await self.add_many(items)
+        await ctx.send(self.format_bulk_summary(results), ephemeral=True)
+
+    @commands.hybrid_command(name="habboidremovemany", description="Stop tracking many Habbo unique IDs at once.")
+    @commands.is_owner()
+    async def remove_habbo_ids(self, ctx: commands.Context, attachment: discord.Attachment | None = None, *, habbo_ids: str = ""):
+        """Remove IDs typed as a list or uploaded as a text file; change logs are kept."""
+        await ctx.defer(ephemeral=True)
+        try:
+            items = await self.collect_bulk_ids(ctx, habbo_ids, attachment)
+        except ValueError as exc:
+            await ctx.send(str(exc), ephemeral=True)
+            return
+        results = await self.remove_many(items)
+        await ctx.send(self.format_bulk_summary(results), ephemeral=True)
+
+    def render_id_page(self, order: str, prefix: str, page: int) -> tuple[discord.Embed, IdPage]:
+        """Build one /habboidlist page; only that page's entries are read."""
+        shown = self.id_index.page(order, prefix, page, LIST_PAGE_SIZE)
+        lines = [
+            f"• **{self.tracked_ids.get(habbo_id, {}).get('name') or 'Unknown'}** — `{habbo_id}`"
+            for habbo_id in shown.habbo_ids
+        ]
+        title = "Tracked Habbo IDs" + (f" starting with “{prefix}”" if prefix else "")
+        embed = discord.Embed(title=title, description="\n".join(lines) or "No matches.", colour=discord.Colour.blurple())
+        embed.set_footer(text=f"Page {shown.page + 1}/{shown.pages} · {shown.total} ID(s) · sorted by {order}")
+        return embed, shown
+
+    @commands.hybrid_command(name="habboidlist", description="List tracked Habbo unique IDs.")
+    async def list_habbo_ids(self, ctx: commands.Context, sort: Literal["name", "id"] = "name", prefix: str | None = None):
+        """List IDs a page at a time; ``prefix`` matches the start of the sort key (name or ID)."""
         if not self.tracked_ids:
             await ctx.send("No Habbo IDs are currently tracked.", ephemeral=True)
             return
-        lines = [f"• **{item.get('name') or 'Unknown'}** — `{habbo_id}`" for habbo_id, item in self.tracked_ids.items()]
-        await ctx.send("\n".join(lines)[:2000], ephemeral=True)
+        embed, shown = self.render_id_page(sort, prefix or "", 0)
+        if not shown.total:
+            await ctx.send(f"No tracked Habbo IDs have a {sort} starting with `{prefix}`.", ephemeral=True)
+            return
+        view = TrackedIdListView(self, ctx.author.id, sort, prefix or "") if shown.pages > 1 else None
+        await ctx.send(embed=embed, view=view, ephemeral=True)
+
+    @commands.hybrid_command(name="habboidhistory", description="Show recorded profile changes for a Habbo unique ID.")
+    async def habbo_id_history(self, ctx: commands.Context, habbo_id: str, field: str | None = None, since: str | None = None):
+        """Page through the change log for one ID, optionally one field and/or a start time."""
+        try:
+            normalized = self.normalize_habbo_id(habbo_id)
+            change_index = self.change_index
+            field_key = self.resolve_field(field, change_index.fields(normalized)) if field else None
+            since_at = self.parse_since(since) if since else None
+        except ValueError as exc:
+            await ctx.send(str(exc), ephemeral=True)
+            return
+        total = change_index.count(normalized, field_key, since_at)
+        if not total:
+            await ctx.send(f"No recorded changes for `{normalized}` match that query.", ephemeral=True)
+            return
+        shown = min(total, HISTORY_PAGE_SIZE * HISTORY_MAX_PAGES)
+        pages = -(-shown // HISTORY_PAGE_SIZE)
+        # Read only the entries that will be shown, one page at a time.
+        matches = change_index.query(normalized, field_key, since_at)
+        for page in range(1, pages + 1):
+            entries = list(islice(matches, HISTORY_PAGE_SIZE))
+            embed = self.build_history_embed(normalized, entries, field_key, page, pages, total)
+            await ctx.send(embed=embed, ephemeral=True)
+        if total > shown:
+            await ctx.send(
+                f"Showing the newest {shown} of {total} changes; narrow the query with `field` or `since` to see older ones.",
+                ephemeral=True,
+            )
+
+    @commands.hybrid_command(name="habboidtrend", description="Show how a Habbo ID's experience, level and gems changed.")
+    async def habbo_id_trend(self, ctx: commands.Context, habbo_id: str, window: str = DEFAULT_TREND_WINDOW):
+        """Report deltas and per-day rates for the numeric profile fields over ``window``."""
+        try:
+            normalized = self.normalize_habbo_id(habbo_id)
+            since_at = self.parse_since(window)
+        except ValueError as exc:
+            await ctx.send(str(exc), ephemeral=True)
+            return
+        # Only the rows inside the window are read from the series file.
+        trends = await asyncio.to_thread(self.series.trend, normalized, since_at)
+        if not trends:
+            await ctx.send(f"No numeric history for `{normalized}` in that window yet.", ephemeral=True)
+            return
+        await ctx.send(embed=self.build_trend_embed(normalized, window, trends), ephemeral=True)
 
     @commands.hybrid_command(name="habboidchannel", description="Set the channel for Habbo ID change alerts.")
     @commands.is_owner()
@@ -278,8 +1012,56 @@ class HabboIdTracker(commands.Cog):
     async def check_habbo_ids(self, ctx: commands.Context):
         """Allow operators to run the same scan used by the background task."""
         await ctx.defer(ephemeral=True)
-        count = await self.scan_profiles()
-        await ctx.send(f"Check complete; posted {count} change notification(s).", ephemeral=True)
+        # An operator-requested check polls every tier with fresh profiles.
+        count = await self.scan_profiles(due_only=False, max_age=0.0)
+        await ctx.send(f"Check complete; queued change alerts for {count} profile(s).", ephemeral=True)
+
+
+class ScanAlertTarget:
+    """Send through the alert channel, mentioning the operator once per flushed scan."""
+
+    def __init__(self, tracker: HabboIdTracker, channel):
+        self.tracker = tracker
+        self.channel = channel
+
+    async def send(self, **kwargs):
+        mention_id = self.tracker._mention_due
+        if mention_id:
+            kwargs["content"] = f"<@{mention_id}>"
+            kwargs["allowed_mentions"] = discord.AllowedMentions(users=True, roles=False, everyone=False)
+        result = await self.channel.send(**kwargs)
+        if mention_id and self.tracker._mention_due == mention_id:
+            self.tracker._mention_due = None
+        return result
+
+
+class TrackedIdListView(discord.ui.View):
+    """Previous/next buttons for /habboidlist; only the invoking user can page."""
+
+    def __init__(self, tracker: HabboIdTracker, user_id: int, order: str, prefix: str):
+        super().__init__(timeout=LIST_VIEW_TIMEOUT_SECONDS)
+        self.tracker = tracker
+        self.user_id = user_id
+        self.order = order
+        self.prefix = prefix
+        self.page = 0
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        return interaction.user.id == self.user_id
+
+    async def show(self, interaction: discord.Interaction, page: int):
+        # Re-rendered from the index, so IDs added or removed meanwhile show up.
+        embed, shown = self.tracker.render_id_page(self.order, self.prefix, page)
+        self.page = shown.page
+        await interaction.response.edit_message(embed=embed, view=self)
+
+    @discord.ui.button(label="Previous", style=discord.ButtonStyle.secondary)
+    async def previous_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self.show(interaction, self.page - 1)
+
+    @discord.ui.button(label="Next", style=discord.ButtonStyle.secondary)
+    async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self.show(interaction, self.page + 1)
 
 
 async def setup(bot: commands.Bot):
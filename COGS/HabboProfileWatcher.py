@@ -1,15 +1,42 @@
-import aiohttp
 import asyncio
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+import hashlib
 import os
 import json
 import logging
+import re
 import time
 from pathlib import Path
+from typing import Literal, NamedTuple, Optional
 import discord
 from discord import app_commands
 from discord.ext import commands, tasks
 
+from COGS._habbo_api import (
+    DEFAULT_HOTEL,
+    HOTELS,
+    PRIORITY_BACKGROUND,
+    PRIORITY_INTERACTIVE,
+    hotel_base_url,
+    hotel_from_identifier,
+    normalize_hotel,
+)
+from COGS._habbo_delivery import PRIORITY_HIGH, PRIORITY_LOW, PRIORITY_NORMAL, DestinationCache, NotificationOutbox
+from COGS._habbo_milestones import MilestoneBatch
+from COGS._habbo_names import NamePrefixIndex
+from COGS._habbo_observations import ProfileObservation, ProfileObservationBus
+from COGS._habbo_policies import Policy, load_policies
+from COGS._habbo_tenants import (
+    TENANT_MAX_GROUPS,
+    TENANT_MAX_MEMBERS,
+    TenantAlertLog,
+    WatchedGroup,
+    WatchTenant,
+    cap_tenant_roster,
+    dump_tenants,
+    parse_tenants,
+)
+
 NOTIFY_USER_ID = 298121351871594497  # DM recipient
 
 # Optional Discord channel destinations for policy-specific watcher alerts.
@@ -21,60 +48,219 @@ OOA_ALERT_CHANNEL_ID = os.getenv("HABBO_OOA_ALERT_CHANNEL_ID", "").strip()
 MOD_GROUP_ID = "g-hhus-eb463e25366b3796072507bc69cbfee4"
 OOA_GROUP_ID = "g-hhus-1685c3902d4ce5c8a4fcefa160fedaa2"
 
+
+# Used until JSON/habbo_watched_groups.json lists groups. OOA members can also
+# be MOD members, and OOA's higher precedence keeps its stricter policy.
+DEFAULT_WATCHED_GROUPS = (
+    WatchedGroup(MOD_GROUP_ID, "MOD", 10),
+    WatchedGroup(OOA_GROUP_ID, "OOA", 20),
+)
+# Roster refreshes probe page one of each group and reuse the cached roster when
+# it is unchanged, so only groups that changed pay for a full paged fetch. The
+# cache is fully refreshed after this age in case a change sits past page one.
+GROUP_ROSTER_MAX_AGE_SECONDS = 30 * 60
+GROUP_MEMBERS_PAGE_SIZE = 100
+
 LOGGER = logging.getLogger(__name__)
 
-# Send at most one request per second. Combined with the five-minute watcher
-# cycle below, this substantially reduces routine traffic while still detecting
-# status changes promptly enough for the shortest (16-hour) policy milestone.
-API_REQUEST_INTERVAL_SECONDS = 1.0
+# Requests are paced per hotel by REQUEST_INTERVAL_SECONDS in
+# COGS/_habbo_api.py, a budget shared with HabboIdTracker through the bot's
+# observation bus. Combined with that pacing, the five-minute watcher cycle
+# keeps routine traffic low while still detecting status changes promptly
+# enough for the shortest (16-hour) policy milestone. Hotels have independent
+# budgets and sweep in parallel.
 PERIODIC_CHECK_INTERVAL_MINUTES = 5
+# The sweep reuses a profile another cog fetched this recently (see
+# COGS/_habbo_observations.py) instead of requesting the same person again.
+SHARED_OBSERVATION_MAX_AGE_SECONDS = PERIODIC_CHECK_INTERVAL_MINUTES * 60 / 2
 PROFILE_RETRY_DELAYS_SECONDS = (1.0, 3.0)
+# /check with several usernames replies with one message, and a message holds
+# at most ten embeds. Lookups run at interactive limiter priority and reuse
+# profiles observed this recently; the reply is edited at most this often.
+MULTI_CHECK_LIMIT = 10
+MULTI_CHECK_MAX_AGE_SECONDS = 60
+MULTI_CHECK_EDIT_INTERVAL_SECONDS = 1.0
 # A single failed request is common during brief Habbo API interruptions. Only
 # notify the owner after the same profile has failed across three full scans.
 PROFILE_FAILURE_ALERT_THRESHOLD = 3
-
-# Notification milestones by policy.
-# Tuple shape: (trigger_days_offline, embed_title, alert_key)
-MOD_MILESTONES = (
-    (2.0, "Offline Notice (2 Days)", "offline_mod_2d"),
-    (2 + 23 / 24, "Offline Warning (2 Days 23 Hours)", "offline_mod_2d_23h"),
-    (3.0, "Offline Warning (3 Days)", "offline_mod_3d"),
-)
-OOA_MILESTONES = (
-    (16 / 24, "Approaching 16 Hours", "offline_ooa_16h"),
-    (23 / 24, "OOA Offline Warning (23 Hours)", "offline_ooa_23h"),
-    (1.0, "OOA Offline Warning (24 Hours)", "offline_ooa_24h"),
-)
-
-POLICIES = {
-    "MOD": {"allowed_days": 3.0, "milestones": MOD_MILESTONES},
-    "OOA": {"allowed_days": 1.0, "milestones": OOA_MILESTONES},
+# Sweep progress is checkpointed every N members (and on unload) so a reload or
+# restart resumes the interrupted sweep instead of re-fetching every roster and
+# profile from the beginning. A checkpointed roster older than two cycles is
+# considered stale and triggers a fresh roster fetch instead.
+SWEEP_CHECKPOINT_EVERY_MEMBERS = 25
+SWEEP_RESUME_MAX_AGE_SECONDS = PERIODIC_CHECK_INTERVAL_MINUTES * 60 * 2
+# Hot reloads hand the outgoing instance's in-memory state to the incoming one
+# through this bot attribute. A handoff older than the limit below is ignored,
+# because baselines that old no longer describe what Habbo currently shows.
+STATE_HANDOFF_ATTRIBUTE = "habbo_state_handoff"
+STATE_HANDOFF_KEY = "HabboWatch"
+STATE_HANDOFF_MAX_AGE_SECONDS = 15 * 60
+# Between sweeps, milestone crossings are re-evaluated for the whole roster from
+# in-memory state at this interval (see COGS/_habbo_milestones.py), so an alert
+# fires within seconds of its threshold instead of at the member's next check.
+MILESTONE_TICK_SECONDS = 10
+
+# Watcher storage lives in the bot root's JSON directory (..../UNBOT/JSON) even
+# though this cog lives in COGS/.
+JSON_DIR = Path(__file__).resolve().parent.parent / "JSON"
+
+# Policies and their notification milestones are data: JSON/habbo_policies.json
+# overrides the built-in MOD/OOA tables (see COGS/_habbo_policies.py). They are
+# compiled on load, so editing the file and reloading the cog (or running
+# habbopolicies) changes thresholds without a code change.
+POLICY_CONFIG_FILE = JSON_DIR / "habbo_policies.json"
+POLICIES: dict[str, Policy] = load_policies(POLICY_CONFIG_FILE)
+
+# /check without a username posts a compact roster digest. Members checked by
+# the periodic sweep within this window are rendered from memory instead of
+# being fetched again; digest embeds stay small enough to pack three a message.
+DIGEST_STATE_MAX_AGE_SECONDS = PERIODIC_CHECK_INTERVAL_MINUTES * 60 * 2
+DIGEST_PAGE_CHARACTERS = 1900
+DIGEST_SEVERITY_ORDER = ("warning", "notice", "unavailable", "offline", "online")
+DIGEST_SEVERITY_LABELS = {
+    "warning": "Warnings",
+    "notice": "Notices",
+    "unavailable": "Unavailable",
+    "offline": "Offline",
+    "online": "Online",
 }
+# Status boards are persistent per-policy messages edited in place after each
+# sweep. Each board message carries a few digest-sized embeds, and a message is
+# only edited when its rendered content hash changes. Relative <t:..:R> stamps
+# keep durations current client-side without edits; writes are capped per cycle
+# so a large roster catches up over a few sweeps instead of bursting.
+STATUS_BOARD_EMBEDS_PER_MESSAGE = 3
+STATUS_BOARD_MAX_WRITES_PER_CYCLE = 3
+# Profile fields kept in memory so digests/status output can be rendered
+# without another Habbo request.
+PROFILE_CACHE_FIELDS = ("name", "uniqueId", "figureString", "profileVisible", "online")
+
+# "bot" posts with the bot account; "webhook" posts through a channel webhook,
+# which has its own rate bucket instead of sharing the bot's.
+ALERT_DELIVERY_MODES = ("bot", "webhook")
+
+# Outbox priority by alert severity. Warnings drain first when Discord throttles
+# an alert channel; anything without a severity ("Back Online", forced /check
+# embeds and fallbacks) is routine and waits behind them.
+SEVERITY_PRIORITIES = {"warning": PRIORITY_HIGH, "notice": PRIORITY_NORMAL}
+PROFILE_HIDDEN_SEVERITY = "warning"
+
+class MemberStatus(NamedTuple):
+    """Outcome of evaluating one profile against its policy, without rendering."""
+
+    name: str
+    online: bool
+    profile_visible: bool
+    title: str
+    alert_key: str | None
+
 
 class HabboWatch(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.session = aiohttp.ClientSession()
+        # Profiles are fetched through the bot-wide observation bus, which owns
+        # one pooled session and rate limiter per hotel for every Habbo cog.
+        self.observations = ProfileObservationBus.for_bot(bot)
+        self.api = self.observations.api
+        self._unsubscribe_observations = self.observations.subscribe(self.on_profile_observed)
         self._state: dict[str, dict] = {}
         self._profile_failure_streaks: dict[str, int] = {}
-        self._api_request_lock = asyncio.Lock()
-        self._next_api_request_at = 0.0
         self.profile_retry_delays = PROFILE_RETRY_DELAYS_SECONDS
-        # Resolve JSON storage from the bot root (..../UNBOT/JSON) even though this cog lives in COGS/.
-        bot_root = Path(__file__).resolve().parent.parent
-        self.last_online_file = bot_root / "JSON" / "habbo_last_online.json"
-        self.logoff_file = bot_root / "JSON" / "habbo_logoff_times.json"
-        self.offline_records_file = bot_root / "JSON" / "habbo_offline_records.json"
-        self.alert_channels_file = bot_root / "JSON" / "habbo_alert_channels.json"
+        # Alerts are queued here and sent by background workers so sweeps never
+        # wait on Discord; see notify_user.
+        self.outbox = NotificationOutbox(self.resolve_alert_destination, invalidate=self.invalidate_alert_destination)
+        self.last_online_file = JSON_DIR / "habbo_last_online.json"
+        self.logoff_file = JSON_DIR / "habbo_logoff_times.json"
+        self.offline_records_file = JSON_DIR / "habbo_offline_records.json"
+        self.alert_channels_file = JSON_DIR / "habbo_alert_channels.json"
+        self.checkpoint_file = JSON_DIR / "habbo_watch_checkpoint.json"
+        self.status_board_file = JSON_DIR / "habbo_status_board.json"
+        self.watched_groups_file = JSON_DIR / "habbo_watched_groups.json"
+        self.tenants_file = JSON_DIR / "habbo_watch_tenants.json"
+        self.tenant_alerts_file = JSON_DIR / "habbo_watch_tenant_alerts.json"
         self.last_online_times = self.load_last_online_times()
         self.logoff_times = self.load_logoff_times()
         self.offline_records = self.load_offline_records()
+        # Known usernames for slash-command autocomplete; the roster source is
+        # refreshed with every sweep's roster in begin_sweep.
+        self.name_index = NamePrefixIndex()
+        self.name_index.update_source("records", (record["display_name"] for record in self.offline_records.values()))
         self.alert_channel_ids = self.load_alert_channel_ids()
+        self.alert_delivery_modes = self.load_alert_delivery_modes()
+        self.status_boards = self.load_status_boards()
+        self.watched_groups = self.load_watched_groups()
+        # Other guilds' watcher configurations; see COGS/_habbo_tenants.py.
+        self.tenants = self.load_tenants()
+        self.tenant_alerts = self.load_tenant_alerts()
+        self._tenant_rosters: dict[int, dict[str, tuple[str, str]]] = {}
+        self._group_roster_cache: dict[str, dict] = {}
+        self._status_board_roster: dict[str, tuple[str, str]] | None = None
+        self._last_checked: dict[str, float] = {}
+        self._sweep: dict | None = None
+        self._last_error_notifications: dict[str, datetime] = {}
+        self.apply_sweep_checkpoint(self.load_sweep_checkpoint())
+        # A reload hands over the previous instance's live state, which is newer
+        # than the checkpoint and keeps was_online baselines for transitions.
+        self.adopt_warm_state()
+        self.rebuild_milestone_batch()
         self.periodic_check.start()
+        self.milestone_tick.start()
 
     async def cog_unload(self):
         self.periodic_check.cancel()
-        await self.session.close()
+        self.milestone_tick.cancel()
+        # Cancellation lands at the sweep's next await, so the in-memory cursor
+        # is consistent here and the next instance can pick up where we stopped.
+        self.save_sweep_checkpoint()
+        self.export_warm_state()
+        await self.outbox.close()
+        # The bus belongs to the bot and outlives this instance; its sessions
+        # are closed once the last Habbo cog has unsubscribed.
+        self._unsubscribe_observations()
+        await self.observations.close_when_unused()
+
+    def export_warm_state(self):
+        """Publish in-memory watcher state for the instance created by a reload.
+
+        JSON only stores what is needed after a full restart. The live state also
+        holds ``was_online`` baselines, failure streaks and error throttling, and
+        rebuilding those from disk would cost a sweep of missed transitions.
+        """
+        registry = getattr(self.bot, STATE_HANDOFF_ATTRIBUTE, None)
+        if not isinstance(registry, dict):
+            registry = {}
+            setattr(self.bot, STATE_HANDOFF_ATTRIBUTE, registry)
+        registry[STATE_HANDOFF_KEY] = {
+            "exported_at": time.monotonic(),
+            "state": self._state,
+            "profile_failure_streaks": self._profile_failure_streaks,
+            "last_error_notifications": self._last_error_notifications,
+            "last_checked": self._last_checked,
+            "sweep": self._sweep,
+            "api_cooldowns": self.api.cooldowns(),
+        }
+
+    def adopt_warm_state(self) -> bool:
+        """Take over state exported by the previous instance; return whether it was used."""
+        registry = getattr(self.bot, STATE_HANDOFF_ATTRIBUTE, None)
+        if not isinstance(registry, dict):
+            return False
+        # Pop so a later, unrelated load cannot adopt the same state twice.
+        payload = registry.pop(STATE_HANDOFF_KEY, None)
+        if payload is None:
+            return False
+        if time.monotonic() - payload["exported_at"] > STATE_HANDOFF_MAX_AGE_SECONDS:
+            return False
+
+        # export_warm_state writes every field; a missing one is a bug, not a fresh start.
+        self._state = payload["state"]
+        self._profile_failure_streaks = payload["profile_failure_streaks"]
+        self._last_error_notifications = payload["last_error_notifications"]
+        self._last_checked = payload["last_checked"]
+        self._sweep = payload["sweep"]
+        # Keep honouring any Retry-After pause the previous instance was given.
+        self.api.restore_cooldowns(payload["api_cooldowns"])
+        return True
 
     @staticmethod
     def ensure_json_file(file_path: Path):
@@ -184,10 +370,10 @@ class HabboWatch(commands.Cog):
             pass
 
     def load_alert_channel_ids(self) -> dict[str, list[int]]:
-        defaults = {
-            "MOD": self.parse_discord_ids(MOD_ALERT_CHANNEL_ID),
-            "OOA": self.parse_discord_ids(OOA_ALERT_CHANNEL_ID),
-        }
+        defaults = {policy_name: list(policy.channels) for policy_name, policy in POLICIES.items()}
+        for policy_name, env_channel_ids in (("MOD", MOD_ALERT_CHANNEL_ID), ("OOA", OOA_ALERT_CHANNEL_ID)):
+            if policy_name in defaults and self.parse_discord_ids(env_channel_ids):
+                defaults[policy_name] = self.parse_discord_ids(env_channel_ids)
         try:
             self.ensure_json_file(self.alert_channels_file)
             data = json.loads(self.alert_channels_file.read_text(encoding="utf-8"))
@@ -200,6 +386,26 @@ class HabboWatch(commands.Cog):
             pass
         return defaults
 
+    def load_alert_delivery_modes(self) -> dict[str, str]:
+        """Load per-policy delivery modes from the ``delivery`` key of the channel JSON.
+
+        Example: ``{"mod": [123], "delivery": {"mod": "webhook"}}``. Policies
+        without an entry keep the default bot-account delivery.
+        """
+        try:
+            self.ensure_json_file(self.alert_channels_file)
+            data = json.loads(self.alert_channels_file.read_text(encoding="utf-8"))
+            delivery = data.get("delivery") if isinstance(data, dict) else None
+            if isinstance(delivery, dict):
+                return {
+                    str(policy_name).upper(): str(mode).lower()
+                    for policy_name, mode in delivery.items()
+                    if str(mode).lower() in ALERT_DELIVERY_MODES
+                }
+        except Exception:
+            pass
+        return {}
+
     def save_alert_channel_ids(self):
         """Persist the channel routing changed by setmod/setooa text commands."""
         try:
@@ -209,10 +415,285 @@ class HabboWatch(commands.Cog):
                 for policy_name, channel_ids in self.alert_channel_ids.items()
                 if channel_ids
             }
+            delivery_modes = {
+                policy_name.lower(): mode
+                for policy_name, mode in self.alert_delivery_modes.items()
+                if mode != "bot"
+            }
+            if delivery_modes:
+                payload["delivery"] = delivery_modes
             self.alert_channels_file.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
         except Exception:
             pass
 
+    def load_status_boards(self) -> dict[str, dict]:
+        """Load status board locations: ``{"MOD": {"channel_id", "message_ids", "hashes"}}``."""
+        boards: dict[str, dict] = {}
+        try:
+            self.ensure_json_file(self.status_board_file)
+            data = json.loads(self.status_board_file.read_text(encoding="utf-8"))
+            if isinstance(data, dict):
+                for policy_name, board in data.items():
+                    policy_name = str(policy_name).upper()
+                    channel_id = self.parse_discord_id(board.get("channel_id")) if isinstance(board, dict) else None
+                    if policy_name not in POLICIES or channel_id is None:
+                        continue
+                    message_ids = [self.parse_discord_id(message_id) for message_id in board.get("message_ids") or []]
+                    hashes = [str(value) for value in board.get("hashes") or []]
+                    hashes += [""] * (len(message_ids) - len(hashes))
+                    boards[policy_name] = {
+                        "channel_id": channel_id,
+                        "message_ids": message_ids,
+                        "hashes": hashes[:len(message_ids)],
+                    }
+        except Exception:
+            pass
+        return boards
+
+    def save_status_boards(self):
+        """Persist status board message IDs and content hashes."""
+        try:
+            self.ensure_json_file(self.status_board_file)
+            payload = json.dumps(self.status_boards, indent=2, sort_keys=True)
+            self.status_board_file.write_text(payload, encoding="utf-8")
+        except Exception:
+            pass
+
+    def load_watched_groups(self) -> list[WatchedGroup]:
+        """Load watched groups: ``{"groups": [{"group_id", "policy", "precedence"}]}``.
+
+        Groups naming an unknown policy are skipped. An empty or missing list
+        keeps the built-in MOD/OOA groups.
+        """
+        groups: list[WatchedGroup] = []
+        try:
+            self.ensure_json_file(self.watched_groups_file)
+            data = json.loads(self.watched_groups_file.read_text(encoding="utf-8"))
+            entries = data.get("groups") if isinstance(data, dict) else None
+            for entry in entries or []:
+                if not isinstance(entry, dict) or not entry.get("group_id"):
+                    continue
+                policy_name = str(entry.get("policy", "")).strip().upper()
+                if policy_name not in POLICIES:
+                    LOGGER.warning("Skipping watched group %s with unknown policy %r", entry.get("group_id"), policy_name)
+                    continue
+                groups.append(WatchedGroup(str(entry["group_id"]).strip(), policy_name, int(entry.get("precedence", 0))))
+        except Exception:
+            pass
+        return groups or list(DEFAULT_WATCHED_GROUPS)
+
+    def save_watched_groups(self):
+        """Persist the watched group list changed by the habbogroups text command."""
+        try:
+            self.ensure_json_file(self.watched_groups_file)
+            payload = {"groups": [group._asdict() for group in self.watched_groups]}
+            self.watched_groups_file.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        except Exception:
+            pass
+
+    def load_tenants(self) -> dict[int, WatchTenant]:
+        """Load per-guild tenant configurations keyed by guild ID."""
+        try:
+            self.ensure_json_file(self.tenants_file)
+            return parse_tenants(json.loads(self.tenants_file.read_text(encoding="utf-8")), POLICIES)
+        except Exception:
+            pass
+        return {}
+
+    def save_tenants(self):
+        """Persist tenant configurations changed by the habbowatch text command."""
+        try:
+            self.ensure_json_file(self.tenants_file)
+            payload = json.dumps(dump_tenants(self.tenants), indent=2, sort_keys=True)
+            self.tenants_file.write_text(payload, encoding="utf-8")
+        except Exception:
+            pass
+
+    def load_tenant_alerts(self) -> TenantAlertLog:
+        """Load per-tenant alert dedupe so restarts do not repeat tenant alerts."""
+        try:
+            self.ensure_json_file(self.tenant_alerts_file)
+            data = json.loads(self.tenant_alerts_file.read_text(encoding="utf-8"))
+            if isinstance(data, dict):
+                return TenantAlertLog(data)
+        except Exception:
+            pass
+        return TenantAlertLog()
+
+    def save_tenant_alerts(self):
+        try:
+            self.ensure_json_file(self.tenant_alerts_file)
+            payload = json.dumps(self.tenant_alerts.to_json(), separators=(",", ":"), sort_keys=True)
+            self.tenant_alerts_file.write_text(payload, encoding="utf-8")
+        except Exception:
+            pass
+
+    def load_sweep_checkpoint(self) -> dict:
+        """Load the sweep checkpoint written by a previous cog instance, if any."""
+        try:
+            self.ensure_json_file(self.checkpoint_file)
+            data = json.loads(self.checkpoint_file.read_text(encoding="utf-8"))
+            if isinstance(data, dict):
+                return data
+        except Exception:
+            pass
+        return {}
+
+    def build_sweep_checkpoint(self) -> dict:
+        """Return the compact sweep cursor, roster and pacing state to persist.
+
+        Monotonic clock values do not survive a process restart, so each hotel's
+        pending Habbo cooldown is stored as a wall-clock deadline and converted
+        back on load. That keeps a restart from jumping ahead of a ``Retry-After``.
+        """
+        now_epoch = time.time()
+        sweep = self._sweep
+        return {
+            "saved_at": now_epoch,
+            "hotel_cooldowns": {hotel: now_epoch + remaining for hotel, remaining in self.api.cooldowns().items()},
+            "last_checked": dict(self._last_checked),
+            "sweep": {
+                "started_at": sweep["started_at"],
+                "roster": {username_lc: list(entry) for username_lc, entry in sweep["roster"].items()},
+                "completed": sorted(sweep["completed"]),
+                "tenants": {
+                    str(guild_id): {username_lc: list(entry) for username_lc, entry in tenant_roster.items()}
+                    for guild_id, tenant_roster in (sweep.get("tenants") or {}).items()
+                },
+            } if sweep else None,
+        }
+
+    def apply_sweep_checkpoint(self, data: dict):
+        """Restore sweep progress and API pacing from a checkpoint payload."""
+        last_checked = data.get("last_checked") if isinstance(data, dict) else None
+        if isinstance(last_checked, dict):
+            self._last_checked = {
+                str(username_lc): float(checked_at)
+                for username_lc, checked_at in last_checked.items()
+                if isinstance(checked_at, (int, float))
+            }
+
+        hotel_cooldowns = data.get("hotel_cooldowns") if isinstance(data, dict) else None
+        if not isinstance(hotel_cooldowns, dict):
+            hotel_cooldowns = {}
+        # Checkpoints written before multi-hotel support held one .com deadline.
+        legacy_deadline = data.get("next_api_request_at") if isinstance(data, dict) else None
+        if isinstance(legacy_deadline, (int, float)):
+            hotel_cooldowns.setdefault(DEFAULT_HOTEL, legacy_deadline)
+        now_epoch = time.time()
+        self.api.restore_cooldowns(
+            {hotel: deadline - now_epoch for hotel, deadline in hotel_cooldowns.items() if isinstance(deadline, (int, float))}
+        )
+
+        sweep = data.get("sweep") if isinstance(data, dict) else None
+        if not isinstance(sweep, dict) or not isinstance(sweep.get("roster"), dict):
+            return
+        started_at = sweep.get("started_at")
+        if not isinstance(started_at, (int, float)) or time.time() - started_at > SWEEP_RESUME_MAX_AGE_SECONDS:
+            # A stale roster may no longer match the groups, so start over.
+            return
+        roster = {
+            str(username_lc): (str(entry[0]), str(entry[1]))
+            for username_lc, entry in sweep["roster"].items()
+            if isinstance(entry, list) and len(entry) == 2
+        }
+        tenants = {
+            int(guild_id): {
+                str(username_lc): (str(entry[0]), str(entry[1]))
+                for username_lc, entry in tenant_roster.items()
+                if isinstance(entry, list) and len(entry) == 2
+            }
+            for guild_id, tenant_roster in (sweep.get("tenants") or {}).items()
+            if str(guild_id).isdigit() and isinstance(tenant_roster, dict)
+        }
+        members = self.sweep_members(roster, tenants)
+        completed = sweep.get("completed") if isinstance(sweep.get("completed"), list) else []
+        self._sweep = {
+            "started_at": float(started_at),
+            "roster": roster,
+            "tenants": tenants,
+            "completed": {str(username_lc) for username_lc in completed if str(username_lc) in members},
+        }
+
+    def save_sweep_checkpoint(self):
+        """Persist sweep progress compactly; this runs several times per sweep."""
+        try:
+            self.ensure_json_file(self.checkpoint_file)
+            payload = json.dumps(self.build_sweep_checkpoint(), separators=(",", ":"))
+            self.checkpoint_file.write_text(payload, encoding="utf-8")
+        except Exception:
+            pass
+
+    async def begin_sweep(self) -> dict[str, tuple[str, str]]:
+        """Return the roster for this sweep, resuming an interrupted one when possible."""
+        sweep = self._sweep
+        if sweep and time.time() - sweep["started_at"] <= SWEEP_RESUME_MAX_AGE_SECONDS:
+            return sweep["roster"]
+
+        roster = await self.fetch_user_policy_map()
+        # fetch_user_policy_map loads every tenant's groups in the same pass.
+        tenants = self._tenant_rosters
+        self._sweep = {"started_at": time.time(), "roster": roster, "tenants": tenants, "completed": set()}
+        self.milestone_batch.retain(roster)
+        self.tenant_alerts.retain(tenants)
+        # Forget check times for members who have left every watched group.
+        members = self.sweep_members(roster, tenants)
+        self.name_index.update_source("roster", (username for username, _policy_name in members.values()))
+        last_checked = self._last_checked
+        self._last_checked = {username_lc: checked_at for username_lc, checked_at in last_checked.items() if username_lc in members}
+        return roster
+
+    def current_tenant_rosters(self) -> dict[int, dict[str, tuple[str, str]]]:
+        """Return each tenant's roster for the sweep in progress."""
+        sweep = self._sweep
+        return (sweep or {}).get("tenants") or {}
+
+    @staticmethod
+    def sweep_members(
+        roster: dict[str, tuple[str, str]],
+        tenant_rosters: dict[int, dict[str, tuple[str, str]]],
+    ) -> dict[str, tuple[str, str | None]]:
+        """Return the union of members to fetch, each exactly once per sweep.
+
+        Default-tenant members keep their policy; members only other tenants
+        watch get ``None`` so the sweep observes them without default alerts.
+        """
+        members: dict[str, tuple[str, str | None]] = dict(roster)
+        for tenant_roster in tenant_rosters.values():
+            for username_lc, (username, _policy_name) in tenant_roster.items():
+                members.setdefault(username_lc, (username, None))
+        return members
+
+    def sweep_order(self, roster: dict[str, tuple[str, str]]) -> list[str]:
+        """Return members still pending in this sweep, most overdue check first."""
+        completed = self._sweep["completed"] if self._sweep else set()
+        last_checked = self._last_checked
+        pending = [username_lc for username_lc in roster if username_lc not in completed]
+        # Never-checked members sort first; Python's sort is stable for ties.
+        return sorted(pending, key=lambda username_lc: last_checked.get(username_lc, 0.0))
+
+    def mark_sweep_member_checked(self, username_lc: str):
+        """Advance the sweep cursor and checkpoint periodically."""
+        self._last_checked[username_lc] = time.time()
+        sweep = self._sweep
+        if sweep is None:
+            return
+        sweep["completed"].add(username_lc)
+        if len(sweep["completed"]) % SWEEP_CHECKPOINT_EVERY_MEMBERS == 0:
+            self.save_sweep_checkpoint()
+
+    def finish_sweep(self):
+        """Close the current sweep so the next cycle fetches a fresh roster."""
+        self._sweep = None
+        self.save_sweep_checkpoint()
+
+    def username_choices(self, current: str) -> list[str]:
+        """Complete the last name of a comma/space separated list, keeping the names before it."""
+        head = current[: re.search(r"[^,\s]*$", current).start()]
+        completions = [head + name for name in self.name_index.complete(current[len(head):])]
+        # Discord rejects choice values longer than 100 characters.
+        return [completion for completion in completions if len(completion) <= 100]
+
     def get_or_create_offline_record(self, username_lc: str, display_name: str, policy_name: str) -> dict:
         """Return a stable JSON-backed record bucket for one Habbo user."""
         record = self.offline_records.setdefault(
@@ -228,6 +709,7 @@ class HabboWatch(commands.Cog):
         )
         record["display_name"] = display_name
         record["policy"] = policy_name
+        self.name_index.add("records", display_name)
         record.setdefault("history", [])
         record.setdefault("sent_alerts", [])
         return record
@@ -284,41 +766,46 @@ class HabboWatch(commands.Cog):
             }
         )
 
-    async def wait_for_api_request_slot(self):
-        """Pace all Habbo requests, including slash commands and retries."""
-        async with self._api_request_lock:
-            delay = self._next_api_request_at - time.monotonic()
-            if delay > 0:
-                await asyncio.sleep(delay)
-            self._next_api_request_at = time.monotonic() + API_REQUEST_INTERVAL_SECONDS
+    async def on_profile_observed(self, observation: ProfileObservation):
+        """Refresh the cached profile of a watched member another cog just fetched.
+
+        The online/offline state machine still runs at the member's sweep slot,
+        which picks this observation up from the bus instead of refetching.
+        """
+        profile = observation.profile
+        if not profile.get("name"):
+            return
+        st = self._state.get(self.member_key(str(profile["name"]), observation.hotel))
+        if st is not None:
+            self.remember_profile(st, profile)
+
+    @staticmethod
+    def member_key(username: str, hotel: str = DEFAULT_HOTEL) -> str:
+        """Return the state key for a watched member.
+
+        ``.com`` members keep their bare lowercase name so existing JSON records
+        stay valid; other hotels are prefixed (``de/alpha``) because the same
+        name on two hotels is two different people. ``/`` never appears in names.
+        """
+        username_lc = username.lower()
+        return username_lc if hotel == DEFAULT_HOTEL else f"{hotel}/{username_lc}"
+
+    @staticmethod
+    def member_hotel(username_lc: str) -> str:
+        """Return the hotel encoded in a member state key."""
+        hotel, separator, _name = username_lc.partition("/")
+        return hotel if separator and hotel in HOTELS else DEFAULT_HOTEL
+
+    @staticmethod
+    def group_hotel(group_id: str) -> str:
+        return hotel_from_identifier(group_id) or DEFAULT_HOTEL
 
     async def fetch_json(self, url: str, params: dict | None = None) -> dict | list | None:
-        try:
-            await self.wait_for_api_request_slot()
-            async with self.session.get(url, params=params, timeout=20) as resp:
-                if resp.status == 404:
-                    return None
-                if resp.status == 429:
-                    # Honor Habbo's server-provided cooldown before any later
-                    # roster lookup is allowed to use the shared request slot.
-                    try:
-                        retry_after = max(1.0, float(resp.headers.get("retry-after", "1")))
-                    except (TypeError, ValueError):
-                        retry_after = 1.0
-                    self._next_api_request_at = max(
-                        self._next_api_request_at,
-                        time.monotonic() + retry_after,
-                    )
-                    LOGGER.warning("Habbo API rate limited %s; pausing requests for %.1f seconds", url, retry_after)
-                    return None
-                resp.raise_for_status()
-                ct = resp.headers.get("content-type", "")
-                if "json" in ct:
-                    return await resp.json()
-                return None
-        except Exception as exc:
-            LOGGER.warning("Unable to fetch Habbo API JSON from %s with params %s: %s", url, params, exc)
-            return None
+        """GET a Habbo API URL under its hotel's rate budget; None on any failure."""
+        status, data = await self.api.get_json(url, params=params)
+        if status is not None and status >= 400 and status not in (404, 429):
+            LOGGER.warning("Habbo API returned HTTP %s for %s with params %s", status, url, params)
+        return data
 
     @staticmethod
     def extract_group_member_names(data: dict | list | None) -> list[str]:
@@ -366,18 +853,48 @@ class HabboWatch(commands.Cog):
 
         return names_found >= page_size
 
-    async def fetch_group_members(self, group_id: str) -> list[str]:
+    @classmethod
+    def group_page_fingerprint(cls, data: dict | list | None) -> str | None:
+        """Fingerprint a group-member page by its names and any total count metadata."""
+        if not data:
+            return None
+        total = None
+        if isinstance(data, dict):
+            total = data.get("total") or data.get("totalItems") or data.get("totalPages")
+        digest = hashlib.sha1(repr(total).encode("utf-8"))
+        for name in cls.extract_group_member_names(data):
+            digest.update(b"\x1f")
+            digest.update(name.encode("utf-8"))
+        return digest.hexdigest()
+
+    async def fetch_group_members(self, group_id: str, first_page: dict | list | None = None) -> list[str]:
         """Return a list of Habbo usernames in the given group.
 
-        This pulls members from the configured MOD/OOA groups only; a user's
+        This pulls members from the configured watched groups only; a user's
         total number of joined groups is not used when deciding whom to check.
+        ``first_page`` reuses an already-fetched page one (from a cache probe).
+        A complete result is cached for ``fetch_group_roster``; when a later
+        page fails, the previously cached roster is returned instead, so a
+        truncated list never makes members look like they left the group.
         """
         usernames: list[str] = []
         page = 1
-        page_size = 100
+        page_size = GROUP_MEMBERS_PAGE_SIZE
+        url = f"{hotel_base_url(self.group_hotel(group_id))}/api/public/groups/{group_id}/members"
+        fingerprint = None
         while True:
-            url = f"https://www.habbo.com/api/public/groups/{group_id}/members"
-            data = await self.fetch_json(url, params={"pageNumber": page, "pageSize": page_size})
+            if page == 1 and first_page is not None:
+                data = first_page
+            else:
+                data = await self.fetch_json(url, params={"pageNumber": page, "pageSize": page_size})
+            if page == 1:
+                fingerprint = self.group_page_fingerprint(data)
+            elif data is None:
+                cached = self._group_roster_cache.get(group_id)
+                LOGGER.warning("Group %s member page %s failed; roster left incomplete", group_id, page)
+                if cached:
+                    return cached["members"]
+                return sorted(set(usernames))
             if not data:
                 break
             page_usernames = self.extract_group_member_names(data)
@@ -387,16 +904,43 @@ class HabboWatch(commands.Cog):
             if not self.group_members_has_next_page(data, page, len(page_usernames), page_size):
                 break
             page += 1
-        return sorted(set(usernames))
-
-    async def fetch_habbo_user(self, username: str) -> dict | None:
-        # Hotel hardcoded
-        url = "https://www.habbo.com/api/public/users"
-        params = {"name": username}
-        data = await self.fetch_json(url, params=params)
+        members = sorted(set(usernames))
+        if fingerprint is not None:
+            self._group_roster_cache[group_id] = {"fingerprint": fingerprint, "members": members, "fetched_at": time.time()}
+        return members
+
+    async def fetch_group_roster(self, group_id: str) -> list[str]:
+        """Return a group's members, paying for a full fetch only when page one changed."""
+        cached = self._group_roster_cache.get(group_id)
+        if not cached or time.time() - cached["fetched_at"] > GROUP_ROSTER_MAX_AGE_SECONDS:
+            return await self.fetch_group_members(group_id)
+        url = f"{hotel_base_url(self.group_hotel(group_id))}/api/public/groups/{group_id}/members"
+        first_page = await self.fetch_json(url, params={"pageNumber": 1, "pageSize": GROUP_MEMBERS_PAGE_SIZE})
+        if first_page and self.group_page_fingerprint(first_page) == cached["fingerprint"]:
+            return cached["members"]
+        if not first_page:
+            # Probe failed (outage or rate limit): keep the last known roster.
+            return cached["members"]
+        return await self.fetch_group_members(group_id, first_page=first_page)
+
+    async def fetch_habbo_user(
+        self,
+        username: str,
+        hotel: str = DEFAULT_HOTEL,
+        max_age: float = 0.0,
+        priority: int = PRIORITY_BACKGROUND,
+    ) -> dict | None:
+        """Fetch a profile by name through the observation bus.
+
+        ``max_age`` lets routine sweeps reuse a profile the ID tracker (or a
+        concurrent lookup) fetched within that many seconds.
+        """
+        status, data = await self.observations.fetch_user(username, hotel, max_age=max_age, priority=priority)
+        if status is not None and status >= 400 and status not in (404, 429):
+            LOGGER.warning("Habbo API returned HTTP %s for user %s", status, username)
         if data is None:
             LOGGER.warning("Habbo profile lookup returned no public user for %s", username)
-        return data if isinstance(data, dict) else None
+        return data
 
     @staticmethod
     def parse_iso(ts: str | None):
@@ -489,7 +1033,18 @@ class HabboWatch(commands.Cog):
         policy string into the audit JSON.
         """
         normalized = str(policy_name or "MOD").strip().upper()
-        return normalized if normalized in POLICIES else "MOD"
+        if normalized in POLICIES:
+            return normalized
+        return "MOD" if "MOD" in POLICIES else next(iter(POLICIES))
+
+    @staticmethod
+    def policy_for(policy_name: str | None) -> Policy:
+        """Return a member's policy, falling back to the default one.
+
+        Rosters cached for status boards or resumed from a sweep checkpoint can
+        name a policy that habbopolicies has since removed or renamed.
+        """
+        return POLICIES[HabboWatch.normalize_policy(policy_name)]
 
     @staticmethod
     def parse_operator_datetime(timestamp_text: str | None) -> datetime:
@@ -622,31 +1177,26 @@ class HabboWatch(commands.Cog):
         return embed
 
     @staticmethod
-    def resolve_milestone(days_offline: float | None, milestones: tuple[tuple[float, str, str], ...]):
-        """Return the highest milestone reached for the current offline duration."""
-        if days_offline is None:
+    def resolve_milestone(days_offline: float | None, policy: Policy):
+        """Return (title, key) of the highest milestone reached, via bisect on the policy table."""
+        milestone = policy.resolve(days_offline)
+        if milestone is None:
             return None, None
+        return milestone.title, milestone.key
 
-        reached_title = None
-        reached_key = None
-        for threshold_days, title, key in milestones:
-            if days_offline >= threshold_days:
-                reached_title = title
-                reached_key = key
-        return reached_title, reached_key
-
-    def evaluate_user(
+    def evaluate_status(
         self,
         user_json: dict,
         requested_username: str,
         offline_since_dt: datetime | None,
         policy_name: str,
-    ):
-        """Build an embed from live status + tracked offline transition time.
+    ) -> MemberStatus:
+        """Classify a profile for its policy without building any Discord objects.
 
-        Important behavior:
-        - Offline duration is based on `offline_since_dt` only (set when we observe online->offline).
-        - We intentionally avoid API last-access timestamps for watcher alert timing.
+        The sweep calls this for every member; the embed is only rendered by
+        ``render_status_embed`` when an alert will actually be sent.
+        Offline duration is based on `offline_since_dt` only (set when we observe
+        online->offline); API last-access timestamps are not used for alert timing.
         """
         name = user_json.get("name") or requested_username
         online = user_json.get("online", user_json.get("isOnline")) is True
@@ -654,82 +1204,92 @@ class HabboWatch(commands.Cog):
         if profile_visible is None:
             profile_visible = bool(user_json.get("memberSince") or user_json.get("lastAccessTime"))
 
-        # Full-body avatar (direction changed to 3)
+        if not profile_visible:
+            return MemberStatus(name, online, False, "Profile Hidden", "profile_hidden")
+        if online:
+            return MemberStatus(name, True, True, "Online", None)
+        if not offline_since_dt:
+            # User is offline, but we never observed a live online->offline transition yet.
+            # Per requirements, do not start tracking from API last-access values.
+            return MemberStatus(name, False, True, "Offline (Awaiting Online Observation)", None)
+
+        # Alerts are sent at specific checkpoints requested by policy.
+        # We return only the highest reached checkpoint and rely on sent_alerts
+        # deduplication in periodic_check to avoid duplicate notifications.
+        milestone_title, milestone_key = self.resolve_milestone(self.days_since(offline_since_dt), self.policy_for(policy_name))
+        if milestone_title and milestone_key:
+            return MemberStatus(name, False, True, milestone_title, milestone_key)
+        return MemberStatus(name, False, True, "Recent Activity", None)
+
+    @staticmethod
+    def profile_base_url(user_json: dict) -> str:
+        """Return the hotel site for a profile, read from its unique ID prefix."""
+        return hotel_base_url(hotel_from_identifier(user_json.get("uniqueId")) or DEFAULT_HOTEL)
+
+    @classmethod
+    def avatar_url_for(cls, user_json: dict, name: str) -> str:
+        """Return the full-body avatar image URL (direction 3) for a profile."""
+        base_url = cls.profile_base_url(user_json)
         figure = user_json.get("figureString") or user_json.get("figure")
         if figure:
-            avatar_url = f"https://www.habbo.com/habbo-imaging/avatarimage?figure={figure}&size=l&direction=3&head_direction=3"
-        else:
-            avatar_url = f"https://www.habbo.com/habbo-imaging/avatarimage?user={name}&size=l&direction=3&head_direction=3"
+            return f"{base_url}/habbo-imaging/avatarimage?figure={figure}&size=l&direction=3&head_direction=3"
+        return f"{base_url}/habbo-imaging/avatarimage?user={name}&size=l&direction=3&head_direction=3"
 
-        unique_id = user_json.get("uniqueId")
+    def render_status_embed(
+        self,
+        user_json: dict,
+        status: MemberStatus,
+        offline_since_dt: datetime | None,
+        policy_name: str,
+    ) -> discord.Embed:
+        """Build the per-member status embed for an evaluated profile."""
+        name = status.name
         lines = []
-        if unique_id:
-            lines.append(f"## Habbo: [{name}](https://www.habbo.com/profile/{name})")
+        if user_json.get("uniqueId"):
+            lines.append(f"## Habbo: [{name}]({self.profile_base_url(user_json)}/profile/{name})")
         else:
             lines.append(f"## Habbo: {name}")
 
-        if not profile_visible:
-            title = "Profile Hidden"
-            alert_key = "profile_hidden"
-        else:
-            if online:
-                title = "Online"
-                alert_key = None
+        if status.profile_visible:
+            if status.online:
                 lines.append("## Status: Online")
             elif offline_since_dt:
-                days_offline = self.days_since(offline_since_dt)
                 last_seen_unix = int(offline_since_dt.timestamp())
                 offline_duration = self.format_offline_duration(offline_since_dt)
                 lines.append(f"## Last Seen Online: <t:{last_seen_unix}:R>")
                 if offline_duration:
                     # Include the exact elapsed time for quick triage in alerts.
                     lines.append(f"## Offline For: {offline_duration}")
-                allowed_days = POLICIES[policy_name]["allowed_days"]
+                allowed_days = self.policy_for(policy_name).allowed_days
                 lines.append(f"## Group Policy: {policy_name}")
                 lines.append(f"## Allowed Offline Window: {allowed_days:.0f} day(s)")
-
-                # Alerts are sent at specific checkpoints requested by policy.
-                # We return only the highest reached checkpoint and rely on sent_alerts
-                # deduplication in periodic_check to avoid duplicate notifications.
-                milestone_title, milestone_key = self.resolve_milestone(
-                    days_offline,
-                    POLICIES[policy_name]["milestones"],
-                )
-                if milestone_title and milestone_key:
-                    title = milestone_title
-                    alert_key = milestone_key
-                else:
-                    title = "Recent Activity"
-                    alert_key = None
             else:
-                # User is offline, but we never observed a live online->offline transition yet.
-                # Per requirements, do not start tracking from API last-access values.
-                title = "Offline (Awaiting Online Observation)"
-                alert_key = None
                 lines.append("## Status: Offline (tracking starts after they are seen online first)")
 
-        warn_titles = (
-            "Offline Notice (2 Days)",
-            "Offline Warning (2 Days 23 Hours)",
-            "Offline Warning (3 Days)",
-            "Approaching 16 Hours",
-            "OOA Offline Warning (23 Hours)",
-            "OOA Offline Warning (24 Hours)",
-            "Offline Warning",
-            "Profile Hidden",
-        )
         embed = discord.Embed(
-            title=title,
+            title=status.title,
             description="\n".join(lines),
-            colour=discord.Colour.red() if title in warn_titles else discord.Colour.blurple(),
+            colour=self.alert_colour(policy_name, status.alert_key),
             timestamp=datetime.now(timezone.utc),
         )
-        embed.set_thumbnail(url=avatar_url)
+        embed.set_thumbnail(url=self.avatar_url_for(user_json, name))
         embed.set_footer(text=f"{self.bot.user.name}")
-        return embed, online, alert_key, name, avatar_url
+        return embed
+
+    def evaluate_user(
+        self,
+        user_json: dict,
+        requested_username: str,
+        offline_since_dt: datetime | None,
+        policy_name: str,
+    ):
+        """Evaluate a profile and render its embed; used where the embed is always sent."""
+        status = self.evaluate_status(user_json, requested_username, offline_since_dt, policy_name)
+        embed = self.render_status_embed(user_json, status, offline_since_dt, policy_name)
+        return embed, status.online, status.alert_key, status.name, self.avatar_url_for(user_json, status.name)
 
-    def make_back_online_embed(self, name: str, avatar_url: str, went_offline_at: datetime | None):
-        lines = [f"## Habbo: [{name}](https://www.habbo.com/profile/{name})"]
+    def make_back_online_embed(self, name: str, avatar_url: str, went_offline_at: datetime | None, base_url: str | None = None):
+        lines = [f"## Habbo: [{name}]({base_url or hotel_base_url(DEFAULT_HOTEL)}/profile/{name})"]
         if went_offline_at:
             unix_then = int(went_offline_at.timestamp())
             unix_now = int(datetime.now(timezone.utc).timestamp())
@@ -802,64 +1362,230 @@ class HabboWatch(commands.Cog):
         instead of being dropped.
         """
         policy = self.normalize_policy(policy_name)
-        configured_channels = getattr(self, "alert_channel_ids", {})
+        configured_channels = self.alert_channel_ids
         return self.parse_discord_ids(configured_channels.get(policy))
 
-    def configure_alert_channels(self, policy_name: str, raw_channels) -> list[int]:
+    def alert_delivery_mode_for_policy(self, policy_name: str | None) -> str:
+        """Return ``webhook`` or ``bot`` for a policy's alert channels."""
+        policy = self.normalize_policy(policy_name)
+        return self.alert_delivery_modes.get(policy, "bot")
+
+    def configure_alert_channels(self, policy_name: str, raw_channels, delivery_mode: str | None = None) -> list[int]:
         """Save one or more alert channels for a policy and return their IDs.
 
         ``raw_channels`` may include Discord channel objects, plain snowflakes,
         channel mention text, or legacy single-ID values. The command replaces
         the policy's channel list so operators can intentionally remove old
         destinations by running setmod/setooa with the desired final list.
+        ``delivery_mode`` optionally switches the policy between the bot's own
+        sends and channel webhooks; ``None`` keeps the current mode.
         """
         channel_ids = self.parse_discord_ids(raw_channels)
         if not channel_ids:
             raise ValueError("Please provide at least one valid Discord channel or run the command in the target channel.")
+        if delivery_mode is not None and delivery_mode.lower() not in ALERT_DELIVERY_MODES:
+            raise ValueError(f"Delivery mode must be one of: {', '.join(ALERT_DELIVERY_MODES)}.")
 
         policy = self.normalize_policy(policy_name)
         self.alert_channel_ids[policy] = channel_ids
+        if delivery_mode is not None:
+            self.alert_delivery_modes[policy] = delivery_mode.lower()
         self.save_alert_channel_ids()
         return channel_ids
 
-    async def notify_user(self, embed: discord.Embed, policy_name: str | None = None):
-        """Send an alert to every configured policy channel, otherwise DM Noah."""
+    async def resolve_alert_destination(self, destination: tuple[str, int]):
+        """Turn an outbox destination key into something with ``send``.
+
+        Channels and the owner's DM channel come from the bot-wide destination
+        cache, so only the first alert to each destination costs a lookup.
+        """
+        return await DestinationCache.for_bot(self.bot).resolve(destination)
+
+    def invalidate_alert_destination(self, destination: tuple[str, int], exc: Exception):
+        """Drop a cached destination after Discord reports it Forbidden/NotFound."""
+        DestinationCache.for_bot(self.bot).invalidate(destination, exc)
+
+    @staticmethod
+    def alert_severity(alert_key: str | None, policy_name: str | None = None) -> str | None:
+        """Return the configured severity of an alert key, or None for routine embeds."""
+        if alert_key == "profile_hidden":
+            return PROFILE_HIDDEN_SEVERITY
+        if not alert_key:
+            return None
+        policies = [POLICIES[policy_name]] if policy_name in POLICIES else POLICIES.values()
+        for policy in policies:
+            milestone = policy.milestone(alert_key)
+            if milestone:
+                return milestone.severity
+        return None
+
+    @classmethod
+    def alert_priority(cls, alert_key: str | None) -> int:
+        """Return the outbox priority class for an alert key."""
+        return SEVERITY_PRIORITIES.get(cls.alert_severity(alert_key), PRIORITY_LOW)
+
+    @staticmethod
+    def alert_colour(policy_name: str | None, alert_key: str | None):
+        """Return the embed colour configured for an alert, blurple when routine."""
+        if alert_key == "profile_hidden":
+            return discord.Colour.red()
+        policy = POLICIES.get(str(policy_name or "").upper())
+        milestone = policy.milestone(alert_key) if policy else None
+        if milestone is None:
+            return discord.Colour.blurple()
+        return getattr(discord.Colour, milestone.colour, discord.Colour.red)()
+
+    @staticmethod
+    def milestone_rank(policy_name: str | None, alert_key: str | None) -> int:
+        """Return how far into its policy's milestone list an alert key is."""
+        policy = POLICIES.get(str(policy_name or "").upper())
+        return policy.rank(alert_key) if policy else 0
+
+    async def notify_user(
+        self,
+        embed: discord.Embed,
+        policy_name: str | None = None,
+        alert_key: str | None = None,
+        username_lc: str | None = None,
+    ):
+        """Queue an alert for every configured policy channel, otherwise DM Noah.
+
+        Delivery happens on the outbox's background workers, which pack up to
+        ten embeds per message for each destination. The DM is only used when
+        every policy channel failed (or none is configured). Milestone alerts
+        for the same user share a coalescing key, so a queued 23h warning is
+        replaced by a 24h warning instead of both being sent.
+        """
         channel_ids = self.alert_channel_ids_for_policy(policy_name)
-        sent_to_channel = False
-        for channel_id in channel_ids:
-            try:
-                channel = self.bot.get_channel(channel_id) if hasattr(self.bot, "get_channel") else None
-                if channel is None:
-                    channel = await self.bot.fetch_channel(channel_id)
-                await channel.send(embed=embed)
-                sent_to_channel = True
-            except Exception as exc:
-                LOGGER.warning("Unable to send Habbo %s alert to channel %s: %s", policy_name, channel_id, exc)
-
-        if sent_to_channel:
+        # Webhook destinations have their own Discord rate buckets, so the
+        # outbox workers for different channels can deliver in parallel.
+        destination_kind = "webhook" if self.alert_delivery_mode_for_policy(policy_name) == "webhook" else "channel"
+        rank = self.milestone_rank(policy_name, alert_key)
+        self.outbox.enqueue(
+            embed,
+            [(destination_kind, channel_id) for channel_id in channel_ids],
+            fallback=("user", NOTIFY_USER_ID),
+            priority=self.alert_priority(alert_key),
+            coalesce_key=("milestone", username_lc) if username_lc and rank else None,
+            rank=rank,
+        )
+
+    def notify_tenant(
+        self,
+        tenant: WatchTenant,
+        embed: discord.Embed,
+        policy_name: str,
+        alert_key: str | None = None,
+        username_lc: str | None = None,
+    ):
+        """Queue an alert for one tenant's channels for ``policy_name``."""
+        channel_ids = tenant.channels.get(policy_name) or []
+        if not channel_ids:
             return
+        rank = self.milestone_rank(policy_name, alert_key)
+        self.outbox.enqueue(
+            embed,
+            [("channel", channel_id) for channel_id in channel_ids],
+            priority=self.alert_priority(alert_key),
+            coalesce_key=("milestone", tenant.guild_id, username_lc) if username_lc and rank else None,
+            rank=rank,
+        )
 
-        try:
-            user = await self.bot.fetch_user(NOTIFY_USER_ID)
-            await user.send(embed=embed)
-        except Exception:
-            pass
+    def notify_tenants(
+        self,
+        username_lc: str,
+        user_json: dict,
+        st: dict,
+        went_online: bool,
+        went_offline_at: datetime | None,
+        defer_alerts: bool = False,
+    ) -> bool:
+        """Evaluate one observed member for every tenant watching them.
+
+        The profile was fetched once for all tenants; each tenant applies its
+        own policy and dedupe. Identical embeds are rendered once and shared.
+        Returns whether tenant alert state changed.
+        """
+        tenants = self.tenants
+        offline_since = st.get("offline_since")
+        window = offline_since.isoformat() if offline_since else None
+        rendered: dict[tuple, discord.Embed] = {}
+        changed = False
+        for guild_id, tenant_roster in self.current_tenant_rosters().items():
+            entry = tenant_roster.get(username_lc)
+            tenant = tenants.get(guild_id)
+            if entry is None or tenant is None:
+                continue
+            policy_name = entry[1]
+            status = self.evaluate_status(user_json, username_lc, offline_since, policy_name)
+            if (
+                status.alert_key
+                and not defer_alerts
+                and self.tenant_alerts.mark_sent(guild_id, username_lc, window, status.alert_key)
+            ):
+                cache_key = (policy_name, status.alert_key)
+                if cache_key not in rendered:
+                    rendered[cache_key] = self.render_status_embed(user_json, status, offline_since, policy_name)
+                self.notify_tenant(tenant, rendered[cache_key], policy_name, alert_key=status.alert_key, username_lc=username_lc)
+                changed = True
+            if went_online:
+                if "back" not in rendered:
+                    rendered["back"] = self.make_back_online_embed(
+                        status.name, self.avatar_url_for(user_json, status.name), went_offline_at, self.profile_base_url(user_json)
+                    )
+                self.notify_tenant(tenant, rendered["back"], policy_name)
+        return changed
 
+    @staticmethod
+    def merge_group_rosters(groups: list[WatchedGroup], rosters: list[list[str]]) -> dict[str, tuple[str, str]]:
+        """Merge group rosters in one pass; the highest-precedence group sets the policy."""
+        best: dict[str, tuple[int, str, str]] = {}
+        for group, usernames in zip(groups, rosters):
+            hotel = HabboWatch.group_hotel(group.group_id)
+            for username in usernames:
+                username_lc = HabboWatch.member_key(username, hotel)
+                current = best.get(username_lc)
+                if current is None or group.precedence >= current[0]:
+                    best[username_lc] = (group.precedence, username, group.policy)
+        return {username_lc: (username, policy_name) for username_lc, (_precedence, username, policy_name) in best.items()}
 
     async def fetch_user_policy_map(self) -> dict[str, tuple[str, str]]:
         """Return every watched Habbo user with roster casing and active policy.
 
-        OOA members can also be MOD members, so OOA intentionally overwrites MOD
-        when both group rosters contain the same Habbo username.
+        Group rosters load concurrently; the shared request limiter still paces
+        the actual Habbo calls. Members of several groups get the policy of the
+        group with the highest precedence.
         """
-        user_policy_map: dict[str, tuple[str, str]] = {}
-        for username in await self.fetch_group_members(MOD_GROUP_ID):
-            user_policy_map[username.lower()] = (username, "MOD")
-        for username in await self.fetch_group_members(OOA_GROUP_ID):
-            user_policy_map[username.lower()] = (username, "OOA")
-        return user_policy_map
-
-    async def fetch_habbo_user_forced(self, username: str, attempts: int = 3) -> dict | None:
+        groups = [group for group in self.watched_groups if group.policy in POLICIES]
+        tenants = list(self.tenants.values())
+        # A group watched by several tenants is still fetched once per cycle.
+        group_ids = list(
+            dict.fromkeys([group.group_id for group in groups] + [group.group_id for tenant in tenants for group in tenant.groups])
+        )
+        fetched = await asyncio.gather(*(self.fetch_group_roster(group_id) for group_id in group_ids))
+        rosters = dict(zip(group_ids, fetched))
+        roster = self.merge_group_rosters(groups, [rosters[group.group_id] for group in groups])
+        self._tenant_rosters = {}
+        for tenant in tenants:
+            tenant_groups = [group for group in tenant.groups if group.policy in POLICIES][:TENANT_MAX_GROUPS]
+            if tenant_groups:
+                # Tenants sweep on the owner's budget; groups that grew past the cap are cut.
+                tenant_roster, dropped = cap_tenant_roster(
+                    self.merge_group_rosters(tenant_groups, [rosters[group.group_id] for group in tenant_groups]), roster
+                )
+                if dropped:
+                    LOGGER.warning("Tenant %s exceeds %s members; %s are not swept", tenant.guild_id, TENANT_MAX_MEMBERS, dropped)
+                self._tenant_rosters[tenant.guild_id] = tenant_roster
+        return roster
+
+    async def fetch_habbo_user_forced(
+        self,
+        username: str,
+        attempts: int = 3,
+        hotel: str = DEFAULT_HOTEL,
+        max_age: float = 0.0,
+        priority: int = PRIORITY_BACKGROUND,
+    ) -> dict | None:
         """Fetch a profile without multiplying routine watcher traffic.
 
         Operator-driven actions retain retries for a useful immediate result.
@@ -867,9 +1593,9 @@ class HabboWatch(commands.Cog):
         limiter ensures people are checked no faster than one per second.
         """
         attempts = max(1, attempts)
-        retry_delays = getattr(self, "profile_retry_delays", PROFILE_RETRY_DELAYS_SECONDS)
+        retry_delays = self.profile_retry_delays
         for attempt_index in range(attempts):
-            user_json = await self.fetch_habbo_user(username)
+            user_json = await self.fetch_habbo_user(username, hotel, max_age=max_age, priority=priority)
             if user_json:
                 return user_json
             if attempt_index < attempts - 1 and retry_delays:
@@ -880,8 +1606,6 @@ class HabboWatch(commands.Cog):
     async def message_error_to_owner(self, message: str, dedupe_key: str | None = None):
         """Send a throttled owner DM for watcher errors that need operator attention."""
         now = datetime.now(timezone.utc)
-        if not hasattr(self, "_last_error_notifications"):
-            self._last_error_notifications = {}
         if dedupe_key:
             last_sent = self._last_error_notifications.get(dedupe_key)
             if last_sent and (now - last_sent).total_seconds() < 3600:
@@ -895,11 +1619,7 @@ class HabboWatch(commands.Cog):
             timestamp=now,
         )
         embed.set_footer(text=f"{self.bot.user.name}")
-        try:
-            user = await self.bot.fetch_user(NOTIFY_USER_ID)
-            await user.send(embed=embed)
-        except Exception:
-            pass
+        self.outbox.enqueue(embed, [("user", NOTIFY_USER_ID)], priority=PRIORITY_NORMAL)
 
     @staticmethod
     def parse_habbo_last_access(user_json: dict) -> datetime | None:
@@ -942,7 +1662,7 @@ class HabboWatch(commands.Cog):
         unavailable: list[str] = []
         for username_lc, (requested_username, policy_name) in (await self.fetch_user_policy_map()).items():
             checked += 1
-            user_json = await self.fetch_habbo_user_forced(requested_username)
+            user_json = await self.fetch_habbo_user_forced(requested_username, hotel=self.member_hotel(username_lc))
             if not user_json:
                 unavailable.append(requested_username)
                 await self.message_error_to_owner(
@@ -983,12 +1703,45 @@ class HabboWatch(commands.Cog):
             message += "."
         return message
 
+    @staticmethod
+    def remember_profile(st: dict, user_json: dict):
+        """Keep the few profile fields needed to re-render a member later."""
+        st["profile"] = {field: user_json.get(field) for field in PROFILE_CACHE_FIELDS}
+
+    def apply_forced_observation(self, username_lc: str, requested_username: str, policy_name: str, user_json: dict) -> dict:
+        """Record a profile fetched outside the periodic sweep and return its state."""
+        display_name = user_json.get("name") or requested_username
+        is_online = user_json.get("online", user_json.get("isOnline")) is True
+        st = self._state.setdefault(
+            username_lc,
+            {"was_online": None, "offline_since": None, "sent_alerts": self.get_persisted_sent_alerts(username_lc)},
+        )
+        if is_online:
+            now = datetime.now(timezone.utc)
+            previous_offline_since = self.parse_iso(self.logoff_times.get(username_lc)) or self.parse_iso(self.offline_records.get(username_lc, {}).get("current_offline_since"))
+            self.last_online_times[username_lc] = now.isoformat()
+            if previous_offline_since:
+                self.record_offline_end(username_lc, display_name, policy_name, previous_offline_since, now)
+            else:
+                self.record_online_observation(username_lc, display_name, policy_name, now)
+            self.logoff_times.pop(username_lc, None)
+            st["offline_since"] = None
+        else:
+            st["offline_since"] = self.parse_iso(self.logoff_times.get(username_lc)) or self.parse_iso(self.offline_records.get(username_lc, {}).get("current_offline_since"))
+            if st["offline_since"]:
+                self.record_offline_start(username_lc, display_name, policy_name, st["offline_since"])
+        st["was_online"] = is_online
+        st["policy"] = policy_name
+        self.remember_profile(st, user_json)
+        self.sync_milestone_member(username_lc, st)
+        return st
+
     async def force_upload_all_embeds(self) -> tuple[int, int, list[str]]:
         """Upload a current status embed for every watched Habbo member."""
         sent_count = 0
         unavailable_usernames: list[str] = []
         for username_lc, (requested_username, policy_name) in (await self.fetch_user_policy_map()).items():
-            user_json = await self.fetch_habbo_user_forced(requested_username)
+            user_json = await self.fetch_habbo_user_forced(requested_username, hotel=self.member_hotel(username_lc))
             if not user_json:
                 unavailable_usernames.append(requested_username)
                 await self.notify_user(self.build_profile_unavailable_embed(requested_username, policy_name), policy_name)
@@ -998,24 +1751,7 @@ class HabboWatch(commands.Cog):
                 sent_count += 1
                 continue
 
-            display_name = user_json.get("name") or requested_username
-            is_online = user_json.get("online", user_json.get("isOnline")) is True
-            st = self._state.setdefault(username_lc, {"was_online": None, "offline_since": None, "sent_alerts": set()})
-            if is_online:
-                now = datetime.now(timezone.utc)
-                previous_offline_since = self.parse_iso(self.logoff_times.get(username_lc)) or self.parse_iso(self.offline_records.get(username_lc, {}).get("current_offline_since"))
-                self.last_online_times[username_lc] = now.isoformat()
-                if previous_offline_since:
-                    self.record_offline_end(username_lc, display_name, policy_name, previous_offline_since, now)
-                else:
-                    self.record_online_observation(username_lc, display_name, policy_name, now)
-                self.logoff_times.pop(username_lc, None)
-                st["offline_since"] = None
-            else:
-                st["offline_since"] = self.parse_iso(self.logoff_times.get(username_lc)) or self.parse_iso(self.offline_records.get(username_lc, {}).get("current_offline_since"))
-                if st["offline_since"]:
-                    self.record_offline_start(username_lc, display_name, policy_name, st["offline_since"])
-            st["was_online"] = is_online
+            st = self.apply_forced_observation(username_lc, requested_username, policy_name, user_json)
             embed, *_ = self.evaluate_user(user_json, requested_username, st.get("offline_since"), policy_name)
             await self.notify_user(embed, policy_name)
             sent_count += 1
@@ -1024,143 +1760,558 @@ class HabboWatch(commands.Cog):
         self.save_offline_records()
         return sent_count, len(unavailable_usernames), unavailable_usernames
 
-    # Five-minute polling cuts routine group/profile traffic by 80% compared
-    # with the previous one-minute cycle, without affecting hour/day alerts.
-    @tasks.loop(minutes=PERIODIC_CHECK_INTERVAL_MINUTES)
-    async def periodic_check(self):
-        unavailable_usernames: list[str] = []
-        failure_streaks = getattr(self, "_profile_failure_streaks", {})
-        self._profile_failure_streaks = failure_streaks
+    def has_fresh_state(self, username_lc: str) -> bool:
+        """Return whether the sweep observed this member recently enough for a digest."""
+        st = self._state.get(username_lc)
+        checked_at = self._last_checked.get(username_lc)
+        return bool(
+            st
+            and st.get("profile")
+            and st.get("was_online") is not None
+            and checked_at is not None
+            and time.time() - checked_at <= DIGEST_STATE_MAX_AGE_SECONDS
+        )
 
-        # Check each unique watched user once using roster casing for Habbo lookups.
-        for username_lc, (requested_username, policy_name) in (await self.fetch_user_policy_map()).items():
-            # Routine scans make exactly one profile request per person. Retrying
-            # everyone during an outage only increases load and failure noise.
-            user_json = await self.fetch_habbo_user_forced(requested_username, attempts=1)
+    @staticmethod
+    def next_milestone(offline_since: datetime, policy: Policy) -> tuple[str, datetime] | None:
+        """Return the title and due time of the next milestone not yet reached."""
+        days_offline = (datetime.now(timezone.utc) - offline_since).total_seconds() / 86400
+        milestone = policy.next_after(days_offline)
+        if milestone is None:
+            return None
+        return milestone.title, offline_since + timedelta(days=milestone.threshold_days)
+
+    def digest_status(self, username_lc: str, policy_name: str, include_next_milestone: bool = False) -> tuple[str, str, str | None]:
+        """Return (severity, short status text, alert key) from in-memory state."""
+        st = self._state.get(username_lc) or {}
+        profile = st.get("profile") or {}
+        if not profile:
+            return "unavailable", "No profile data", None
+        if profile.get("profileVisible") is False:
+            return "warning", "Profile hidden", "profile_hidden"
+        if st.get("was_online"):
+            return "online", "Online", None
+        offline_since = st.get("offline_since")
+        if not offline_since:
+            return "offline", "Offline (awaiting online observation)", None
+        policy = self.policy_for(policy_name)
+        _title, alert_key = self.resolve_milestone(self.days_since(offline_since), policy)
+        text = f"Offline since <t:{int(offline_since.timestamp())}:R>"
+        if include_next_milestone:
+            upcoming = self.next_milestone(offline_since, policy)
+            if upcoming:
+                text += f" · next: {upcoming[0]} <t:{int(upcoming[1].timestamp())}:R>"
+        if alert_key:
+            return self.alert_severity(alert_key, policy_name) or "notice", text, alert_key
+        return "offline", text, None
+
+    def group_status_lines(
+        self,
+        roster: dict[str, tuple[str, str]],
+        unavailable: set[str] = frozenset(),
+        include_next_milestone: bool = False,
+    ) -> tuple[dict[str, dict[str, list[str]]], list[tuple[str, str, str, str]]]:
+        """Group one status line per member by policy and severity.
+
+        Returns ``(grouped, warnings)`` where ``warnings`` lists the
+        ``(username_lc, requested_username, policy_name, alert_key)`` members
+        that still deserve a full per-member embed.
+        """
+        grouped: dict[str, dict[str, list[str]]] = {}
+        warnings: list[tuple[str, str, str, str]] = []
+        for username_lc, (requested_username, policy_name) in roster.items():
+            if username_lc in unavailable:
+                severity, text, alert_key = "unavailable", "Profile lookup failed", None
+            else:
+                severity, text, alert_key = self.digest_status(username_lc, policy_name, include_next_milestone)
+            profile = (self._state.get(username_lc) or {}).get("profile") or {}
+            name = profile.get("name") or requested_username
+            grouped.setdefault(policy_name, {}).setdefault(severity, []).append(f"**{name}** — {text}")
+            if severity == "warning" and alert_key:
+                warnings.append((username_lc, requested_username, policy_name, alert_key))
+        return grouped, warnings
+
+    @staticmethod
+    def paginate_status_lines(by_severity: dict[str, list[str]]) -> list[str]:
+        """Split severity-grouped lines into page descriptions under the page size."""
+        descriptions: list[str] = []
+        current = ""
+        for severity in DIGEST_SEVERITY_ORDER:
+            lines = sorted(by_severity.get(severity, []), key=str.lower)
+            if not lines:
+                continue
+            for line in [f"### {DIGEST_SEVERITY_LABELS[severity]} ({len(lines)})", *lines]:
+                if current and len(current) + len(line) + 1 > DIGEST_PAGE_CHARACTERS:
+                    descriptions.append(current)
+                    current = ""
+                current = f"{current}\n{line}" if current else line
+        if current:
+            descriptions.append(current)
+        return descriptions
+
+    def build_status_digest(self, roster: dict[str, tuple[str, str]], unavailable: set[str]) -> tuple[dict[str, list[discord.Embed]], list[tuple[str, str, str, str]]]:
+        """Render the roster into compact per-policy pages grouped by severity."""
+        grouped, warnings = self.group_status_lines(roster, unavailable)
+        pages_by_policy: dict[str, list[discord.Embed]] = {}
+        for policy_name, by_severity in grouped.items():
+            descriptions = self.paginate_status_lines(by_severity)
+            total_members = sum(len(lines) for lines in by_severity.values())
+            pages = []
+            for page_number, description in enumerate(descriptions, start=1):
+                embed = discord.Embed(
+                    title=f"{policy_name} Roster Digest ({page_number}/{len(descriptions)})",
+                    description=description,
+                    colour=discord.Colour.red() if by_severity.get("warning") else discord.Colour.blurple(),
+                    timestamp=datetime.now(timezone.utc),
+                )
+                embed.set_footer(text=f"{self.bot.user.name} • {total_members} member(s)")
+                pages.append(embed)
+            pages_by_policy[policy_name] = pages
+        return pages_by_policy, warnings
+
+    async def upload_status_digest(self) -> tuple[int, int, int, int, list[str]]:
+        """Post the roster as digest pages plus full embeds for warning members only.
+
+        Members the sweep saw recently are rendered from memory; only stale or
+        never-seen members are fetched. Returns ``(members, pages, warning
+        embeds, refreshed profiles, unavailable usernames)``.
+        """
+        roster = await self.fetch_user_policy_map()
+        refreshed = 0
+        unavailable_usernames: list[str] = []
+        unavailable: set[str] = set()
+        for username_lc, (requested_username, policy_name) in roster.items():
+            if self.has_fresh_state(username_lc):
+                continue
+            user_json = await self.fetch_habbo_user_forced(requested_username, hotel=self.member_hotel(username_lc))
             if not user_json:
-                # A brief Habbo API outage can affect the entire roster at once.
-                # Keep the last known state (avoiding a false transition after
-                # recovery) and report all failures in one throttled summary.
-                failure_streaks[username_lc] = failure_streaks.get(username_lc, 0) + 1
-                if failure_streaks[username_lc] >= PROFILE_FAILURE_ALERT_THRESHOLD:
-                    unavailable_usernames.append(requested_username)
+                unavailable.add(username_lc)
+                unavailable_usernames.append(requested_username)
                 continue
+            self.apply_forced_observation(username_lc, requested_username, policy_name, user_json)
+            refreshed += 1
+        if refreshed:
+            self.save_last_online_times()
+            self.save_logoff_times()
+            self.save_offline_records()
 
-            # A successful response ends the consecutive-failure window, so a
-            # later isolated failure does not inherit an old outage's count.
-            failure_streaks.pop(username_lc, None)
-
-            st = self._state.get(
-                username_lc,
-                {
-                    "was_online": None,
-                    "offline_since": None,
-                    # Seed dedupe state from JSON so restarting the bot does
-                    # not resend an embed for an already-reported issue.
-                    "sent_alerts": self.get_persisted_sent_alerts(username_lc),
-                },
+        pages_by_policy, warnings = self.build_status_digest(roster, unavailable)
+        page_count = 0
+        for policy_name, pages in pages_by_policy.items():
+            for page in pages:
+                await self.notify_user(page, policy_name)
+                page_count += 1
+        for username_lc, requested_username, policy_name, alert_key in warnings:
+            st = self._state[username_lc]
+            embed, *_ = self.evaluate_user(st["profile"], requested_username, st.get("offline_since"), policy_name)
+            await self.notify_user(embed, policy_name, alert_key=alert_key)
+
+        if unavailable_usernames:
+            # One summary DM instead of one per member, as periodic_check does.
+            await self.message_error_to_owner(
+                f"Habbo profile lookup failed for {len(unavailable_usernames)} watched user(s) during a digest check: "
+                f"{', '.join(unavailable_usernames[:10])}{' (+more)' if len(unavailable_usernames) > 10 else ''}.",
+                dedupe_key="digest-profile-lookups",
             )
+        return len(roster), page_count, len(warnings), refreshed, unavailable_usernames
 
-            # Normalize alert history to a set in case older state shape exists.
-            sent_alerts = st.get("sent_alerts")
-            if not isinstance(sent_alerts, set):
-                sent_alerts = set(sent_alerts or [])
-                st["sent_alerts"] = sent_alerts
+    @staticmethod
+    def format_digest_summary(member_count: int, page_count: int, warning_count: int, refreshed_count: int, unavailable_usernames: list[str]) -> str:
+        """Summarize a digest check for the slash-command response."""
+        message = (
+            f"Digest Complete: posted {member_count} member(s) across {page_count} page(s) "
+            f"and {warning_count} warning embed(s); refreshed {refreshed_count} profile(s) from Habbo."
+        )
+        if unavailable_usernames:
+            shown = unavailable_usernames[:10]
+            message += f" Unavailable: {', '.join(shown)}"
+            if len(unavailable_usernames) > len(shown):
+                message += f" (+{len(unavailable_usernames) - len(shown)} more)"
+            message += "."
+        return message
 
-            previous_online = st.get("was_online")
-            is_online = user_json.get("online", user_json.get("isOnline")) is True
-            state_changed = False
-            display_name = user_json.get("name") or requested_username
+    def render_status_board(self, policy_name: str, by_severity: dict[str, list[str]]) -> list[list[tuple[str, str]]]:
+        """Return board messages as lists of ``(title, description)`` embed sources.
 
-            # Compare Habbo lastAccessTime to the JSON on every one-minute scan.
-            was_corrected = self.reconcile_last_access_for_user(username_lc, display_name, policy_name, user_json)
-            if was_corrected:
-                state_changed = True
+        Embeds carry no send-time timestamp so unchanged content hashes equal.
+        """
+        descriptions = self.paginate_status_lines(by_severity) or ["No watched members."]
+        total_members = sum(len(lines) for lines in by_severity.values())
+        pages = [
+            (f"{policy_name} Status Board ({page_number}/{len(descriptions)}) • {total_members} member(s)", description)
+            for page_number, description in enumerate(descriptions, start=1)
+        ]
+        return [
+            pages[index:index + STATUS_BOARD_EMBEDS_PER_MESSAGE]
+            for index in range(0, len(pages), STATUS_BOARD_EMBEDS_PER_MESSAGE)
+        ]
 
-            if previous_online is None and (not is_online) and st.get("offline_since") is None:
+    @staticmethod
+    def status_board_hash(message_pages: list[tuple[str, str]]) -> str:
+        """Hash the rendered content of one board message."""
+        digest = hashlib.sha1()
+        for title, description in message_pages:
+            digest.update(title.encode("utf-8"))
+            digest.update(b"\x1f")
+            digest.update(description.encode("utf-8"))
+            digest.update(b"\x1e")
+        return digest.hexdigest()
+
+    @staticmethod
+    def build_status_board_embeds(message_pages: list[tuple[str, str]]) -> list[discord.Embed]:
+        """Build embeds for a board message that needs to be written."""
+        return [
+            discord.Embed(title=title, description=description, colour=discord.Colour.blurple())
+            for title, description in message_pages
+        ]
+
+    async def refresh_status_boards(self, roster: dict[str, tuple[str, str]] | None = None) -> int:
+        """Bring every status board up to date with at most a few Discord writes.
+
+        Boards are rendered from in-memory state; messages whose content hash
+        is unchanged are skipped. Messages left stale by the write cap keep
+        their old hash and are retried next cycle. Returns the writes made.
+        """
+        boards = self.status_boards
+        if not boards:
+            return 0
+        if roster is None:
+            roster = self._status_board_roster or await self.fetch_user_policy_map()
+        self._status_board_roster = roster
+        grouped, _warnings = self.group_status_lines(roster, include_next_milestone=True)
+        cache = DestinationCache.for_bot(self.bot)
+        writes = 0
+        changed = False
+        for policy_name, board in boards.items():
+            if writes >= STATUS_BOARD_MAX_WRITES_PER_CYCLE:
+                break
+            try:
+                channel = await cache.channel(board["channel_id"])
+            except discord.HTTPException as exc:
+                # Deleted channel or lost access: look it up afresh next cycle.
+                cache.invalidate(("channel", board["channel_id"]))
+                LOGGER.warning("Unable to resolve %s status board channel %s: %s", policy_name, board["channel_id"], exc)
+                continue
+            if channel is None:
+                continue
+            message_ids: list[int | None] = board["message_ids"]
+            hashes: list[str] = board["hashes"]
+            messages = self.render_status_board(policy_name, grouped.get(policy_name, {}))
+            for index, message_pages in enumerate(messages):
+                content_hash = self.status_board_hash(message_pages)
+                if index < len(message_ids) and message_ids[index] is not None and hashes[index] == content_hash:
+                    continue
+                if writes >= STATUS_BOARD_MAX_WRITES_PER_CYCLE:
+                    break
+                writes += 1
+                embeds = self.build_status_board_embeds(message_pages)
+                try:
+                    if index < len(message_ids) and message_ids[index] is not None:
+                        await channel.get_partial_message(message_ids[index]).edit(embeds=embeds)
+                    else:
+                        message = await channel.send(embeds=embeds)
+                        if index < len(message_ids):
+                            message_ids[index] = message.id
+                        else:
+                            message_ids.append(message.id)
+                            hashes.append("")
+                        try:
+                            await message.pin()
+                        except Exception:
+                            pass
+                except Exception as exc:
+                    if getattr(exc, "status", None) == 404 and index < len(message_ids):
+                        # Someone deleted the board message; post a replacement next time.
+                        message_ids[index] = None
+                        hashes[index] = ""
+                        changed = True
+                    elif getattr(exc, "status", None) == 403:
+                        cache.invalidate(("channel", board["channel_id"]), exc)
+                    LOGGER.warning("Failed to update %s status board message %s: %s", policy_name, index + 1, exc)
+                    continue
+                hashes[index] = content_hash
+                changed = True
+
+            # The roster shrank: remove surplus board messages while budget remains.
+            while len(message_ids) > len(messages) and writes < STATUS_BOARD_MAX_WRITES_PER_CYCLE:
+                message_id = message_ids.pop()
+                hashes.pop()
+                changed = True
+                if message_id is None:
+                    continue
+                writes += 1
+                try:
+                    await channel.get_partial_message(message_id).delete()
+                except Exception as exc:
+                    LOGGER.warning("Failed to delete surplus %s status board message: %s", policy_name, exc)
+        if changed:
+            self.save_status_boards()
+        return writes
+
+    def sync_milestone_member(self, username_lc: str, st: dict):
+        """Mirror one member's tracked offline window into the milestone arrays."""
+        policy = POLICIES.get(st.get("policy"))
+        offline_since = st.get("offline_since")
+        tracking = (
+            policy is not None
+            and st.get("was_online") is False
+            and offline_since is not None
+            and (st.get("profile") or {}).get("profileVisible") is not False
+        )
+        sent_level = max((policy.rank(alert_key) for alert_key in st.get("sent_alerts") or ()), default=0) if policy else 0
+        self.milestone_batch.update(
+            username_lc,
+            st.get("policy"),
+            offline_since.timestamp() if tracking else None,
+            sent_level,
+        )
+
+    def rebuild_milestone_batch(self):
+        """Rebuild the milestone arrays from in-memory state (startup, reload, policy change)."""
+        self.milestone_batch = MilestoneBatch(POLICIES)
+        for username_lc, st in self._state.items():
+            self.sync_milestone_member(username_lc, st)
+
+    async def send_due_milestones(self, now_epoch: float | None = None) -> int:
+        """Alert every member whose offline window crossed an unsent milestone.
+
+        Uses the profile fields cached by the last sweep, so no Habbo request is
+        made; the sweep's own check and this tick share ``sent_alerts``, so a
+        milestone is alerted once whichever notices it first.
+        """
+        batch = self.milestone_batch
+        sent_count = 0
+        for username_lc, policy_name, level in batch.due(time.time() if now_epoch is None else now_epoch):
+            st = self._state.get(username_lc)
+            if not st or not st.get("profile"):
+                continue
+            milestone = self.policy_for(policy_name).milestones[level - 1]
+            if milestone.key not in st["sent_alerts"]:
+                profile = st["profile"]
+                name = profile.get("name") or username_lc
+                status = MemberStatus(name, False, True, milestone.title, milestone.key)
+                embed = self.render_status_embed(profile, status, st.get("offline_since"), policy_name)
+                await self.notify_user(embed, policy_name, alert_key=milestone.key, username_lc=username_lc)
+                st["sent_alerts"].add(milestone.key)
+                self.mark_persisted_alert_sent(username_lc, name, policy_name, milestone.key)
+                sent_count += 1
+            batch.mark_sent(username_lc, level)
+        if sent_count:
+            self.save_offline_records()
+        return sent_count
+
+    @tasks.loop(seconds=MILESTONE_TICK_SECONDS)
+    async def milestone_tick(self):
+        await self.send_due_milestones()
+
+    @milestone_tick.before_loop
+    async def before_milestone_tick(self):
+        await self.bot.wait_until_ready()
+
+    async def sweep_member(
+        self,
+        username_lc: str,
+        requested_username: str,
+        policy_name: str | None,
+        unavailable_usernames: list[str],
+    ):
+        """Fetch and evaluate one member, sending any due default and tenant alerts.
+
+        ``policy_name`` is None for members only other tenants watch: they are
+        evaluated under a tenant's policy from in-memory state, get no default
+        alert, and are kept out of the owner's audit JSON.
+        """
+        failure_streaks = self._profile_failure_streaks
+        default_policy = policy_name
+        audited = default_policy is not None
+        if policy_name is None:
+            policy_name = next(
+                (tenant_roster[username_lc][1] for tenant_roster in self.current_tenant_rosters().values() if username_lc in tenant_roster),
+                next(iter(POLICIES)),
+            )
+        # Routine scans make exactly one profile request per person. Retrying
+        # everyone during an outage only increases load and failure noise.
+        user_json = await self.fetch_habbo_user_forced(
+            requested_username,
+            attempts=1,
+            hotel=self.member_hotel(username_lc),
+            max_age=SHARED_OBSERVATION_MAX_AGE_SECONDS,
+        )
+        if not user_json:
+            # A brief Habbo API outage can affect the entire roster at once.
+            # Keep the last known state (avoiding a false transition after
+            # recovery) and report all failures in one throttled summary.
+            failure_streaks[username_lc] = failure_streaks.get(username_lc, 0) + 1
+            if failure_streaks[username_lc] >= PROFILE_FAILURE_ALERT_THRESHOLD:
+                unavailable_usernames.append(requested_username)
+            self.mark_sweep_member_checked(username_lc)
+            return
+
+        # A successful response ends the consecutive-failure window, so a
+        # later isolated failure does not inherit an old outage's count.
+        failure_streaks.pop(username_lc, None)
+
+        st = self._state.get(
+            username_lc,
+            {
+                "was_online": None,
+                "offline_since": None,
+                # Seed dedupe state from JSON so restarting the bot does
+                # not resend an embed for an already-reported issue.
+                "sent_alerts": self.get_persisted_sent_alerts(username_lc) if audited else set(),
+            },
+        )
+
+        # Normalize alert history to a set in case older state shape exists.
+        sent_alerts = st.get("sent_alerts")
+        if not isinstance(sent_alerts, set):
+            sent_alerts = set(sent_alerts or [])
+            st["sent_alerts"] = sent_alerts
+
+        previous_online = st.get("was_online")
+        is_online = user_json.get("online", user_json.get("isOnline")) is True
+        state_changed = False
+        display_name = user_json.get("name") or requested_username
+
+        # Compare Habbo lastAccessTime to the JSON on every one-minute scan.
+        was_corrected = audited and self.reconcile_last_access_for_user(username_lc, display_name, policy_name, user_json)
+        if was_corrected:
+            state_changed = True
+
+        if previous_online is None and (not is_online) and st.get("offline_since") is None:
+            if audited:
                 restored_offline_since = (
                     self.parse_iso(self.offline_records.get(username_lc, {}).get("current_offline_since"))
                     or self.parse_iso(self.logoff_times.get(username_lc))
                     or self.parse_iso(self.last_online_times.get(username_lc))
                 )
-                if restored_offline_since:
-                    st["offline_since"] = restored_offline_since
+            else:
+                # No audit JSON to restore from; Habbo's last access starts the window.
+                restored_offline_since = self.parse_habbo_last_access(user_json)
+            if restored_offline_since:
+                st["offline_since"] = restored_offline_since
+                if audited:
                     self.logoff_times.setdefault(username_lc, restored_offline_since.isoformat())
                     self.record_offline_start(username_lc, display_name, policy_name, restored_offline_since)
                     state_changed = True
                     st["sent_alerts"] = self.get_persisted_sent_alerts(username_lc)
 
-            # Transition flags are used to reset tracking only when state changes,
-            # preventing repeated alerts while status is unchanged.
-            went_online = previous_online is False and is_online
-            went_offline = previous_online is True and (not is_online)
-            went_offline_at = st.get("offline_since")
-
-            # Track only observed online->offline transitions.
-            if is_online:
-                # Continuously refresh last-online timestamp while online so it is durable across restarts.
-                observed_at = datetime.now(timezone.utc)
-                self.last_online_times[username_lc] = observed_at.isoformat()
-                self.record_online_observation(username_lc, display_name, policy_name, observed_at)
-                state_changed = True
+        # Transition flags are used to reset tracking only when state changes,
+        # preventing repeated alerts while status is unchanged.
+        went_online = previous_online is False and is_online
+        went_offline = previous_online is True and (not is_online)
+        went_offline_at = st.get("offline_since")
+        now = datetime.now(timezone.utc)
 
-            if went_offline:
-                # Start offline tracking from the last observed online timestamp stored on disk.
-                # If that value is missing/corrupt, fall back to now to keep tracking functional.
-                persisted_last_online = self.parse_iso(self.last_online_times.get(username_lc))
-                st["offline_since"] = persisted_last_online or datetime.now(timezone.utc)
-                st["sent_alerts"] = set()
+        # Track only observed online->offline transitions. The state is the
+        # same for every member; only default-tenant members are written to
+        # the audit JSON.
+        if is_online:
+            # Continuously refresh the last-online time while online; an
+            # offline window starts there.
+            st["last_online_at"] = now
+            if audited:
+                # Persisted so it is durable across restarts.
+                self.last_online_times[username_lc] = now.isoformat()
+                self.record_online_observation(username_lc, display_name, policy_name, now)
+                state_changed = True
 
+        if went_offline:
+            # Start offline tracking from the last observed online time. Older
+            # state may only have it on disk; if it is missing/corrupt, fall
+            # back to now to keep tracking functional.
+            st["offline_since"] = (
+                st.pop("last_online_at", None) or self.parse_iso(self.last_online_times.get(username_lc)) or now
+            )
+            st["sent_alerts"] = set()
+            if audited:
                 # Persist an explicit logoff timestamp for the active->offline transition.
-                transition_at = datetime.now(timezone.utc)
-                self.logoff_times[username_lc] = transition_at.isoformat()
+                self.logoff_times[username_lc] = now.isoformat()
                 self.record_offline_start(username_lc, display_name, policy_name, st["offline_since"])
                 state_changed = True
-            elif went_online:
-                # Returning online ends the current offline tracking window.
-                back_online_at = datetime.now(timezone.utc)
+        elif went_online:
+            # Returning online ends the current offline tracking window.
+            st["offline_since"] = None
+            st["sent_alerts"] = set()
+            if audited:
                 if went_offline_at:
-                    self.record_offline_end(username_lc, display_name, policy_name, went_offline_at, back_online_at)
+                    self.record_offline_end(username_lc, display_name, policy_name, went_offline_at, now)
                 else:
-                    self.record_online_observation(username_lc, display_name, policy_name, back_online_at)
-
-                st["offline_since"] = None
-                st["sent_alerts"] = set()
-
+                    self.record_online_observation(username_lc, display_name, policy_name, now)
                 # Clear last logoff marker once they are active again.
                 self.logoff_times.pop(username_lc, None)
                 state_changed = True
 
-            embed, _, alert_key, name, avatar_url = self.evaluate_user(
-                user_json,
-                username_lc,
-                st.get("offline_since"),
-                policy_name,
+        # Most members need no alert, so classify first and only render an
+        # embed for an alert that is actually going out.
+        status = self.evaluate_status(user_json, username_lc, st.get("offline_since"), policy_name)
+        alert_key = status.alert_key
+
+        # Send milestone/profile-hidden alerts only once per tracking window.
+        # Defer a threshold alert until the next scan after reconciliation;
+        # this lets the corrected offline start drive a fresh evaluation.
+        if was_corrected:
+            alert_key = None
+        if default_policy and alert_key and alert_key not in st["sent_alerts"]:
+            embed = self.render_status_embed(user_json, status, st.get("offline_since"), policy_name)
+            await self.notify_user(embed, policy_name, alert_key=alert_key, username_lc=username_lc)
+            st["sent_alerts"].add(alert_key)
+            self.mark_persisted_alert_sent(username_lc, display_name, policy_name, alert_key)
+            state_changed = True
+
+        # Send one recovery message when user comes back online.
+        if default_policy and went_online:
+            back_embed = self.make_back_online_embed(
+                status.name, self.avatar_url_for(user_json, status.name), went_offline_at, self.profile_base_url(user_json)
             )
+            await self.notify_user(back_embed, policy_name)
 
-            # Send milestone/profile-hidden alerts only once per tracking window.
-            # Defer a threshold alert until the next scan after reconciliation;
-            # this lets the corrected offline start drive a fresh evaluation.
-            if was_corrected:
-                alert_key = None
-            if alert_key and alert_key not in st["sent_alerts"]:
-                await self.notify_user(embed, policy_name)
-                st["sent_alerts"].add(alert_key)
-                self.mark_persisted_alert_sent(username_lc, display_name, policy_name, alert_key)
-                state_changed = True
+        st["was_online"] = is_online
+        st["policy"] = default_policy
+        self.remember_profile(st, user_json)
+        self._state[username_lc] = st
+        self.sync_milestone_member(username_lc, st)
 
-            # Send one recovery message when user comes back online.
-            if went_online:
-                back_embed = self.make_back_online_embed(name, avatar_url, went_offline_at)
-                await self.notify_user(back_embed, policy_name)
+        if self.notify_tenants(username_lc, user_json, st, went_online, went_offline_at, defer_alerts=was_corrected):
+            self.save_tenant_alerts()
 
-            st["was_online"] = is_online
-            self._state[username_lc] = st
+        if state_changed:
+            self.save_last_online_times()
+            self.save_logoff_times()
+            self.save_offline_records()
+        self.mark_sweep_member_checked(username_lc)
+
+    # Five-minute polling cuts routine group/profile traffic by 80% compared
+    # with the previous one-minute cycle, without affecting hour/day alerts.
+    @tasks.loop(minutes=PERIODIC_CHECK_INTERVAL_MINUTES)
+    async def periodic_check(self):
+        unavailable_usernames: list[str] = []
 
-            if state_changed:
-                self.save_last_online_times()
-                self.save_logoff_times()
-                self.save_offline_records()
+        # Check each unique watched user once using roster casing for Habbo lookups.
+        # A sweep interrupted by a reload/restart resumes with its saved roster,
+        # skipping members already checked and starting with the most overdue.
+        roster = await self.begin_sweep()
+        # Hotels have independent rate budgets, so each hotel's members are
+        # swept by their own sequential worker and the workers run in parallel.
+        # Members watched by several tenants are fetched once for all of them.
+        members = self.sweep_members(roster, self.current_tenant_rosters())
+        by_hotel: dict[str, list[str]] = {}
+        for username_lc in self.sweep_order(members):
+            by_hotel.setdefault(self.member_hotel(username_lc), []).append(username_lc)
+
+        async def sweep_hotel(usernames: list[str]):
+            for username_lc in usernames:
+                requested_username, policy_name = members[username_lc]
+                await self.sweep_member(username_lc, requested_username, policy_name, unavailable_usernames)
+
+        await asyncio.gather(*(sweep_hotel(usernames) for usernames in by_hotel.values()))
+
+        self.finish_sweep()
+        try:
+            await self.refresh_status_boards(roster)
+        except Exception:
+            # A broken board must never stop the sweep loop or the failure summary.
+            LOGGER.exception("Failed to refresh watcher status boards")
 
         if unavailable_usernames:
             preview = ", ".join(unavailable_usernames[:10])
@@ -1180,25 +2331,116 @@ class HabboWatch(commands.Cog):
     async def before_periodic(self):
         await self.bot.wait_until_ready()
 
-    @app_commands.command(name="check", description="Check one Habbo user, or leave blank to upload everyone watched.")
-    @app_commands.describe(username="Optional username; leave blank to post current embeds for everyone")
-    async def habbo_check(self, interaction: discord.Interaction, username: str | None = None):
+    def profile_not_found_embed(self, username: str) -> discord.Embed:
+        embed = discord.Embed(
+            title="Profile Not Found",
+            description=f"## Habbo: {username}\n## Last Seen: Unknown\n## Details: No public profile found or invalid username.",
+            colour=discord.Colour.red(),
+            timestamp=datetime.now(timezone.utc),
+        )
+        embed.set_footer(text=f"{self.bot.user.name}")
+        return embed
+
+    async def check_usernames(self, usernames: list[str], hotel: str, publish) -> list[discord.Embed]:
+        """Look several users up together and hand the embeds to ``publish`` as they arrive.
+
+        Every lookup is scheduled at once at interactive priority, so the
+        hotel's limiter serves them ahead of sweep traffic, and a profile that
+        is cached or already being fetched is reused. ``publish(embeds, done)``
+        receives the finished embeds in input order, throttled, and once more
+        when all are done.
+        """
+        embeds: list[discord.Embed | None] = [None] * len(usernames)
+
+        async def lookup(index: int, username: str):
+            user_json = await self.fetch_habbo_user(
+                username, hotel, max_age=MULTI_CHECK_MAX_AGE_SECONDS, priority=PRIORITY_INTERACTIVE
+            )
+            return index, username, user_json
+
+        pending = {asyncio.ensure_future(lookup(index, username)) for index, username in enumerate(usernames)}
+        last_published = time.monotonic()
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    index, username, user_json = task.result()
+                    if user_json:
+                        # Same neutral MOD display as a single-user check; no milestone fires.
+                        embeds[index] = self.evaluate_user(user_json, username, None, "MOD")[0]
+                    else:
+                        embeds[index] = self.profile_not_found_embed(username)
+                if pending and time.monotonic() - last_published >= MULTI_CHECK_EDIT_INTERVAL_SECONDS:
+                    last_published = time.monotonic()
+                    await publish([embed for embed in embeds if embed is not None], len(usernames) - len(pending))
+        finally:
+            for task in pending:
+                task.cancel()
+        await publish(embeds, len(usernames))
+        return embeds
+
+    async def reply_with_checks(self, interaction: discord.Interaction, usernames: list[str], hotel: str, skipped: list[str]):
+        """Answer a multi-user /check with one message that fills in as lookups complete."""
+        total = len(usernames)
+        note = f" Skipped (more than {MULTI_CHECK_LIMIT}): {', '.join(skipped)}." if skipped else ""
+        message = await interaction.followup.send(f"Checking {total} user(s)…{note}", ephemeral=True, wait=True)
+
+        async def publish(embeds: list[discord.Embed], done: int):
+            status = "Check Complete" if done == total else f"Checked {done}/{total}…"
+            try:
+                await message.edit(content=status + note, embeds=embeds)
+            except discord.HTTPException as exc:
+                LOGGER.warning("Unable to update /check reply: %s", exc)
+
+        await self.check_usernames(usernames, hotel, publish)
+
+    @app_commands.command(name="check", description="Check Habbo users, or leave blank to post a digest of everyone watched.")
+    @app_commands.describe(
+        username="One username posts to the alert channel; several (comma/space separated) reply only to you",
+        digest="When checking everyone, post compact digest pages (default) instead of one embed per member",
+        hotel="Hotel for a single-user check, e.g. com, de, es or com.br (default com)",
+    )
+    async def habbo_check(
+        self,
+        interaction: discord.Interaction,
+        username: str | None = None,
+        digest: bool = True,
+        hotel: str | None = None,
+    ):
+        """Check one or more users, or everyone watched when no username is given.
+
+        A single username keeps the long-standing behaviour of posting its
+        embed to the alert channel (or owner DM) for the team to see. Several
+        usernames are a private lookup: one ephemeral reply that fills in as
+        the profiles arrive, so a shortlist does not flood the alert channel.
+        """
         await interaction.response.defer(thinking=True, ephemeral=True)
+        try:
+            hotel = normalize_hotel(hotel)
+        except ValueError as exc:
+            await interaction.followup.send(str(exc), ephemeral=True)
+            return
+        if not username and digest:
+            summary = await self.upload_status_digest()
+            await interaction.followup.send(self.format_digest_summary(*summary), ephemeral=True)
+            return
         if not username:
             sent_count, _unavailable_count, unavailable_usernames = await self.force_upload_all_embeds()
             await interaction.followup.send(self.format_force_check_summary(sent_count, unavailable_usernames), ephemeral=True)
             return
 
-        user_json = await self.fetch_habbo_user_forced(username)
+        unique: dict[str, str] = {}
+        for name in self.split_usernames(username):
+            unique.setdefault(name.lower(), name)
+        usernames = list(unique.values())
+        if len(usernames) > 1:
+            await self.reply_with_checks(interaction, usernames[:MULTI_CHECK_LIMIT], hotel, usernames[MULTI_CHECK_LIMIT:])
+            return
+
+        username = usernames[0] if usernames else username
+        user_json = await self.fetch_habbo_user_forced(username, hotel=hotel, priority=PRIORITY_INTERACTIVE)
         if not user_json:
-            embed = discord.Embed(
-                title="Profile Not Found",
-                description=f"## Habbo: {username}\n## Last Seen: Unknown\n## Details: No public profile found or invalid username.",
-                colour=discord.Colour.red(),
-                timestamp=datetime.now(timezone.utc),
-            )
-            embed.set_footer(text=f"{self.bot.user.name}")
-            await self.notify_user(embed)
+            await self.notify_user(self.profile_not_found_embed(username))
             await interaction.followup.send("Check Complete", ephemeral=True)
             return
 
@@ -1271,29 +2513,259 @@ class HabboWatch(commands.Cog):
 
         await interaction.followup.send(message, ephemeral=True)
 
-    async def _set_policy_alert_channels(self, ctx: commands.Context, policy_name: str, channels: tuple[discord.TextChannel, ...]):
+    @habbo_check.autocomplete("username")
+    @offline_times.autocomplete("usernames")
+    @habbo_json_update.autocomplete("username")
+    async def username_autocomplete(self, interaction: discord.Interaction, current: str) -> list[app_commands.Choice[str]]:
+        """Suggest watched and recorded usernames so typos never reach the Habbo API."""
+        return [app_commands.Choice(name=name, value=name) for name in self.username_choices(current)]
+
+    async def _set_policy_alert_channels(
+        self,
+        ctx: commands.Context,
+        policy_name: str,
+        channels: tuple[discord.TextChannel, ...],
+        delivery_mode: str | None = None,
+    ):
         """Shared implementation for text commands that route policy alerts."""
         target_channels = channels or (ctx.channel,)
         try:
-            channel_ids = self.configure_alert_channels(policy_name, target_channels)
+            channel_ids = self.configure_alert_channels(policy_name, target_channels, delivery_mode)
         except ValueError as exc:
             await ctx.send(str(exc), delete_after=10)
             return
 
         mentions = ", ".join(f"<#{channel_id}>" for channel_id in channel_ids)
-        await ctx.send(f"{policy_name} Habbo alerts will now be sent to: {mentions}.", delete_after=10)
+        via = " via webhook" if self.alert_delivery_mode_for_policy(policy_name) == "webhook" else ""
+        await ctx.send(f"{policy_name} Habbo alerts will now be sent to: {mentions}{via}.", delete_after=10)
 
     @commands.command(name="setmod")
     @commands.is_owner()
-    async def set_mod_alert_channel(self, ctx: commands.Context, *channels: discord.TextChannel):
-        """Set one or more MOD alert channels; defaults to the current channel."""
-        await self._set_policy_alert_channels(ctx, "MOD", channels)
+    async def set_mod_alert_channel(
+        self,
+        ctx: commands.Context,
+        mode: Optional[Literal["webhook", "bot"]] = None,
+        *channels: discord.TextChannel,
+    ):
+        """Set one or more MOD alert channels; defaults to the current channel.
+
+        Prefix the channels with ``webhook`` to deliver through channel webhooks,
+        or ``bot`` to switch back to normal bot messages.
+        """
+        await self._set_policy_alert_channels(ctx, "MOD", channels, mode)
 
     @commands.command(name="setooa")
     @commands.is_owner()
-    async def set_ooa_alert_channel(self, ctx: commands.Context, *channels: discord.TextChannel):
-        """Set one or more OOA alert channels; defaults to the current channel."""
-        await self._set_policy_alert_channels(ctx, "OOA", channels)
+    async def set_ooa_alert_channel(
+        self,
+        ctx: commands.Context,
+        mode: Optional[Literal["webhook", "bot"]] = None,
+        *channels: discord.TextChannel,
+    ):
+        """Set one or more OOA alert channels; defaults to the current channel.
+
+        Prefix the channels with ``webhook`` to deliver through channel webhooks,
+        or ``bot`` to switch back to normal bot messages.
+        """
+        await self._set_policy_alert_channels(ctx, "OOA", channels, mode)
+
+    @commands.command(name="habboboard")
+    @commands.is_owner()
+    async def set_status_board(
+        self,
+        ctx: commands.Context,
+        policy_name: str,
+        disable: Optional[Literal["off"]] = None,
+        channel: Optional[discord.TextChannel] = None,
+    ):
+        """Post a live status board for MOD or OOA in a channel (default: here).
+
+        Use ``habboboard MOD off`` to stop updating that policy's board.
+        """
+        policy_name = policy_name.strip().upper()
+        if policy_name not in POLICIES:
+            await ctx.send(f"Unknown policy `{policy_name}`; use one of: {', '.join(POLICIES)}.", delete_after=10)
+            return
+        if disable:
+            self.status_boards.pop(policy_name, None)
+            self.save_status_boards()
+            await ctx.send(f"{policy_name} status board disabled.", delete_after=10)
+            return
+
+        target_channel = channel or ctx.channel
+        self.status_boards[policy_name] = {"channel_id": target_channel.id, "message_ids": [], "hashes": []}
+        self.save_status_boards()
+        await self.refresh_status_boards()
+        await ctx.send(
+            f"{policy_name} status board will be kept up to date in <#{target_channel.id}> after each check.",
+            delete_after=10,
+        )
+
+    @commands.command(name="habbogroups")
+    @commands.is_owner()
+    async def manage_watched_groups(
+        self,
+        ctx: commands.Context,
+        action: Optional[Literal["add", "remove"]] = None,
+        group_id: Optional[str] = None,
+        policy_name: Optional[str] = None,
+        precedence: int = 0,
+    ):
+        """List watched groups, or ``add <group_id> <policy> [precedence]`` / ``remove <group_id>``."""
+        if action == "add":
+            policy = str(policy_name or "").strip().upper()
+            if not group_id or policy not in POLICIES:
+                await ctx.send(f"Usage: habbogroups add <group_id> <{'|'.join(POLICIES)}> [precedence]", delete_after=10)
+                return
+            if hotel_from_identifier(group_id) is None:
+                # The hotel is read from the ID prefix, e.g. g-hhde-… for habbo.de.
+                await ctx.send(f"Unrecognised hotel in group ID `{group_id}`.", delete_after=10)
+                return
+            self.watched_groups = [group for group in self.watched_groups if group.group_id != group_id]
+            self.watched_groups.append(WatchedGroup(group_id, policy, precedence))
+            self.save_watched_groups()
+        elif action == "remove":
+            remaining = [group for group in self.watched_groups if group.group_id != group_id]
+            if len(remaining) == len(self.watched_groups) or not remaining:
+                await ctx.send("That group is not watched (or is the last watched group).", delete_after=10)
+                return
+            self.watched_groups = remaining
+            self._group_roster_cache.pop(group_id, None)
+            self.save_watched_groups()
+
+        lines = [
+            f"`{group.group_id}` ({self.group_hotel(group.group_id)}) → {group.policy} (precedence {group.precedence})"
+            for group in sorted(self.watched_groups, key=lambda group: -group.precedence)
+        ]
+        await ctx.send("Watched Habbo groups:\n" + "\n".join(lines), delete_after=30)
+
+    @staticmethod
+    def format_tenant_summary(tenant: WatchTenant | None) -> str:
+        """Describe one guild's watcher configuration."""
+        if tenant is None or not (tenant.groups or tenant.channels):
+            return "This server does not watch any Habbo groups."
+        lines = [
+            f"`{group.group_id}` → {group.policy} (precedence {group.precedence})"
+            for group in sorted(tenant.groups, key=lambda group: -group.precedence)
+        ] or ["No watched groups."]
+        for policy_name, channel_ids in sorted(tenant.channels.items()):
+            lines.append(f"{policy_name} alerts: {', '.join(f'<#{channel_id}>' for channel_id in channel_ids) or 'none'}")
+        return "\n".join(lines)
+
+    @commands.command(name="habbowatch")
+    @commands.guild_only()
+    @commands.has_guild_permissions(manage_guild=True)
+    async def manage_tenant(
+        self,
+        ctx: commands.Context,
+        action: Optional[Literal["group", "ungroup", "channel", "off"]] = None,
+        target: Optional[str] = None,
+        policy_name: Optional[str] = None,
+        precedence: int = 0,
+    ):
+        """Configure this server's own watcher.
+
+        ``group <group_id> <policy> [precedence]`` / ``ungroup <group_id>`` set
+        the watched groups, ``channel <policy>`` sends that policy's alerts to
+        the current channel (run again to stop), and ``off`` removes the server.
+        Members shared with other servers are still fetched once per sweep.
+        A server may watch ``TENANT_MAX_GROUPS`` groups and ``TENANT_MAX_MEMBERS``
+        members the owner does not already watch.
+        """
+        tenants = self.tenants
+        guild_id = ctx.guild.id
+        tenant = tenants.get(guild_id) or WatchTenant(guild_id, (), {})
+        if action == "group":
+            policy = str(policy_name or "").strip().upper()
+            if not target or policy not in POLICIES or hotel_from_identifier(target) is None:
+                await ctx.send(f"Usage: habbowatch group <group_id> <{'|'.join(POLICIES)}> [precedence]", delete_after=10)
+                return
+            groups = [group for group in tenant.groups if group.group_id != target]
+            if len(groups) >= TENANT_MAX_GROUPS:
+                await ctx.send(f"This server already watches {TENANT_MAX_GROUPS} groups; remove one first.", delete_after=10)
+                return
+            # Tenant members are swept on the owner's budget: refuse a group that
+            # would push this server past its member allowance.
+            owner_roster = (self._sweep or {}).get("roster") or {}
+            current = self._tenant_rosters.get(guild_id, {})
+            added = self.merge_group_rosters([WatchedGroup(target, policy, precedence)], [await self.fetch_group_roster(target)])
+            extras = {username_lc for username_lc in {**current, **added} if username_lc not in owner_roster}
+            if len(extras) > TENANT_MAX_MEMBERS:
+                await ctx.send(
+                    f"That would give this server {len(extras)} watched members; the limit is {TENANT_MAX_MEMBERS}.",
+                    delete_after=10,
+                )
+                return
+            tenant = tenant._replace(groups=tuple(groups) + (WatchedGroup(target, policy, precedence),))
+        elif action == "ungroup":
+            tenant = tenant._replace(groups=tuple(group for group in tenant.groups if group.group_id != target))
+        elif action == "channel":
+            policy = str(target or "").strip().upper()
+            if policy not in POLICIES:
+                await ctx.send(f"Usage: habbowatch channel <{'|'.join(POLICIES)}>", delete_after=10)
+                return
+            channel_ids = list(tenant.channels.get(policy) or [])
+            if ctx.channel.id in channel_ids:
+                channel_ids.remove(ctx.channel.id)
+            else:
+                channel_ids.append(ctx.channel.id)
+            tenant = tenant._replace(channels={**tenant.channels, policy: channel_ids})
+        elif action == "off":
+            tenant = None
+
+        if action:
+            if tenant is None or not (tenant.groups or any(tenant.channels.values())):
+                tenants.pop(guild_id, None)
+                tenant = None
+            else:
+                tenants[guild_id] = tenant
+            self.save_tenants()
+        await ctx.send(self.format_tenant_summary(tenant), delete_after=30)
+
+    @staticmethod
+    def format_policy_summary(policies: dict[str, Policy]) -> str:
+        """Describe loaded policies and their milestone thresholds for the owner."""
+        lines = []
+        for policy_name, policy in policies.items():
+            thresholds = ", ".join(
+                f"{milestone.threshold_days * 24:g}h {milestone.severity}" for milestone in policy.milestones
+            ) or "no milestones"
+            lines.append(f"{policy_name}: allowed {policy.allowed_days:g} day(s); {thresholds}")
+        return "\n".join(lines)
+
+    @commands.command(name="habbopolicies")
+    @commands.is_owner()
+    async def reload_policies(self, ctx: commands.Context):
+        """Reload JSON/habbo_policies.json and show the compiled milestone tables."""
+        # Update in place so helpers holding the module-level mapping see the change.
+        policies = load_policies(POLICY_CONFIG_FILE)
+        POLICIES.clear()
+        POLICIES.update(policies)
+        self.milestone_batch.set_policies(POLICIES)
+        # Cached and checkpointed rosters carry policy names; fetch them again.
+        self._status_board_roster = None
+        self.finish_sweep()
+        await ctx.send(f"Habbo policies loaded:\n{self.format_policy_summary(POLICIES)}", delete_after=30)
+
+    @staticmethod
+    def format_outbox_stats(stats: dict) -> str:
+        """Summarize alert outbox depth and latency for the owner text command."""
+
+        def seconds(value: float | None) -> str:
+            return "n/a" if value is None else f"{value:.1f}s"
+
+        return (
+            f"Habbo alert outbox: {stats['queue_depth']} embed(s) queued for {stats['destinations']} destination(s). "
+            f"Sent {stats['sent_embeds']} embed(s) in {stats['sent_messages']} message(s); {stats['failed_embeds']} failed. "
+            f"Send latency: last {seconds(stats['last_latency'])}, average {seconds(stats['average_latency'])}, "
+            f"max {seconds(stats['max_latency'] if stats['sent_embeds'] else None)}."
+        )
+
+    @commands.command(name="habbooutbox")
+    @commands.is_owner()
+    async def habbo_outbox_stats(self, ctx: commands.Context):
+        """Show the alert outbox queue depth and send latency."""
+        await ctx.send(self.format_outbox_stats(self.outbox.stats()), delete_after=30)
 
 
 async def setup(bot: commands.Bot):
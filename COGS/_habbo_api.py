@@ -0,0 +1,205 @@
+"""Habbo hotel registry and per-hotel HTTP clients with independent rate budgets.
+
+Every Habbo hotel serves the same public API from its own domain, and IDs carry
+the hotel in their prefix (``hhus-…`` user IDs, ``g-hhde-…`` group IDs). Each
+hotel gets its own pooled ``aiohttp`` session and ``RateLimiter``, so requests
+to ``.de`` never wait behind ``.com`` and a 429 from one hotel only pauses
+that hotel.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from typing import Any, Callable
+from urllib.parse import urlsplit
+
+LOGGER = logging.getLogger(__name__)
+
+# hotel code -> (site URL, unique ID prefix)
+HOTELS = {
+    "com": ("https://www.habbo.com", "hhus"),
+    "com.br": ("https://www.habbo.com.br", "hhbr"),
+    "com.tr": ("https://www.habbo.com.tr", "hhtr"),
+    "de": ("https://www.habbo.de", "hhde"),
+    "es": ("https://www.habbo.es", "hhes"),
+    "fi": ("https://www.habbo.fi", "hhfi"),
+    "fr": ("https://www.habbo.fr", "hhfr"),
+    "it": ("https://www.habbo.it", "hhit"),
+    "nl": ("https://www.habbo.nl", "hhnl"),
+}
+DEFAULT_HOTEL = "com"
+HOTEL_BY_PREFIX = {prefix: hotel for hotel, (_url, prefix) in HOTELS.items()}
+HOTEL_BY_HOST = {urlsplit(url).hostname: hotel for hotel, (url, _prefix) in HOTELS.items()}
+REQUEST_TIMEOUT_SECONDS = 20
+# At most one request per second to each hotel. Every Habbo cog shares this
+# budget through the bot's observation bus (COGS/_habbo_observations.py).
+REQUEST_INTERVAL_SECONDS = 1.0
+# Limiter priorities; lower values get the next request slot first, so an
+# operator's /check is not queued behind a whole sweep.
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 1
+
+
+def normalize_hotel(raw: str | None) -> str:
+    """Return a hotel code from ``de``, ``.de``, ``habbo.de`` or ``www.habbo.com.br``.
+
+    Raises ValueError for hotels that are not in the registry.
+    """
+    text = str(raw or DEFAULT_HOTEL).strip().lower()
+    for prefix in ("https://", "http://", "www.", "habbo", "."):
+        if text.startswith(prefix):
+            text = text[len(prefix):]
+    text = text.rstrip("/")
+    if text in HOTELS:
+        return text
+    raise ValueError(f"Unknown Habbo hotel `{raw}`; use one of: {', '.join(HOTELS)}.")
+
+
+def hotel_base_url(hotel: str) -> str:
+    return HOTELS[hotel][0]
+
+
+def hotel_from_identifier(identifier: str | None) -> str | None:
+    """Return the hotel encoded in a user (``hhde-…``) or group (``g-hhde-…``) ID."""
+    if not identifier:
+        return None
+    parts = str(identifier).strip().lower().split("-")
+    prefix = parts[1] if parts[0] == "g" and len(parts) > 2 else parts[0]
+    return HOTEL_BY_PREFIX.get(prefix)
+
+
+def hotel_from_url(url: str) -> str:
+    return HOTEL_BY_HOST.get(urlsplit(url).hostname, DEFAULT_HOTEL)
+
+
+class RateLimiter:
+    """Space requests at least ``interval`` seconds apart, with server-imposed pauses.
+
+    Waiters take turns by priority, then arrival order. A waiter already
+    sleeping out the interval keeps its slot; a higher-priority arrival gets
+    the one after it.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.next_request_at = 0.0
+        # End of the latest server-imposed pause; normal spacing never moves it.
+        self.deferred_until = 0.0
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._busy = False
+
+    async def wait(self, priority: int = PRIORITY_BACKGROUND):
+        if self._busy:
+            turn = asyncio.get_running_loop().create_future()
+            heapq.heappush(self._waiters, (priority, next(self._sequence), turn))
+            try:
+                await turn
+            except asyncio.CancelledError:
+                if turn.done() and not turn.cancelled():
+                    # Cancelled after being handed the turn: pass it on.
+                    self._release()
+                raise
+        self._busy = True
+        try:
+            delay = self.next_request_at - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self.next_request_at = time.monotonic() + self.interval
+        finally:
+            self._release()
+
+    def _release(self):
+        while self._waiters:
+            _priority, _sequence, turn = heapq.heappop(self._waiters)
+            if not turn.done():
+                # The turn passes straight to the waiter; the limiter stays busy.
+                turn.set_result(None)
+                return
+        self._busy = False
+
+    def defer(self, seconds: float):
+        """Hold every later request for at least ``seconds`` (e.g. ``Retry-After``)."""
+        self.deferred_until = max(self.deferred_until, time.monotonic() + seconds)
+        self.next_request_at = max(self.next_request_at, self.deferred_until)
+
+    def remaining(self) -> float:
+        """Seconds left of a pause set through ``defer``; routine spacing is not a pause."""
+        return max(0.0, self.deferred_until - time.monotonic())
+
+
+class HabboApi:
+    """Per-hotel sessions and rate limiters; sessions are opened on first use."""
+
+    def __init__(self, request_interval: float, session_factory: Callable[[], Any] | None = None):
+        self.request_interval = request_interval
+        self._session_factory = session_factory or self._default_session
+        self._sessions: dict[str, Any] = {}
+        self._limiters: dict[str, RateLimiter] = {}
+
+    @staticmethod
+    def _default_session():
+        import aiohttp
+
+        return aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT_SECONDS))
+
+    def limiter(self, hotel: str) -> RateLimiter:
+        limiter = self._limiters.get(hotel)
+        if limiter is None:
+            limiter = self._limiters[hotel] = RateLimiter(self.request_interval)
+        return limiter
+
+    def session(self, hotel: str):
+        session = self._sessions.get(hotel)
+        if session is None or getattr(session, "closed", False):
+            session = self._sessions[hotel] = self._session_factory()
+        return session
+
+    async def get_json(
+        self,
+        url: str,
+        params: dict | None = None,
+        priority: int = PRIORITY_BACKGROUND,
+    ) -> tuple[int | None, Any]:
+        """GET a Habbo API URL under its hotel's budget; return ``(status, json)``.
+
+        ``status`` is None when the request itself failed. JSON is only parsed
+        for successful responses. A 429 pauses that hotel for ``Retry-After``.
+        """
+        hotel = hotel_from_url(url)
+        limiter = self.limiter(hotel)
+        try:
+            await limiter.wait(priority)
+            async with self.session(hotel).get(url, params=params) as resp:
+                if resp.status == 429:
+                    try:
+                        retry_after = max(1.0, float(resp.headers.get("retry-after", "1")))
+                    except (TypeError, ValueError):
+                        retry_after = 1.0
+                    limiter.defer(retry_after)
+                    LOGGER.warning("Habbo API rate limited %s; pausing %s requests for %.1f seconds", url, hotel, retry_after)
+                    return resp.status, None
+                if resp.status >= 400:
+                    return resp.status, None
+                if "json" not in resp.headers.get("content-type", ""):
+                    return resp.status, None
+                return resp.status, await resp.json()
+        except Exception as exc:
+            LOGGER.warning("Unable to fetch Habbo API JSON from %s with params %s: %s", url, params, exc)
+            return None, None
+
+    def cooldowns(self) -> dict[str, float]:
+        """Return the remaining server-imposed pause per hotel, in seconds."""
+        return {hotel: limiter.remaining() for hotel, limiter in self._limiters.items() if limiter.remaining() > 0}
+
+    def restore_cooldowns(self, cooldowns: dict[str, float]):
+        for hotel, seconds in (cooldowns or {}).items():
+            if hotel in HOTELS and isinstance(seconds, (int, float)) and seconds > 0:
+                self.limiter(hotel).defer(float(seconds))
+
+    async def close(self):
+        sessions, self._sessions = self._sessions, {}
+        for session in sessions.values():
+            await session.close()
@@ -0,0 +1,100 @@
+"""Set-based snapshots of a Habbo profile's badges, groups and selected badges.
+
+The scalar snapshot in HabboIdTracker ignores list properties. This module
+keeps them as sorted ID lists per tracked ID in
+``JSON/habbo_id_collections.json``::
+
+    {
+      "hhus-...": {
+        "digest": "3f1c...",            # profile_digest() when details were fetched
+        "checked_at": "2026-03-01T12:00:00+00:00",
+        "retry_at": "2026-03-01T12:15:00+00:00",  # only after a failed detail request
+        "failures": 1,                  # consecutive failed fetches, sets the backoff
+        "unavailable": ["badges"],      # details Habbo refused (hidden profile)
+        "selectedBadges": ["ACH_Login1", ...],
+        "badges": ["ACH_Login1", "ADM", ...],
+        "groups": ["g-hhus-...", ...],
+        "names": {"g-hhus-...": "Group name"}
+      }
+    }
+
+``selectedBadges`` comes with every profile response. The full badge and
+group lists need one detail request each, so they are only fetched when the
+profile's digest changed (achievements raise experience and usually award a
+badge) or the last fetch is older than the refresh interval, which is what
+eventually catches group joins and leaves. Failed fetches back off until
+``retry_at``, and refused details are only retried at the refresh interval.
+"""
+
+import hashlib
+import json
+from typing import Any, Iterable
+
+# Collection -> (detail endpoint under /api/public/users/{id}/ or None when the
+# profile carries it, identifying key of each item).
+COLLECTION_SOURCES = {
+    "selectedBadges": (None, "code"),
+    "badges": ("badges", "code"),
+    "groups": ("groups", "id"),
+}
+DETAIL_COLLECTIONS = tuple(field for field, (endpoint, _key) in COLLECTION_SOURCES.items() if endpoint)
+# Detail responses meaning the lists are not public rather than a passing failure.
+DETAILS_UNAVAILABLE_STATUSES = (403, 404)
+# Profile properties whose change suggests the detail collections changed too.
+DIGEST_PROPERTIES = ("totalExperience", "currentLevel", "starGemCount")
+COLLECTION_LABEL_LIMIT = 10
+
+
+def collection_ids(items: Any, key: str) -> list[str]:
+    """Return the sorted, de-duplicated IDs of an API list; non-lists give []."""
+    if not isinstance(items, list):
+        return []
+    return sorted({str(item[key]) for item in items if isinstance(item, dict) and item.get(key) is not None})
+
+
+def item_names(items: Any, key: str) -> dict[str, str]:
+    if not isinstance(items, list):
+        return {}
+    return {
+        str(item[key]): str(item["name"])
+        for item in items
+        if isinstance(item, dict) and item.get(key) is not None and item.get("name")
+    }
+
+
+def profile_digest(profile: dict[str, Any]) -> str:
+    selected = collection_ids(profile.get("selectedBadges"), COLLECTION_SOURCES["selectedBadges"][1])
+    payload = json.dumps([selected, [profile.get(name) for name in DIGEST_PROPERTIES]], sort_keys=True)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def diff_ids(old: Iterable[str], new: Iterable[str]) -> tuple[list[str], list[str]]:
+    """Return ``(added, removed)`` as sorted lists."""
+    old_set, new_set = set(old), set(new)
+    return sorted(new_set - old_set), sorted(old_set - new_set)
+
+
+def diff_collections(old: dict[str, Any], new: dict[str, Any], fields: Iterable[str]) -> dict[str, dict[str, list[str]]]:
+    """Describe added and removed items per collection, labelled with names where known.
+
+    Collections missing from ``old`` are a first baseline and are not reported.
+    """
+    names = {**(old.get("names") or {}), **(new.get("names") or {})}
+    differences = {}
+    for field in fields:
+        if field not in old or field not in new:
+            continue
+        added, removed = diff_ids(old[field], new[field])
+        if added or removed:
+            differences[field] = {
+                "added": [f"{names[item]} ({item})" if item in names else item for item in added],
+                "removed": [f"{names[item]} ({item})" if item in names else item for item in removed],
+            }
+    return differences
+
+
+def describe_items(items: list[str]) -> str:
+    shown = ", ".join(items[:COLLECTION_LABEL_LIMIT])
+    if len(items) > COLLECTION_LABEL_LIMIT:
+        shown += f" and {len(items) - COLLECTION_LABEL_LIMIT} more"
+    return shown or "None"
@@ -0,0 +1,472 @@
+"""Shared Discord delivery helpers for the Habbo cogs.
+
+Files in ``COGS/`` that start with an underscore are skipped by the extension
+discovery in ``bot.py``, so this module is imported by the cogs rather than
+loaded as a cog of its own.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+import heapq
+import itertools
+import logging
+import time
+from typing import Any, Awaitable, Callable, Hashable
+
+import discord
+
+LOGGER = logging.getLogger(__name__)
+
+# Discord accepts at most ten embeds and 6000 embed characters per message.
+MAX_EMBEDS_PER_MESSAGE = 10
+MAX_EMBED_CHARACTERS_PER_MESSAGE = 6000
+# Short enough that alerts still feel immediate, long enough for one sweep's
+# burst of milestone/"Back Online" embeds to share a handful of messages.
+DEFAULT_COALESCE_SECONDS = 1.5
+# Weight of the newest sample in the exponentially smoothed send latency.
+LATENCY_SMOOTHING = 0.2
+
+# Priority classes; lower values drain first when a destination is backed up.
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+PRIORITY_LOW = 2
+# Pause for a destination after Discord answers 429 without a Retry-After.
+DEFAULT_RATE_LIMIT_BACKOFF_SECONDS = 1.0
+
+# Bot attribute holding the DestinationCache shared by every Habbo cog. It lives
+# on the bot so the cache also survives hot reloads of the cogs themselves.
+DESTINATION_CACHE_ATTRIBUTE = "habbo_destination_cache"
+# Discord statuses meaning a cached channel/DM can no longer be used as-is.
+STALE_DESTINATION_STATUSES = (403, 404)
+# Bot attribute holding the pooled alert webhooks, keyed by channel ID.
+WEBHOOK_POOL_ATTRIBUTE = "habbo_webhook_pool"
+WEBHOOK_NAME = "Habbo Alerts"
+
+DestinationResolver = Callable[[Hashable], Awaitable[Any]]
+DestinationInvalidator = Callable[[Hashable, Exception], Any]
+
+
+def rate_limit_retry_after(exc: Exception) -> float | None:
+    """Return how long to wait when ``exc`` is a Discord rate limit, else None.
+
+    discord.py sleeps through ordinary 429s itself and raises ``RateLimited``
+    (which carries ``retry_after`` but no ``status``) when the wait would be
+    too long; an ``HTTPException`` with status 429 can still surface.
+    """
+    if isinstance(exc, discord.RateLimited):
+        return float(exc.retry_after or DEFAULT_RATE_LIMIT_BACKOFF_SECONDS)
+    if isinstance(exc, discord.HTTPException) and exc.status == 429:
+        return float(getattr(exc, "retry_after", None) or DEFAULT_RATE_LIMIT_BACKOFF_SECONDS)
+    return None
+
+
+@dataclass
+class Notification:
+    """One embed addressed to one or more destinations.
+
+    ``fallback`` receives the embed only when every primary destination failed,
+    mirroring the watcher's long-standing "channels first, then DM" routing.
+    Notifications sharing a ``coalesce_key`` replace each other while queued:
+    the one with the highest ``rank`` wins, so a stale lower milestone for the
+    same user is never sent after a newer one.
+    """
+
+    embed: Any
+    destinations: tuple[Hashable, ...]
+    fallback: Hashable | None = None
+    priority: int = PRIORITY_NORMAL
+    coalesce_key: Hashable | None = None
+    rank: int = 0
+    enqueued_at: float = field(default_factory=time.monotonic)
+    pending: int = 0
+    delivered: bool = False
+    superseded: bool = False
+    queued_in: set = field(default_factory=set)
+
+
+def embed_size(embed: Any) -> int:
+    """Return the character count Discord applies to an embed, when known."""
+    try:
+        return len(embed)
+    except TypeError:
+        return 0
+
+
+class NotificationOutbox:
+    """Queue embeds per destination and send them in packed messages.
+
+    Each destination has its own worker task. A worker waits for a short
+    coalescing window after the first embed arrives, then packs everything
+    queued into as few messages as Discord allows. Callers only enqueue, so a
+    sweep never waits on Discord's per-channel rate limits.
+
+    Each destination queue is a priority heap. While a send is held up by a
+    Discord 429, newly queued warnings therefore overtake routine embeds.
+    """
+
+    def __init__(
+        self,
+        resolve: DestinationResolver,
+        *,
+        invalidate: DestinationInvalidator | None = None,
+        coalesce_seconds: float = DEFAULT_COALESCE_SECONDS,
+    ):
+        self._resolve = resolve
+        self._invalidate = invalidate
+        self.coalesce_seconds = coalesce_seconds
+        self._queues: dict[Hashable, list[tuple[int, int, Notification]]] = {}
+        self._depth: dict[Hashable, int] = {}
+        self._sequence = itertools.count()
+        self._coalescing: dict[Hashable, Notification] = {}
+        self._workers: dict[Hashable, asyncio.Task] = {}
+        self.superseded_embeds = 0
+        self.sent_messages = 0
+        self.sent_embeds = 0
+        self.failed_embeds = 0
+        self.last_latency: float | None = None
+        self.average_latency: float | None = None
+        self.max_latency = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of embeds waiting across every destination."""
+        return sum(self._depth.values())
+
+    def depth_by_destination(self) -> dict[Hashable, int]:
+        return {destination: depth for destination, depth in self._depth.items() if depth}
+
+    def stats(self) -> dict[str, Any]:
+        """Return queue depth and send latency figures for operator commands."""
+        return {
+            "queue_depth": self.queue_depth,
+            "destinations": len(self.depth_by_destination()),
+            "sent_messages": self.sent_messages,
+            "sent_embeds": self.sent_embeds,
+            "failed_embeds": self.failed_embeds,
+            "superseded_embeds": self.superseded_embeds,
+            "last_latency": self.last_latency,
+            "average_latency": self.average_latency,
+            "max_latency": self.max_latency,
+        }
+
+    def enqueue(
+        self,
+        embed: Any,
+        destinations,
+        fallback: Hashable | None = None,
+        *,
+        priority: int = PRIORITY_NORMAL,
+        coalesce_key: Hashable | None = None,
+        rank: int = 0,
+    ) -> Notification:
+        """Queue ``embed`` for every destination; return immediately."""
+        destinations = tuple(dict.fromkeys(destinations))
+        if not destinations:
+            destinations, fallback = ((fallback,) if fallback is not None else ()), None
+        notification = Notification(
+            embed=embed,
+            destinations=destinations,
+            fallback=fallback,
+            priority=priority,
+            coalesce_key=coalesce_key,
+            rank=rank,
+            pending=len(destinations),
+        )
+
+        if coalesce_key is not None:
+            queued = self._coalescing.get(coalesce_key)
+            if queued is not None and queued.queued_in:
+                if queued.rank > rank:
+                    # A newer state for this key is already waiting to be sent.
+                    notification.superseded = True
+                    self.superseded_embeds += 1
+                    return notification
+                self._supersede(queued)
+            self._coalescing[coalesce_key] = notification
+
+        for destination in destinations:
+            self._push(destination, notification)
+        return notification
+
+    def _supersede(self, notification: Notification):
+        """Drop every still-queued copy of ``notification``; heaps skip it lazily."""
+        notification.superseded = True
+        for destination in notification.queued_in:
+            self._depth[destination] -= 1
+        notification.queued_in.clear()
+        self.superseded_embeds += 1
+
+    def _push(self, destination: Hashable, notification: Notification):
+        queue = self._queues.setdefault(destination, [])
+        heapq.heappush(queue, (notification.priority, next(self._sequence), notification))
+        notification.queued_in.add(destination)
+        self._depth[destination] = self._depth.get(destination, 0) + 1
+        worker = self._workers.get(destination)
+        if worker is None or worker.done():
+            self._workers[destination] = asyncio.get_running_loop().create_task(self._drain(destination))
+
+    def take_batch(self, destination: Hashable) -> list[Notification]:
+        """Pop the next message's worth of notifications, most urgent first."""
+        queue = self._queues.get(destination, [])
+        batch: list[Notification] = []
+        characters = 0
+        while queue and len(batch) < MAX_EMBEDS_PER_MESSAGE:
+            notification = queue[0][2]
+            if notification.superseded:
+                heapq.heappop(queue)
+                continue
+            size = embed_size(notification.embed)
+            if batch and characters + size > MAX_EMBED_CHARACTERS_PER_MESSAGE:
+                break
+            heapq.heappop(queue)
+            notification.queued_in.discard(destination)
+            self._depth[destination] -= 1
+            batch.append(notification)
+            characters += size
+        return batch
+
+    async def _drain(self, destination: Hashable):
+        try:
+            if self.coalesce_seconds > 0:
+                await asyncio.sleep(self.coalesce_seconds)
+            while self._depth.get(destination):
+                batch = self.take_batch(destination)
+                delivered, retry_after = await self._send_batch(destination, batch)
+                if retry_after is not None:
+                    # Put the batch back so it is re-packed by priority together
+                    # with whatever arrived while Discord was throttling us.
+                    for notification in batch:
+                        self._requeue(destination, notification)
+                    await asyncio.sleep(retry_after)
+                    continue
+                for notification in batch:
+                    self._settle(notification, delivered)
+        finally:
+            if not self._depth.get(destination):
+                # Only superseded entries can remain; drop them with the heap.
+                self._queues.pop(destination, None)
+            if self._workers.get(destination) is asyncio.current_task():
+                del self._workers[destination]
+
+    def _requeue(self, destination: Hashable, notification: Notification):
+        if notification.superseded:
+            return
+        queue = self._queues.setdefault(destination, [])
+        heapq.heappush(queue, (notification.priority, next(self._sequence), notification))
+        notification.queued_in.add(destination)
+        self._depth[destination] = self._depth.get(destination, 0) + 1
+
+    async def _send_batch(self, destination: Hashable, batch: list[Notification]) -> tuple[bool, float | None]:
+        """Send one packed message; return (delivered, retry_after_if_rate_limited)."""
+        embeds = [notification.embed for notification in batch]
+        try:
+            target = await self._resolve(destination)
+            if target is None:
+                raise LookupError("destination is unavailable")
+            if len(embeds) == 1:
+                await target.send(embed=embeds[0])
+            else:
+                await target.send(embeds=embeds)
+        except Exception as exc:
+            retry_after = rate_limit_retry_after(exc)
+            if retry_after is not None:
+                LOGGER.warning("Discord rate limited Habbo alerts to %s; retrying in %.1f seconds", destination, retry_after)
+                return False, float(retry_after)
+            LOGGER.warning("Unable to deliver %s Habbo embed(s) to %s: %s", len(embeds), destination, exc)
+            if self._invalidate is not None:
+                self._invalidate(destination, exc)
+            self.failed_embeds += len(embeds)
+            return False, None
+
+        now = time.monotonic()
+        self.sent_messages += 1
+        self.sent_embeds += len(embeds)
+        for notification in batch:
+            self._record_latency(now - notification.enqueued_at)
+        return True, None
+
+    def _record_latency(self, latency: float):
+        self.last_latency = latency
+        self.max_latency = max(self.max_latency, latency)
+        if self.average_latency is None:
+            self.average_latency = latency
+        else:
+            self.average_latency += LATENCY_SMOOTHING * (latency - self.average_latency)
+
+    def _settle(self, notification: Notification, delivered: bool):
+        notification.pending -= 1
+        notification.delivered = notification.delivered or delivered
+        if notification.pending == 0 and not notification.delivered and notification.fallback is not None:
+            fallback, notification.fallback = notification.fallback, None
+            notification.pending = 1
+            self._push(fallback, notification)
+            return
+        if notification.pending == 0 and self._coalescing.get(notification.coalesce_key) is notification:
+            del self._coalescing[notification.coalesce_key]
+
+    async def flush(self, timeout: float | None = None):
+        """Wait until every queued embed was sent or failed (fallbacks included)."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._workers:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return
+            await asyncio.wait(list(self._workers.values()), timeout=remaining)
+
+    async def close(self, timeout: float | None = 10.0):
+        """Flush what can still be sent, then cancel any remaining workers."""
+        await self.flush(timeout)
+        for worker in list(self._workers.values()):
+            worker.cancel()
+        self._workers.clear()
+
+
+class DestinationCache:
+    """Resolve Discord channels and DM channels once and reuse them.
+
+    ``notify_user`` previously fetched uncached channels and the owner on every
+    alert. The cache keeps the resolved objects until Discord answers a send
+    with Forbidden/NotFound, so steady-state alerts need no lookup requests.
+    Destinations are ``("channel", id)``, ``("webhook", channel_id)`` or
+    ``("user", id)`` tuples.
+    """
+
+    def __init__(self, bot):
+        self.bot = bot
+        self._destinations: dict[Hashable, Any] = {}
+        self.lookup_requests = 0
+
+    @classmethod
+    def for_bot(cls, bot) -> "DestinationCache":
+        """Return the cache shared by every cog running on ``bot``."""
+        cache = getattr(bot, DESTINATION_CACHE_ATTRIBUTE, None)
+        if not isinstance(cache, cls):
+            cache = cls(bot)
+            setattr(bot, DESTINATION_CACHE_ATTRIBUTE, cache)
+        return cache
+
+    async def resolve(self, destination: Hashable):
+        """Return a sendable object for a destination key, looking it up once."""
+        cached = self._destinations.get(destination)
+        if cached is not None:
+            return cached
+        kind, target_id = destination
+        if kind == "user":
+            target = await self._resolve_dm(target_id)
+        elif kind == "webhook":
+            target = WebhookDestination(self, WebhookPool.for_bot(self.bot), target_id)
+        else:
+            target = await self._resolve_channel(target_id)
+        if target is not None:
+            self._destinations[destination] = target
+        return target
+
+    async def channel(self, channel_id: int):
+        return await self.resolve(("channel", channel_id))
+
+    async def user_dm(self, user_id: int):
+        return await self.resolve(("user", user_id))
+
+    async def _resolve_channel(self, channel_id: int):
+        get_channel = getattr(self.bot, "get_channel", None)
+        channel = get_channel(channel_id) if get_channel else None
+        if channel is None:
+            self.lookup_requests += 1
+            channel = await self.bot.fetch_channel(channel_id)
+        return channel
+
+    async def _resolve_dm(self, user_id: int):
+        get_user = getattr(self.bot, "get_user", None)
+        user = get_user(user_id) if get_user else None
+        if user is None:
+            self.lookup_requests += 1
+            user = await self.bot.fetch_user(user_id)
+        # Cache the DM channel itself so later sends skip the user entirely.
+        dm_channel = getattr(user, "dm_channel", None)
+        if dm_channel is None and hasattr(user, "create_dm"):
+            self.lookup_requests += 1
+            dm_channel = await user.create_dm()
+        return dm_channel or user
+
+    def invalidate(self, destination: Hashable, exc: Exception | None = None):
+        """Forget a destination; with ``exc``, only for Forbidden/NotFound errors."""
+        if exc is not None and getattr(exc, "status", None) not in STALE_DESTINATION_STATUSES:
+            return
+        self._destinations.pop(destination, None)
+        kind, target_id = destination
+        if kind == "webhook":
+            # The webhook fallback already handled a deleted webhook, so reaching
+            # here means the channel itself is unusable.
+            self._destinations.pop(("channel", target_id), None)
+            WebhookPool.for_bot(self.bot).discard(target_id)
+
+
+class WebhookPool:
+    """Reuse one alert webhook per channel for every Habbo cog.
+
+    Webhooks fetched or created through a channel are bound to the bot's
+    connection, so their requests reuse the bot's HTTP session while Discord
+    rate-limits them per webhook rather than against the bot account.
+    """
+
+    def __init__(self, bot):
+        self.bot = bot
+        self._webhooks: dict[int, Any] = {}
+
+    @classmethod
+    def for_bot(cls, bot) -> "WebhookPool":
+        pool = getattr(bot, WEBHOOK_POOL_ATTRIBUTE, None)
+        if not isinstance(pool, cls):
+            pool = cls(bot)
+            setattr(bot, WEBHOOK_POOL_ATTRIBUTE, pool)
+        return pool
+
+    async def get(self, channel) -> Any | None:
+        """Return the channel's alert webhook, creating it once if needed."""
+        channel_id = getattr(channel, "id", None)
+        webhook = self._webhooks.get(channel_id)
+        if webhook is not None:
+            return webhook
+        try:
+            # Reuse a webhook left by an earlier run before creating another one;
+            # Discord caps each channel at a small number of webhooks.
+            for existing in await channel.webhooks():
+                if existing.name == WEBHOOK_NAME and getattr(existing, "token", None):
+                    webhook = existing
+                    break
+            else:
+                webhook = await channel.create_webhook(name=WEBHOOK_NAME, reason="Habbo alert delivery")
+        except Exception as exc:
+            # Usually a missing Manage Webhooks permission; the caller falls back.
+            LOGGER.warning("Unable to get a Habbo alert webhook for channel %s: %s", channel_id, exc)
+            return None
+        self._webhooks[channel_id] = webhook
+        return webhook
+
+    def discard(self, channel_id: int):
+        self._webhooks.pop(channel_id, None)
+
+
+class WebhookDestination:
+    """Send through a channel's pooled webhook, falling back to the bot's own send."""
+
+    def __init__(self, cache: DestinationCache, pool: WebhookPool, channel_id: int):
+        self.cache = cache
+        self.pool = pool
+        self.channel_id = channel_id
+
+    async def send(self, **kwargs):
+        channel = await self.cache.channel(self.channel_id)
+        webhook = await self.pool.get(channel)
+        if webhook is not None:
+            try:
+                return await webhook.send(**kwargs)
+            except Exception as exc:
+                if getattr(exc, "status", None) not in STALE_DESTINATION_STATUSES:
+                    raise
+                # Someone deleted the webhook; get or recreate one next time.
+                LOGGER.warning("Habbo alert webhook for channel %s is gone: %s", self.channel_id, exc)
+                self.pool.discard(self.channel_id)
+        return await channel.send(**kwargs)
@@ -0,0 +1,82 @@
+"""Indexed view of the Habbo ID tracker's change log.
+
+``habbo_id_changes.json`` is an append-only list of
+``{"habbo_id", "detected_at", "changes": {field: {"old", "new"}}}`` entries
+in detection order. ``ChangeIndex`` keeps, per ID and per (ID, field), the
+entries and their timestamps in that same order, so "changes to this ID's
+motto since March" is a dictionary lookup plus one ``bisect`` and reads only
+the matching entries, regardless of how long the whole log is.
+"""
+
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from typing import Any, Iterator
+
+
+def change_time(entry: dict) -> float | None:
+    try:
+        return datetime.fromisoformat(str(entry.get("detected_at"))).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+class ChangeIndex:
+    def __init__(self, changes=()):
+        self._times: dict[tuple[str, str | None], list[float]] = {}
+        self._entries: dict[tuple[str, str | None], list[dict]] = {}
+        self._fields: dict[str, set[str]] = {}
+        for entry in changes:
+            self.add(entry)
+
+    def add(self, entry: dict):
+        """Index one log entry; entries must arrive in detection order."""
+        detected_at = change_time(entry) if isinstance(entry, dict) else None
+        habbo_id = entry.get("habbo_id") if isinstance(entry, dict) else None
+        if detected_at is None or not habbo_id:
+            return
+        fields = entry.get("changes") if isinstance(entry.get("changes"), dict) else {}
+        self._fields.setdefault(habbo_id, set()).update(fields)
+        for key in [(habbo_id, None)] + [(habbo_id, field) for field in fields]:
+            times = self._times.setdefault(key, [])
+            entries = self._entries.setdefault(key, [])
+            # A clock step backwards must not break the sort order bisect relies on.
+            position = bisect_right(times, detected_at)
+            times.insert(position, detected_at)
+            entries.insert(position, entry)
+
+    def discard(self, dropped_entries):
+        """Forget entries trimmed from the head of the log (the oldest ones)."""
+        for entry in dropped_entries:
+            habbo_id = entry.get("habbo_id") if isinstance(entry, dict) else None
+            fields = entry.get("changes") if isinstance(entry, dict) and isinstance(entry.get("changes"), dict) else {}
+            for key in [(habbo_id, None)] + [(habbo_id, field) for field in fields]:
+                entries = self._entries.get(key)
+                if not entries:
+                    continue
+                for position, candidate in enumerate(entries):
+                    if candidate is entry:
+                        del entries[position]
+                        del self._times[key][position]
+                        break
+                if not entries:
+                    del self._entries[key], self._times[key]
+                    if key[1] is not None:
+                        self._fields.get(habbo_id, set()).discard(key[1])
+
+    def _range(self, habbo_id: str, field: str | None, since: float | None) -> tuple[list[dict], int]:
+        key = (habbo_id, field)
+        times = self._times.get(key, [])
+        return self._entries.get(key, []), bisect_left(times, since) if since is not None else 0
+
+    def count(self, habbo_id: str, field: str | None = None, since: float | None = None) -> int:
+        entries, start = self._range(habbo_id, field, since)
+        return len(entries) - start
+
+    def query(self, habbo_id: str, field: str | None = None, since: float | None = None) -> Iterator[dict[str, Any]]:
+        """Yield matching entries newest first."""
+        entries, start = self._range(habbo_id, field, since)
+        for position in range(len(entries) - 1, start - 1, -1):
+            yield entries[position]
+
+    def fields(self, habbo_id: str) -> list[str]:
+        return sorted(self._fields.get(habbo_id, ()))
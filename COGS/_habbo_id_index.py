@@ -0,0 +1,68 @@
+"""Sorted index of the Habbo ID tracker's tracked IDs for paged listings.
+
+``/habboidlist`` used to join every tracked ID into one string and cut it at
+Discord's 2000-character limit. ``TrackedIdIndex`` keeps the IDs sorted by
+name and by ID and is updated as IDs are added, removed or renamed, so one
+page is two bisects plus a slice of ``page_size`` entries, whatever the
+number of tracked IDs.
+"""
+
+from bisect import bisect_left, insort
+from typing import NamedTuple
+
+SORT_ORDERS = ("name", "id")
+
+
+class IdPage(NamedTuple):
+    habbo_ids: list[str]
+    total: int  # IDs matching the prefix
+    page: int  # zero-based, clamped to the last page
+    pages: int
+
+
+class TrackedIdIndex:
+    def __init__(self, tracked_ids: dict | None = None):
+        self._names: dict[str, str] = {}
+        self._keys: dict[str, list[tuple[str, str]]] = {order: [] for order in SORT_ORDERS}
+        for habbo_id, item in (tracked_ids or {}).items():
+            self.add(habbo_id, item.get("name") if isinstance(item, dict) else None)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    @staticmethod
+    def _sort_keys(habbo_id: str, name: str) -> dict[str, tuple[str, str]]:
+        return {"name": (name.lower(), habbo_id), "id": (habbo_id, habbo_id)}
+
+    def add(self, habbo_id: str, name: str | None):
+        if habbo_id in self._names:
+            self.remove(habbo_id)
+        self._names[habbo_id] = name or ""
+        for order, key in self._sort_keys(habbo_id, name or "").items():
+            insort(self._keys[order], key)
+
+    def remove(self, habbo_id: str):
+        name = self._names.pop(habbo_id, None)
+        if name is None:
+            return
+        for order, key in self._sort_keys(habbo_id, name).items():
+            keys = self._keys[order]
+            position = bisect_left(keys, key)
+            if position < len(keys) and keys[position] == key:
+                del keys[position]
+
+    def rename(self, habbo_id: str, name: str | None):
+        if habbo_id in self._names and self._names[habbo_id] != (name or ""):
+            self.add(habbo_id, name)
+
+    def page(self, order: str = "name", prefix: str = "", page: int = 0, page_size: int = 20) -> IdPage:
+        """Return one page of IDs whose sort key (name or ID) starts with ``prefix``."""
+        keys = self._keys[order if order in SORT_ORDERS else SORT_ORDERS[0]]
+        prefix = (prefix or "").lower()
+        low = bisect_left(keys, (prefix,))
+        high = bisect_left(keys, (prefix + "\U0010ffff",)) if prefix else len(keys)
+        total = high - low
+        pages = max(1, -(-total // page_size))
+        page = min(max(page, 0), pages - 1)
+        start = low + page * page_size
+        return IdPage([habbo_id for _key, habbo_id in keys[start:min(start + page_size, high)]], total, page, pages)
@@ -0,0 +1,143 @@
+"""Roster-wide milestone evaluation over contiguous arrays.
+
+The sweep visits members one at a time, roughly once per cycle. Between sweeps
+the watcher re-checks milestone crossings every few seconds with
+``MilestoneBatch.due``, which keeps one slot per member in flat arrays:
+
+- ``offline_since``: epoch seconds of the tracked offline start (NaN when the
+  member is online or has no tracked offline window);
+- ``policy``: index into the compiled policy list;
+- ``sent_level``: highest milestone rank already alerted in this window.
+
+With NumPy installed the arrays are viewed without copying and evaluated in
+one vectorized pass; otherwise a plain loop with ``bisect`` is used.
+"""
+
+from array import array
+from bisect import bisect_right
+import math
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the array fallback gives identical results.
+    np = None
+
+from COGS._habbo_policies import Policy
+
+SECONDS_PER_DAY = 86400.0
+
+
+class MilestoneBatch:
+    def __init__(self, policies: dict[str, Policy], use_numpy: bool | None = None):
+        self.use_numpy = np is not None if use_numpy is None else (use_numpy and np is not None)
+        self.members: list[str] = []
+        self._slots: dict[str, int] = {}
+        self._offline_since = array("d")
+        self._policy = array("q")
+        self._sent_level = array("q")
+        self.set_policies(policies)
+
+    def set_policies(self, policies: dict[str, Policy]):
+        """Recompile threshold tables, e.g. after the policy config is reloaded."""
+        previous_names = getattr(self, "policy_names", [])
+        self.policy_names = list(policies)
+        self._policy_index = {policy_name: index for index, policy_name in enumerate(self.policy_names)}
+        self._thresholds = [list(policies[policy_name].thresholds) for policy_name in self.policy_names]
+        # Re-point existing slots at the new indices; members of a removed policy stop evaluating.
+        for slot in range(len(self.members)):
+            old_index = self._policy[slot]
+            policy_name = previous_names[old_index] if 0 <= old_index < len(previous_names) else None
+            self._policy[slot] = self._policy_index.get(policy_name, -1)
+            if self._policy[slot] < 0:
+                self._offline_since[slot] = math.nan
+        if np is not None:
+            width = max((len(thresholds) for thresholds in self._thresholds), default=0)
+            # Padded with +inf so shorter policies never "reach" missing columns.
+            # The extra row (index -1) serves members without a policy.
+            self._threshold_matrix = np.full((len(self._thresholds) + 1, width), np.inf)
+            for index, thresholds in enumerate(self._thresholds):
+                self._threshold_matrix[index, :len(thresholds)] = thresholds
+
+    def __len__(self) -> int:
+        return len(self.members)
+
+    def update(self, username_lc: str, policy_name: str | None, offline_since_epoch: float | None, sent_level: int):
+        """Insert or refresh one member's slot."""
+        offline_since = math.nan if offline_since_epoch is None else float(offline_since_epoch)
+        policy_index = self._policy_index.get(policy_name, -1)
+        if policy_index < 0:
+            offline_since = math.nan
+        slot = self._slots.get(username_lc)
+        if slot is None:
+            self._slots[username_lc] = len(self.members)
+            self.members.append(username_lc)
+            self._offline_since.append(offline_since)
+            self._policy.append(policy_index)
+            self._sent_level.append(sent_level)
+            return
+        self._offline_since[slot] = offline_since
+        self._policy[slot] = policy_index
+        self._sent_level[slot] = sent_level
+
+    def mark_sent(self, username_lc: str, level: int):
+        slot = self._slots.get(username_lc)
+        if slot is not None and level > self._sent_level[slot]:
+            self._sent_level[slot] = level
+
+    def remove(self, username_lc: str):
+        """Drop a member by moving the last slot into its place."""
+        slot = self._slots.pop(username_lc, None)
+        if slot is None:
+            return
+        last = len(self.members) - 1
+        if slot != last:
+            moved = self.members[last]
+            self.members[slot] = moved
+            self._slots[moved] = slot
+            self._offline_since[slot] = self._offline_since[last]
+            self._policy[slot] = self._policy[last]
+            self._sent_level[slot] = self._sent_level[last]
+        self.members.pop()
+        self._offline_since.pop()
+        self._policy.pop()
+        self._sent_level.pop()
+
+    def retain(self, usernames) -> None:
+        """Remove every member not in ``usernames`` (e.g. after a roster refresh)."""
+        keep = set(usernames)
+        for username_lc in [username_lc for username_lc in self.members if username_lc not in keep]:
+            self.remove(username_lc)
+
+    def due(self, now_epoch: float) -> list[tuple[str, str, int]]:
+        """Return ``(username_lc, policy_name, level)`` for members past an unsent milestone.
+
+        ``level`` is the 1-based rank of the highest milestone reached.
+        """
+        if not self.members:
+            return []
+        if self.use_numpy:
+            return self._due_numpy(now_epoch)
+        return self._due_array(now_epoch)
+
+    def _due_numpy(self, now_epoch: float) -> list[tuple[str, str, int]]:
+        offline_since = np.frombuffer(self._offline_since, dtype=np.float64)
+        policy = np.frombuffer(self._policy, dtype=np.int64)
+        sent_level = np.frombuffer(self._sent_level, dtype=np.int64)
+        elapsed_days = (now_epoch - offline_since) / SECONDS_PER_DAY
+        # NaN (online/untracked) compares False against every threshold.
+        with np.errstate(invalid="ignore"):
+            reached = (elapsed_days[:, None] >= self._threshold_matrix[policy]).sum(axis=1)
+        slots = np.nonzero(reached > sent_level)[0]
+        return [(self.members[slot], self.policy_names[policy[slot]], int(reached[slot])) for slot in slots.tolist()]
+
+    def _due_array(self, now_epoch: float) -> list[tuple[str, str, int]]:
+        due = []
+        thresholds = self._thresholds
+        for slot, offline_since in enumerate(self._offline_since):
+            if offline_since != offline_since:  # NaN: online or untracked
+                continue
+            policy_index = self._policy[slot]
+            level = bisect_right(thresholds[policy_index], (now_epoch - offline_since) / SECONDS_PER_DAY)
+            if level > self._sent_level[slot]:
+                due.append((self.members[slot], self.policy_names[policy_index], level))
+        return due
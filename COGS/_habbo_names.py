@@ -0,0 +1,83 @@
+"""In-memory prefix index of Habbo usernames for slash-command autocomplete.
+
+Discord gives an autocomplete callback about three seconds and at most 25
+choices, and a mistyped username otherwise costs a rate-limited lookup that
+fails. ``NamePrefixIndex`` keeps the known names (watched group members and
+``offline_records`` entries) in one sorted list of lowercase keys, so a
+completion is a ``bisect`` plus a slice of at most ``limit`` names, even with
+tens of thousands of names.
+
+Names are registered per source ("roster", "records"). ``update_source``
+applies only the difference from that source's previous set, and a name
+stays in the index while any source still has it.
+"""
+
+from bisect import bisect_left, insort
+from typing import Iterable
+
+AUTOCOMPLETE_LIMIT = 25
+# Past this many changes at once, re-sorting beats inserting one by one.
+REBUILD_THRESHOLD = 64
+
+
+class NamePrefixIndex:
+    def __init__(self):
+        self._keys: list[str] = []
+        self._display: dict[str, str] = {}
+        self._sources: dict[str, dict[str, str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, name: str) -> bool:
+        return name.lower() in self._display
+
+    def add(self, source: str, name: str):
+        name_lc = name.lower()
+        self._sources.setdefault(source, {})[name_lc] = name
+        if name_lc in self._display:
+            # Keep the freshest capitalisation.
+            self._display[name_lc] = name
+            return
+        self._display[name_lc] = name
+        insort(self._keys, name_lc)
+
+    def discard(self, source: str, name: str):
+        name_lc = name.lower()
+        if self._sources.get(source, {}).pop(name_lc, None) is None:
+            return
+        if any(name_lc in names for names in self._sources.values()):
+            return
+        del self._display[name_lc]
+        position = bisect_left(self._keys, name_lc)
+        if position < len(self._keys) and self._keys[position] == name_lc:
+            del self._keys[position]
+
+    def update_source(self, source: str, names: Iterable[str]):
+        """Make ``source`` hold exactly ``names``, touching only what changed."""
+        new = {name.lower(): name for name in names if name}
+        old = self._sources.get(source, {})
+        removed = [old[name_lc] for name_lc in old.keys() - new.keys()]
+        added = [new[name_lc] for name_lc in new.keys() - old.keys()]
+        if len(added) + len(removed) > REBUILD_THRESHOLD:
+            self._sources[source] = new
+            self._display = {}
+            for names_by_key in self._sources.values():
+                self._display.update(names_by_key)
+            self._keys = sorted(self._display)
+            return
+        for name in removed:
+            self.discard(source, name)
+        for name in added:
+            self.add(source, name)
+
+    def complete(self, prefix: str, limit: int = AUTOCOMPLETE_LIMIT) -> list[str]:
+        """Return up to ``limit`` known names starting with ``prefix`` (case-insensitive)."""
+        prefix_lc = prefix.strip().lower()
+        start = bisect_left(self._keys, prefix_lc)
+        matches = []
+        for name_lc in self._keys[start:start + limit]:
+            if not name_lc.startswith(prefix_lc):
+                break
+            matches.append(self._display[name_lc])
+        return matches
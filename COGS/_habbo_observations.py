@@ -0,0 +1,208 @@
+"""Bot-wide Habbo profile observation bus shared by the watcher and ID tracker.
+
+HabboWatch looks members up by name and HabboIdTracker looks profiles up by
+unique ID, so a tracked ID that is also a watched member used to be fetched
+twice per cycle. Both cogs now fetch through one ``ProfileObservationBus``:
+
+- every response is cached under its unique ID and its (hotel, name), so a
+  lookup by either key within ``max_age`` reuses the other cog's fetch;
+- concurrent lookups for the same key share one in-flight request;
+- every fetched profile is published once to the subscribers (the tracker
+  diffs snapshots of the IDs it tracks as soon as the watcher observes them).
+  Subscribers run as tasks of their own, so a lookup returns as soon as its
+  result is cached and never waits on another cog's follow-up work;
+- all requests share one ``HabboApi``, i.e. one rate budget per hotel, which
+  also survives cog reloads because the bus lives on the bot.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, NamedTuple
+
+from COGS._habbo_api import (
+    DEFAULT_HOTEL,
+    PRIORITY_BACKGROUND,
+    REQUEST_INTERVAL_SECONDS,
+    HabboApi,
+    hotel_base_url,
+    hotel_from_identifier,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+OBSERVATION_BUS_ATTRIBUTE = "habbo_observation_bus"
+# Cached observations are dropped after this age; callers ask for much fresher ones.
+OBSERVATION_MAX_AGE_SECONDS = 60 * 60
+PRUNE_INTERVAL_SECONDS = 10 * 60
+
+
+class ProfileObservation(NamedTuple):
+    profile: dict
+    hotel: str
+    observed_at: float  # time.monotonic()
+
+
+Subscriber = Callable[[ProfileObservation], Awaitable[None]]
+
+
+class ProfileObservationBus:
+    def __init__(self, api: HabboApi | None = None):
+        self.api = api or HabboApi(REQUEST_INTERVAL_SECONDS)
+        self._by_id: dict[str, ProfileObservation] = {}
+        self._id_by_name: dict[tuple[str, str], str] = {}
+        self._in_flight: dict[tuple, asyncio.Future] = {}
+        self._subscribers: list[Subscriber] = []
+        # Strong references to running subscriber calls; asyncio keeps only weak ones.
+        self._dispatches: set[asyncio.Task] = set()
+        self._next_prune_at = time.monotonic() + PRUNE_INTERVAL_SECONDS
+        self.requests = 0
+        self.shared_hits = 0
+
+    @classmethod
+    def for_bot(cls, bot) -> "ProfileObservationBus":
+        bus = getattr(bot, OBSERVATION_BUS_ATTRIBUTE, None)
+        if not isinstance(bus, cls):
+            bus = cls()
+            setattr(bot, OBSERVATION_BUS_ATTRIBUTE, bus)
+        return bus
+
+    def subscribe(self, callback: Subscriber) -> Callable[[], None]:
+        """Receive every fetched profile; returns a function that unsubscribes."""
+        self._subscribers.append(callback)
+
+        def unsubscribe():
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+
+        return unsubscribe
+
+    def recent(self, unique_id: str | None = None, *, name: str | None = None, hotel: str = DEFAULT_HOTEL, max_age: float = 0.0):
+        """Return a cached observation no older than ``max_age`` seconds, else None."""
+        if unique_id is None and name is not None:
+            unique_id = self._id_by_name.get((hotel, name.lower()))
+        observation = self._by_id.get(unique_id) if unique_id else None
+        if observation is None or time.monotonic() - observation.observed_at > max_age:
+            return None
+        return observation
+
+    async def fetch_user(
+        self,
+        name: str,
+        hotel: str = DEFAULT_HOTEL,
+        max_age: float = 0.0,
+        priority: int = PRIORITY_BACKGROUND,
+    ) -> tuple[int | None, dict | None]:
+        """Look a profile up by name; returns ``(status, profile)`` like ``HabboApi.get_json``.
+
+        A cached observation counts as a 200 response. Joining a lookup that is
+        already in flight keeps that lookup's limiter priority.
+        """
+        cached = self.recent(name=name, hotel=hotel, max_age=max_age)
+        if cached is not None:
+            self.shared_hits += 1
+            return 200, cached.profile
+        url = f"{hotel_base_url(hotel)}/api/public/users"
+        return await self._single_flight(("name", hotel, name.lower()), url, {"name": name}, hotel, priority)
+
+    async def fetch_unique_id(self, unique_id: str, max_age: float = 0.0) -> tuple[int | None, dict | None]:
+        """Look a profile up by unique ID; the hotel comes from the ID prefix."""
+        cached = self.recent(unique_id, max_age=max_age)
+        if cached is not None:
+            self.shared_hits += 1
+            return 200, cached.profile
+        hotel = hotel_from_identifier(unique_id) or DEFAULT_HOTEL
+        url = f"{hotel_base_url(hotel)}/api/public/users/{unique_id}"
+        return await self._single_flight(("id", unique_id), url, None, hotel)
+
+    async def _single_flight(self, key: tuple, url: str, params: dict | None, hotel: str, priority: int = PRIORITY_BACKGROUND):
+        future = self._in_flight.get(key)
+        while future is not None:
+            try:
+                result = await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # The caller that started the lookup was cancelled (e.g. its
+                # interaction went away); look the profile up ourselves.
+                future = self._in_flight.get(key)
+                continue
+            self.shared_hits += 1
+            return result
+        future = self._in_flight[key] = asyncio.get_running_loop().create_future()
+        try:
+            self.requests += 1
+            status, data = await self.api.get_json(url, params=params, priority=priority)
+            profile = data if status == 200 and isinstance(data, dict) else None
+            result = (status, profile)
+            future.set_result(result)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            # Waiters re-raise it; retrieve it here so an unawaited future does not warn.
+            future.exception()
+            raise
+        finally:
+            self._in_flight.pop(key, None)
+        if profile is not None:
+            self.publish(profile, hotel)
+        return result
+
+    def publish(self, profile: dict, hotel: str) -> ProfileObservation:
+        """Cache a fetched profile and start every subscriber on it once.
+
+        Subscribers run in the background; ``drain`` waits for them.
+        """
+        unique_id = profile.get("uniqueId")
+        now = time.monotonic()
+        observation = ProfileObservation(profile, hotel, now)
+        if unique_id:
+            self._by_id[unique_id] = observation
+            if profile.get("name"):
+                self._id_by_name[(hotel, str(profile["name"]).lower())] = unique_id
+        if now >= self._next_prune_at:
+            self.prune(now)
+        for callback in list(self._subscribers):
+            task = asyncio.ensure_future(callback(observation))
+            self._dispatches.add(task)
+            task.add_done_callback(lambda task, callback=callback: self._dispatch_done(task, callback))
+        return observation
+
+    def _dispatch_done(self, task: asyncio.Task, callback: Subscriber):
+        self._dispatches.discard(task)
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None:
+            LOGGER.error("Habbo observation subscriber %r failed", callback, exc_info=exc)
+
+    async def drain(self):
+        """Wait until every subscriber call started so far has finished."""
+        while self._dispatches:
+            await asyncio.wait(list(self._dispatches))
+
+    async def close_when_unused(self):
+        """Close the pooled HTTP sessions once no cog is subscribed any more.
+
+        Cogs call this from ``cog_unload`` (which also runs on bot shutdown);
+        during a reload the next instance reopens sessions on its first request.
+        """
+        if self._subscribers:
+            return
+        await self.drain()
+        await self.api.close()
+
+    def prune(self, now: float | None = None):
+        now = time.monotonic() if now is None else now
+        self._next_prune_at = now + PRUNE_INTERVAL_SECONDS
+        self._by_id = {
+            unique_id: observation
+            for unique_id, observation in self._by_id.items()
+            if now - observation.observed_at <= OBSERVATION_MAX_AGE_SECONDS
+        }
+        self._id_by_name = {key: unique_id for key, unique_id in self._id_by_name.items() if unique_id in self._by_id}
+
+    def stats(self) -> dict[str, Any]:
+        return {"requests": self.requests, "shared_hits": self.shared_hits, "cached_profiles": len(self._by_id)}
@@ -0,0 +1,147 @@
+"""Config-driven watcher policies compiled into bisect-friendly milestone tables.
+
+Policies are read from ``JSON/habbo_policies.json`` when it exists and holds
+at least one policy; otherwise the built-in MOD/OOA defaults below are used.
+Example::
+
+    {
+      "MOD": {
+        "allowed_days": 3,
+        "channels": [123456789012345678],
+        "milestones": [
+          {"after_hours": 48, "title": "Offline Notice (2 Days)", "key": "offline_mod_2d", "severity": "notice"},
+          {"after_days": 3, "title": "Offline Warning (3 Days)", "key": "offline_mod_3d", "severity": "warning"}
+        ]
+      }
+    }
+
+Each policy is compiled once into a sorted threshold list, so resolving a
+member's milestone is a single ``bisect`` regardless of how many milestones a
+policy defines. Severity and colour are data on each milestone; ``channels``
+seeds the policy's alert channels before any setmod/setooa overrides.
+"""
+
+from bisect import bisect_right
+import json
+import logging
+from pathlib import Path
+from typing import NamedTuple
+
+LOGGER = logging.getLogger(__name__)
+
+SEVERITIES = ("notice", "warning")
+# Embed colours are ``discord.Colour`` factory names, e.g. "red" or "orange".
+DEFAULT_MILESTONE_COLOUR = "red"
+
+DEFAULT_POLICY_CONFIG = {
+    "MOD": {
+        "allowed_days": 3.0,
+        "milestones": [
+            {"after_days": 2.0, "title": "Offline Notice (2 Days)", "key": "offline_mod_2d", "severity": "notice"},
+            {"after_hours": 71, "title": "Offline Warning (2 Days 23 Hours)", "key": "offline_mod_2d_23h", "severity": "warning"},
+            {"after_days": 3.0, "title": "Offline Warning (3 Days)", "key": "offline_mod_3d", "severity": "warning"},
+        ],
+    },
+    "OOA": {
+        "allowed_days": 1.0,
+        "milestones": [
+            {"after_hours": 16, "title": "Approaching 16 Hours", "key": "offline_ooa_16h", "severity": "notice"},
+            {"after_hours": 23, "title": "OOA Offline Warning (23 Hours)", "key": "offline_ooa_23h", "severity": "warning"},
+            {"after_days": 1.0, "title": "OOA Offline Warning (24 Hours)", "key": "offline_ooa_24h", "severity": "warning"},
+        ],
+    },
+}
+
+
+class Milestone(NamedTuple):
+    threshold_days: float
+    title: str
+    key: str
+    severity: str
+    colour: str
+
+
+class Policy:
+    """One compiled policy: milestones sorted by threshold plus lookup tables."""
+
+    __slots__ = ("name", "allowed_days", "channels", "milestones", "thresholds", "_by_key")
+
+    def __init__(self, name: str, allowed_days: float, milestones: list[Milestone], channels: list[int] | None = None):
+        self.name = name
+        self.allowed_days = allowed_days
+        self.channels = list(channels or [])
+        self.milestones = tuple(sorted(milestones, key=lambda milestone: milestone.threshold_days))
+        self.thresholds = [milestone.threshold_days for milestone in self.milestones]
+        self._by_key = {milestone.key: (index, milestone) for index, milestone in enumerate(self.milestones)}
+
+    def resolve(self, days_offline: float | None) -> Milestone | None:
+        """Return the highest milestone reached after ``days_offline`` days."""
+        if days_offline is None:
+            return None
+        index = bisect_right(self.thresholds, days_offline) - 1
+        return self.milestones[index] if index >= 0 else None
+
+    def next_after(self, days_offline: float) -> Milestone | None:
+        """Return the first milestone not yet reached after ``days_offline`` days."""
+        index = bisect_right(self.thresholds, days_offline)
+        return self.milestones[index] if index < len(self.milestones) else None
+
+    def rank(self, alert_key: str | None) -> int:
+        """Return the 1-based position of a milestone key, or 0 when unknown."""
+        entry = self._by_key.get(alert_key)
+        return entry[0] + 1 if entry else 0
+
+    def milestone(self, alert_key: str | None) -> Milestone | None:
+        entry = self._by_key.get(alert_key)
+        return entry[1] if entry else None
+
+
+def _threshold_days(raw: dict) -> float:
+    if "after_days" in raw:
+        return float(raw["after_days"])
+    if "after_hours" in raw:
+        return float(raw["after_hours"]) / 24
+    raise ValueError("milestone needs after_days or after_hours")
+
+
+def compile_policies(config: dict) -> dict[str, Policy]:
+    """Validate a policy config mapping and compile it; raises ValueError when invalid."""
+    if not isinstance(config, dict) or not config:
+        raise ValueError("policy config must be a non-empty object")
+
+    policies: dict[str, Policy] = {}
+    seen_keys: set[str] = set()
+    for raw_name, raw_policy in config.items():
+        name = str(raw_name).strip().upper()
+        if not name or not isinstance(raw_policy, dict):
+            raise ValueError(f"policy {raw_name!r} must be an object")
+        milestones = []
+        for raw in raw_policy.get("milestones") or []:
+            if not isinstance(raw, dict) or not raw.get("title") or not raw.get("key"):
+                raise ValueError(f"policy {name}: every milestone needs a title and key")
+            key = str(raw["key"])
+            if key in seen_keys:
+                # Keys are persisted in sent_alerts, so they must be unique.
+                raise ValueError(f"policy {name}: duplicate milestone key {key!r}")
+            seen_keys.add(key)
+            severity = str(raw.get("severity", "warning")).lower()
+            if severity not in SEVERITIES:
+                raise ValueError(f"policy {name}: severity must be one of {', '.join(SEVERITIES)}")
+            milestones.append(
+                Milestone(_threshold_days(raw), str(raw["title"]), key, severity, str(raw.get("colour", DEFAULT_MILESTONE_COLOUR)))
+            )
+        channels = [int(channel_id) for channel_id in raw_policy.get("channels") or []]
+        policies[name] = Policy(name, float(raw_policy.get("allowed_days", 1.0)), milestones, channels)
+    return policies
+
+
+def load_policies(config_file: Path) -> dict[str, Policy]:
+    """Load and compile policies from JSON, falling back to the built-in defaults."""
+    try:
+        if config_file.exists():
+            data = json.loads(config_file.read_text(encoding="utf-8"))
+            if data:
+                return compile_policies(data)
+    except Exception as exc:
+        LOGGER.error("Ignoring invalid Habbo policy config %s: %s", config_file, exc)
+    return compile_policies(DEFAULT_POLICY_CONFIG)
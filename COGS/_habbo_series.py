@@ -0,0 +1,228 @@
+"""Compact per-ID time series of the numeric Habbo profile fields.
+
+Each tracked ID gets one append-only column file under
+``JSON/habbo_id_series/<id>.bin``: an 8-byte header (magic, version, column
+count) followed by fixed-width little-endian float64 rows of
+``(epoch seconds, *SERIES_FIELDS)``, with NaN for a value the API omitted.
+Rows are in time order, so a window query binary-searches the row offsets
+and reads only the rows inside the window into one ``array``; nothing else
+of the file is parsed.
+
+Rows are appended when a value changed, at most once per
+``SERIES_MIN_SPACING_SECONDS``. Old rows are thinned when a file has grown by
+``SERIES_COMPACT_AFTER_ROWS`` rows: everything is kept for two days, one row
+per hour for a month, and one row per day beyond that.
+"""
+
+from array import array
+import math
+import os
+from pathlib import Path
+import struct
+import sys
+import time
+from typing import Any
+
+SERIES_FIELDS = ("totalExperience", "currentLevel", "currentLevelCompletePercent", "starGemCount")
+SERIES_MAGIC = b"HBTS"
+SERIES_VERSION = 1
+HEADER = struct.Struct("<4sHH")
+TIMESTAMP = struct.Struct("<d")
+ROW_WIDTH = 1 + len(SERIES_FIELDS)
+ROW_BYTES = ROW_WIDTH * 8
+SERIES_MIN_SPACING_SECONDS = 15 * 60
+SERIES_COMPACT_AFTER_ROWS = 256
+# (rows younger than this many seconds, keep one row per this many seconds; 0 keeps every row)
+SERIES_RESOLUTIONS = (
+    (2 * 24 * 60 * 60, 0),
+    (30 * 24 * 60 * 60, 60 * 60),
+    (None, 24 * 60 * 60),
+)
+
+
+def _to_disk(rows: array) -> bytes:
+    if sys.byteorder == "big":
+        rows = array("d", rows)
+        rows.byteswap()
+    return rows.tobytes()
+
+
+def _from_disk(data: bytes) -> array:
+    rows = array("d")
+    rows.frombytes(data[: len(data) - len(data) % ROW_BYTES])
+    if sys.byteorder == "big":
+        rows.byteswap()
+    return rows
+
+
+def profile_row(profile: dict[str, Any], observed_at: float) -> array | None:
+    """Return the series row for a profile, or None when it has no numeric fields."""
+    values = []
+    for field in SERIES_FIELDS:
+        value = profile.get(field)
+        values.append(float(value) if isinstance(value, (int, float)) and not isinstance(value, bool) else math.nan)
+    if all(math.isnan(value) for value in values):
+        return None
+    return array("d", [observed_at, *values])
+
+
+def downsample(rows: array, now: float) -> array:
+    """Keep the last row per resolution bucket; rows must be in time order."""
+    kept = array("d")
+    last_bucket = None
+    for start in range(0, len(rows), ROW_WIDTH):
+        observed_at = rows[start]
+        age = now - observed_at
+        resolution = next(step for limit, step in SERIES_RESOLUTIONS if limit is None or age < limit)
+        bucket = (resolution, observed_at // resolution) if resolution else None
+        if bucket is not None and bucket == last_bucket:
+            # A later row in the same bucket replaces the one kept so far.
+            del kept[-ROW_WIDTH:]
+        kept.extend(rows[start:start + ROW_WIDTH])
+        last_bucket = bucket
+    return kept
+
+
+class SeriesStore:
+    """Series files for every tracked ID.
+
+    ``record`` buffers rows on the event loop; ``take_pending`` hands them to
+    ``write``, which does the blocking file I/O in a worker thread, and
+    ``finish_write`` drops them from the in-flight set afterwards. Window
+    queries see buffered and in-flight rows too.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self._pending: dict[str, array] = {}
+        self._writing: dict[str, array] = {}
+        self._last_row: dict[str, array | None] = {}
+        self._appended_since_compact: dict[str, int] = {}
+
+    def path(self, habbo_id: str) -> Path:
+        return self.directory / f"{habbo_id}.bin"
+
+    def _row_count(self, path: Path) -> int:
+        try:
+            return max(0, (path.stat().st_size - HEADER.size) // ROW_BYTES)
+        except OSError:
+            return 0
+
+    def _read_rows(self, path: Path, first: int, last: int) -> array:
+        if last <= first:
+            return array("d")
+        with path.open("rb") as handle:
+            handle.seek(HEADER.size + first * ROW_BYTES)
+            return _from_disk(handle.read((last - first) * ROW_BYTES))
+
+    def _read_time(self, handle, index: int) -> float:
+        handle.seek(HEADER.size + index * ROW_BYTES)
+        return TIMESTAMP.unpack(handle.read(TIMESTAMP.size))[0]
+
+    def _first_row_at_or_after(self, path: Path, since: float, count: int) -> int:
+        low, high = 0, count
+        with path.open("rb") as handle:
+            while low < high:
+                middle = (low + high) // 2
+                if self._read_time(handle, middle) < since:
+                    low = middle + 1
+                else:
+                    high = middle
+        return low
+
+    def last_row(self, habbo_id: str) -> array | None:
+        if habbo_id not in self._last_row:
+            path = self.path(habbo_id)
+            count = self._row_count(path)
+            self._last_row[habbo_id] = self._read_rows(path, count - 1, count) if count else None
+        return self._last_row[habbo_id]
+
+    def record(self, habbo_id: str, profile: dict[str, Any], observed_at: float | None = None) -> bool:
+        """Buffer a row when a numeric value changed; returns whether one was buffered."""
+        observed_at = time.time() if observed_at is None else observed_at
+        row = profile_row(profile, observed_at)
+        if row is None:
+            return False
+        last = self.last_row(habbo_id)
+        if last is not None:
+            unchanged = all(
+                old == new or (math.isnan(old) and math.isnan(new)) for old, new in zip(last[1:], row[1:])
+            )
+            if unchanged or observed_at - last[0] < SERIES_MIN_SPACING_SECONDS:
+                return False
+        self._pending.setdefault(habbo_id, array("d")).extend(row)
+        self._last_row[habbo_id] = row
+        return True
+
+    def take_pending(self) -> dict[str, array]:
+        """Move buffered rows to the in-flight set; call ``write`` with the result."""
+        pending, self._pending = self._pending, {}
+        for habbo_id, rows in pending.items():
+            self._writing.setdefault(habbo_id, array("d")).extend(rows)
+        return pending
+
+    def write(self, pending: dict[str, array], now: float | None = None) -> None:
+        """Append rows (blocking file I/O, run it off the event loop)."""
+        now = time.time() if now is None else now
+        self.directory.mkdir(parents=True, exist_ok=True)
+        for habbo_id, rows in pending.items():
+            path = self.path(habbo_id)
+            with path.open("ab") as handle:
+                if handle.tell() == 0:
+                    handle.write(HEADER.pack(SERIES_MAGIC, SERIES_VERSION, len(SERIES_FIELDS)))
+                handle.write(_to_disk(rows))
+            appended = self._appended_since_compact.get(habbo_id, SERIES_COMPACT_AFTER_ROWS) + len(rows) // ROW_WIDTH
+            if appended >= SERIES_COMPACT_AFTER_ROWS:
+                self.compact(habbo_id, now)
+                appended = 0
+            self._appended_since_compact[habbo_id] = appended
+
+    def finish_write(self, pending: dict[str, array]) -> None:
+        for habbo_id in pending:
+            self._writing.pop(habbo_id, None)
+
+    def compact(self, habbo_id: str, now: float | None = None) -> None:
+        path = self.path(habbo_id)
+        rows = self._read_rows(path, 0, self._row_count(path))
+        kept = downsample(rows, time.time() if now is None else now)
+        if len(kept) == len(rows):
+            return
+        temporary = path.with_suffix(".tmp")
+        temporary.write_bytes(HEADER.pack(SERIES_MAGIC, SERIES_VERSION, len(SERIES_FIELDS)) + _to_disk(kept))
+        os.replace(temporary, path)
+
+    def window(self, habbo_id: str, since: float) -> array:
+        """Return the flat rows observed at or after ``since`` (written and buffered)."""
+        path = self.path(habbo_id)
+        count = self._row_count(path)
+        rows = array("d")
+        if count:
+            rows = self._read_rows(path, self._first_row_at_or_after(path, since, count), count)
+        for buffered in (self._writing.get(habbo_id), self._pending.get(habbo_id)):
+            for start in range(0, len(buffered or ()), ROW_WIDTH):
+                if buffered[start] >= since and (not rows or buffered[start] > rows[-ROW_WIDTH]):
+                    rows.extend(buffered[start:start + ROW_WIDTH])
+        return rows
+
+    def trend(self, habbo_id: str, since: float) -> dict[str, dict[str, float]]:
+        """Per field: first/last value, delta and change per day over the window."""
+        rows = self.window(habbo_id, since)
+        trends = {}
+        starts = range(0, len(rows), ROW_WIDTH)
+        for column, field in enumerate(SERIES_FIELDS, start=1):
+            present = [start for start in starts if not math.isnan(rows[start + column])]
+            if not present:
+                continue
+            first_at, first = rows[present[0]], rows[present[0] + column]
+            last_at, last = rows[present[-1]], rows[present[-1] + column]
+            elapsed = last_at - first_at
+            trends[field] = {
+                "first": first,
+                "last": last,
+                "delta": last - first,
+                "per_day": (last - first) / elapsed * 86400 if elapsed > 0 else 0.0,
+                "points": len(present),
+                "first_at": first_at,
+                "last_at": last_at,
+            }
+        return trends
@@ -0,0 +1,140 @@
+"""Per-guild watcher tenants that share one deduplicated Habbo sweep.
+
+The bot owner's configuration (``NOTIFY_USER_ID``, the watched groups and the
+setmod/setooa channels) stays the default tenant. Any other guild can add its
+own tenant with groups and policy channels, stored in
+``JSON/habbo_watch_tenants.json``::
+
+    {
+      "123456789012345678": {
+        "groups": [{"group_id": "g-hhus-...", "policy": "MOD", "precedence": 10}],
+        "channels": {"mod": [234567890123456789]}
+      }
+    }
+
+Tenants name policies from the shared policy tables. Every distinct group and
+member is fetched once per sweep however many tenants watch it; evaluation and
+alert delivery then fan out per tenant, with per-tenant dedupe kept in
+``TenantAlertLog``.
+
+Tenant sweeps spend the owner's per-hotel request budget, so each tenant may
+watch at most ``TENANT_MAX_GROUPS`` groups and have ``TENANT_MAX_MEMBERS``
+members that the owner does not already watch. Those members are evaluated
+from in-memory state only and never written to the owner's audit JSON.
+"""
+
+from typing import NamedTuple
+
+TENANT_MAX_GROUPS = 5
+TENANT_MAX_MEMBERS = 200
+
+
+class WatchedGroup(NamedTuple):
+    """A Habbo group whose members are watched under ``policy``.
+
+    When a member appears in several groups, the group with the highest
+    ``precedence`` decides their policy (ties go to the later group).
+    """
+
+    group_id: str
+    policy: str
+    precedence: int = 0
+
+
+class WatchTenant(NamedTuple):
+    """One guild's watcher configuration."""
+
+    guild_id: int
+    groups: tuple[WatchedGroup, ...]
+    # Policy name -> alert channel IDs. Policies without channels are not alerted.
+    channels: dict[str, list[int]]
+
+
+def parse_tenants(data, policies) -> dict[int, WatchTenant]:
+    """Build tenants from their JSON shape, skipping malformed entries and unknown policies."""
+    tenants: dict[int, WatchTenant] = {}
+    if not isinstance(data, dict):
+        return tenants
+    for raw_guild_id, raw_tenant in data.items():
+        if not str(raw_guild_id).isdigit() or not isinstance(raw_tenant, dict):
+            continue
+        groups = []
+        for entry in raw_tenant.get("groups") or []:
+            if not isinstance(entry, dict) or not entry.get("group_id"):
+                continue
+            policy_name = str(entry.get("policy", "")).strip().upper()
+            if policy_name in policies:
+                groups.append(WatchedGroup(str(entry["group_id"]).strip(), policy_name, int(entry.get("precedence", 0))))
+        channels = {}
+        raw_channels = raw_tenant.get("channels") if isinstance(raw_tenant.get("channels"), dict) else {}
+        for policy_name, channel_ids in raw_channels.items():
+            policy_name = str(policy_name).upper()
+            if policy_name in policies and isinstance(channel_ids, list):
+                channels[policy_name] = [int(channel_id) for channel_id in channel_ids if str(channel_id).isdigit()]
+        tenants[int(raw_guild_id)] = WatchTenant(int(raw_guild_id), tuple(groups), channels)
+    return tenants
+
+
+def cap_tenant_roster(roster: dict, owner_roster: dict, limit: int = TENANT_MAX_MEMBERS) -> tuple[dict, int]:
+    """Drop a tenant's members beyond ``limit`` that the owner does not watch.
+
+    Members the owner already sweeps cost the tenant nothing. The kept extras
+    are the first ``limit`` keys in sorted order, so the cut is stable between
+    sweeps. Returns the capped roster and the number of members dropped.
+    """
+    extras = sorted(username_lc for username_lc in roster if username_lc not in owner_roster)
+    dropped = set(extras[limit:])
+    if not dropped:
+        return roster, 0
+    return {username_lc: entry for username_lc, entry in roster.items() if username_lc not in dropped}, len(dropped)
+
+
+def dump_tenants(tenants: dict[int, WatchTenant]) -> dict:
+    return {
+        str(guild_id): {
+            "groups": [group._asdict() for group in tenant.groups],
+            "channels": {policy_name.lower(): channel_ids for policy_name, channel_ids in tenant.channels.items() if channel_ids},
+        }
+        for guild_id, tenant in tenants.items()
+    }
+
+
+class TenantAlertLog:
+    """Alert keys each tenant already received for a member's current offline window.
+
+    An entry is tied to the window's start (None while online), so a new window
+    starts a fresh dedupe bucket exactly like the default tenant's sent_alerts.
+    """
+
+    def __init__(self, data: dict | None = None):
+        self._entries: dict[int, dict[str, dict]] = {}
+        for raw_guild_id, members in (data or {}).items():
+            if not str(raw_guild_id).isdigit() or not isinstance(members, dict):
+                continue
+            self._entries[int(raw_guild_id)] = {
+                str(username_lc): {"window": entry.get("window"), "sent": [str(key) for key in entry.get("sent") or []]}
+                for username_lc, entry in members.items()
+                if isinstance(entry, dict)
+            }
+
+    def mark_sent(self, guild_id: int, username_lc: str, window: str | None, alert_key: str) -> bool:
+        """Record ``alert_key`` for this window; return False when it was already sent."""
+        members = self._entries.setdefault(guild_id, {})
+        entry = members.get(username_lc)
+        if entry is None or entry["window"] != window:
+            entry = members[username_lc] = {"window": window, "sent": []}
+        if alert_key in entry["sent"]:
+            return False
+        entry["sent"].append(alert_key)
+        return True
+
+    def retain(self, rosters: dict[int, dict]):
+        """Forget tenants and members that are no longer watched."""
+        self._entries = {
+            guild_id: {username_lc: entry for username_lc, entry in members.items() if username_lc in rosters[guild_id]}
+            for guild_id, members in self._entries.items()
+            if guild_id in rosters
+        }
+
+    def to_json(self) -> dict:
+        return {str(guild_id): members for guild_id, members in self._entries.items() if members}
@@ -0,0 +1,108 @@
+"""Microbenchmark: per-member CPU of the watcher sweep's status evaluation.
+
+Compares the old path (``evaluate_user`` renders a full embed for every member)
+against the current one (``evaluate_status`` for everyone, embed rendering only
+for members whose alert is sent) on a synthetic roster.
+
+Run from the bot root, in the bot's environment (discord.py installed):
+
+    python benchmarks/bench_watcher_sweep.py --members 10000
+"""
+
+import argparse
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+import random
+import sys
+import time
+import types
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+if str(BASE_DIR) not in sys.path:
+    sys.path.insert(0, str(BASE_DIR))
+
+from COGS.HabboProfileWatcher import HabboWatch  # noqa: E402
+
+
+def build_roster(member_count: int, seed: int = 1) -> list[tuple[dict, str, datetime | None, str]]:
+    """Return (user_json, username, offline_since, policy) rows with a realistic mix."""
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    rows = []
+    for index in range(member_count):
+        name = f"Member{index}"
+        online = rng.random() < 0.3
+        offline_since = None if online else now - timedelta(hours=rng.uniform(0, 80))
+        user_json = {
+            "name": name,
+            "uniqueId": f"hhus-{index:08x}",
+            "figureString": "hr-100-61.hd-180-1.ch-210-66.lg-270-82.sh-290-80",
+            "online": online,
+            "profileVisible": rng.random() > 0.01,
+        }
+        rows.append((user_json, name.lower(), offline_since, "MOD" if index % 3 else "OOA"))
+    return rows
+
+
+def make_watch() -> HabboWatch:
+    watch = HabboWatch.__new__(HabboWatch)
+    watch.bot = types.SimpleNamespace(user=types.SimpleNamespace(name="Benchmark"))
+    return watch
+
+
+def sweep_before(watch: HabboWatch, rows) -> int:
+    alerts = 0
+    for user_json, username, offline_since, policy_name in rows:
+        _embed, _online, alert_key, _name, _avatar_url = watch.evaluate_user(user_json, username, offline_since, policy_name)
+        alerts += alert_key is not None
+    return alerts
+
+
+def sweep_after(watch: HabboWatch, rows, sent_alerts: set[str]) -> int:
+    alerts = 0
+    for user_json, username, offline_since, policy_name in rows:
+        status = watch.evaluate_status(user_json, username, offline_since, policy_name)
+        # Only alerts that have not been sent yet are rendered, as in periodic_check.
+        if status.alert_key and (username, status.alert_key) not in sent_alerts:
+            watch.render_status_embed(user_json, status, offline_since, policy_name)
+            sent_alerts.add((username, status.alert_key))
+            alerts += 1
+    return alerts
+
+
+def best_of(repeats: int, func, *args) -> float:
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--members", type=int, default=10_000)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    watch = make_watch()
+    rows = build_roster(args.members)
+    before = best_of(args.repeats, sweep_before, watch, rows)
+    # Steady state: alerts were delivered on an earlier sweep, so nothing renders.
+    sent_alerts: set = set()
+    sweep_after(watch, rows, sent_alerts)
+    after = best_of(args.repeats, sweep_after, watch, rows, sent_alerts)
+    first_sweep = best_of(1, sweep_after, watch, rows, set())
+
+    per_member = 1_000_000 / args.members
+    print(f"members: {args.members}")
+    for label, seconds in (
+        ("before (render every member)", before),
+        ("after (steady state)", after),
+        ("after (first sweep, all alerts)", first_sweep),
+    ):
+        print(f"{label:<33} {seconds * per_member:8.2f} us/member {seconds * 1000:8.1f} ms/sweep")
+
+
+if __name__ == "__main__":
+    main()
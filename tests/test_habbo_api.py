@@ -0,0 +1,137 @@
+"""Unit tests for the Habbo hotel registry and per-hotel rate budgets."""
+
+import asyncio
+from pathlib import Path
+import sys
+import time
+import unittest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from COGS import _habbo_api as habbo_api  # noqa: E402
+
+
+class FakeResponse:
+    def __init__(self, status, payload=None, headers=None):
+        self.status = status
+        self.payload = payload
+        self.headers = headers or {"content-type": "application/json"}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def json(self):
+        return self.payload
+
+
+class FakeSession:
+    def __init__(self, responses):
+        self.responses = responses
+        self.requests = []
+        self.closed = False
+
+    def get(self, url, params=None):
+        self.requests.append(url)
+        return self.responses.pop(0)
+
+    async def close(self):
+        self.closed = True
+
+
+class HotelRegistryTest(unittest.TestCase):
+    def test_normalize_hotel_accepts_codes_domains_and_urls(self):
+        for raw, expected in (
+            (None, "com"),
+            ("DE", "de"),
+            (".es", "es"),
+            ("habbo.com.br", "com.br"),
+            ("https://www.habbo.fi/", "fi"),
+        ):
+            with self.subTest(raw=raw):
+                self.assertEqual(habbo_api.normalize_hotel(raw), expected)
+        with self.assertRaises(ValueError):
+            habbo_api.normalize_hotel("habbo.xx")
+
+    def test_hotel_is_read_from_user_and_group_ids_and_urls(self):
+        self.assertEqual(habbo_api.hotel_from_identifier("hhde-0123456789abcdef"), "de")
+        self.assertEqual(habbo_api.hotel_from_identifier("g-hhbr-0123456789abcdef"), "com.br")
+        self.assertIsNone(habbo_api.hotel_from_identifier("hhzz-0123456789abcdef"))
+        self.assertIsNone(habbo_api.hotel_from_identifier(None))
+        self.assertEqual(habbo_api.hotel_from_url("https://www.habbo.com.tr/api/public/users"), "com.tr")
+        self.assertEqual(habbo_api.hotel_from_url("https://example.com/"), "com")
+
+
+class HabboApiTest(unittest.IsolatedAsyncioTestCase):
+    async def test_each_hotel_gets_its_own_session_and_429_only_pauses_that_hotel(self):
+        sessions = {}
+        responses = [
+            FakeResponse(429, headers={"retry-after": "30"}),
+            FakeResponse(200, {"name": "Alpha"}),
+        ]
+
+        def session_factory():
+            session = FakeSession(responses)
+            sessions[len(sessions)] = session
+            return session
+
+        api = habbo_api.HabboApi(0.0, session_factory=session_factory)
+        self.assertEqual(await api.get_json("https://www.habbo.com/api/public/users"), (429, None))
+        started = time.monotonic()
+        self.assertEqual(await api.get_json("https://www.habbo.de/api/public/users"), (200, {"name": "Alpha"}))
+
+        self.assertLess(time.monotonic() - started, 1)
+        self.assertEqual(len(sessions), 2)
+        cooldowns = api.cooldowns()
+        self.assertGreater(cooldowns["com"], 25)
+        self.assertNotIn("de", cooldowns)
+
+        await api.close()
+        self.assertTrue(all(session.closed for session in sessions.values()))
+
+    async def test_limiter_spaces_requests_and_restores_cooldowns(self):
+        limiter = habbo_api.RateLimiter(0.05)
+        started = time.monotonic()
+        await asyncio.gather(limiter.wait(), limiter.wait(), limiter.wait())
+        self.assertGreaterEqual(time.monotonic() - started, 0.09)
+        # Ordinary request spacing is not reported as a server-imposed pause.
+        self.assertEqual(limiter.remaining(), 0.0)
+
+        api = habbo_api.HabboApi(1.0, session_factory=lambda: FakeSession([]))
+        api.restore_cooldowns({"es": 20, "unknown": 20, "fr": -5})
+        self.assertEqual(set(api.cooldowns()), {"es"})
+
+    async def test_interactive_waiters_overtake_queued_background_waiters(self):
+        limiter = habbo_api.RateLimiter(0.01)
+        order = []
+
+        async def request(label, priority):
+            await limiter.wait(priority)
+            order.append(label)
+
+        tasks = [asyncio.create_task(request(f"sweep{number}", habbo_api.PRIORITY_BACKGROUND)) for number in range(4)]
+        await asyncio.sleep(0)
+        tasks.append(asyncio.create_task(request("check", habbo_api.PRIORITY_INTERACTIVE)))
+        # A cancelled waiter gives up its place without stalling the queue.
+        tasks[2].cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        # sweep1 was already sleeping out the interval and keeps its slot.
+        self.assertEqual(order, ["sweep0", "sweep1", "check", "sweep3"])
+        await asyncio.wait_for(limiter.wait(), 1)
+
+    async def test_request_failures_return_no_status(self):
+        class BrokenSession(FakeSession):
+            def get(self, url, params=None):
+                raise OSError("connection reset")
+
+        api = habbo_api.HabboApi(0.0, session_factory=lambda: BrokenSession([]))
+        with self.assertLogs(habbo_api.LOGGER, level="WARNING"):
+            self.assertEqual(await api.get_json("https://www.habbo.nl/api/public/users"), (None, None))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+"""Unit tests for set-based badge and group snapshots."""
+
+from pathlib import Path
+import sys
+import unittest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from COGS import _habbo_collections as collections  # noqa: E402
+
+
+class CollectionHelpersTest(unittest.TestCase):
+    def test_ids_are_sorted_and_deduplicated(self):
+        items = [{"code": "b"}, {"code": "a"}, {"code": "b"}, {"name": "no id"}, "junk"]
+        self.assertEqual(collections.collection_ids(items, "code"), ["a", "b"])
+        self.assertEqual(collections.collection_ids(None, "code"), [])
+
+    def test_digest_follows_selected_badges_and_experience(self):
+        profile = {"selectedBadges": [{"code": "A"}, {"code": "B"}], "totalExperience": 10, "motto": "x"}
+        reordered = {"selectedBadges": [{"code": "B"}, {"code": "A"}], "totalExperience": 10, "motto": "y"}
+        self.assertEqual(collections.profile_digest(profile), collections.profile_digest(reordered))
+        self.assertNotEqual(
+            collections.profile_digest(profile), collections.profile_digest({**profile, "totalExperience": 11})
+        )
+
+    def test_diff_reports_set_differences_with_names(self):
+        old = {"groups": ["g-1", "g-2"], "badges": ["A"], "names": {"g-2": "Left group"}}
+        new = {"groups": ["g-1", "g-3"], "badges": ["A"], "selectedBadges": ["A"], "names": {"g-3": "New group"}}
+        self.assertEqual(
+            collections.diff_collections(old, new, collections.COLLECTION_SOURCES),
+            {"groups": {"added": ["New group (g-3)"], "removed": ["Left group (g-2)"]}},
+        )
+
+    def test_describe_items_caps_long_lists(self):
+        items = [f"B{number}" for number in range(12)]
+        self.assertTrue(collections.describe_items(items).endswith("and 2 more"))
+        self.assertEqual(collections.describe_items([]), "None")
+
+
+if __name__ == "__main__":
+    unittest.main()
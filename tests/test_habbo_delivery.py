@@ -0,0 +1,289 @@
+"""Unit tests for the shared Habbo Discord delivery helpers."""
+
+import asyncio
+from pathlib import Path
+import sys
+import types
+import unittest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+try:
+    import discord
+except ImportError:
+    discord = None
+if not hasattr(discord, "RateLimited"):
+    # discord.py is not installed here; mirror the constructors of the two
+    # exception types the outbox inspects.
+    discord = types.ModuleType("discord")
+
+    class HTTPException(Exception):
+        def __init__(self, response, message):
+            self.response = response
+            self.status = response.status
+            super().__init__(f"{response.status} {response.reason}: {message}")
+
+    class RateLimited(Exception):
+        def __init__(self, retry_after):
+            self.retry_after = retry_after
+            super().__init__(f"Too many requests. Retry in {retry_after:.2f} seconds.")
+
+    discord.HTTPException = HTTPException
+    discord.RateLimited = RateLimited
+    sys.modules["discord"] = discord
+
+from COGS import _habbo_delivery as delivery  # noqa: E402
+
+
+class FakeDestination:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.messages = []
+
+    async def send(self, embed=None, embeds=None):
+        if self.fail:
+            raise RuntimeError("cannot send")
+        self.messages.append([embed] if embeds is None else list(embeds))
+
+
+class NotificationOutboxTest(unittest.TestCase):
+    def make_outbox(self, destinations):
+        async def resolve(destination):
+            return destinations.get(destination)
+
+        return delivery.NotificationOutbox(resolve, coalesce_seconds=0)
+
+    def run_outbox(self, outbox, enqueue):
+        async def run():
+            enqueue()
+            await outbox.flush()
+
+        asyncio.run(run())
+
+    def test_packs_up_to_ten_embeds_per_message(self):
+        channel = FakeDestination()
+        outbox = self.make_outbox({"mod": channel})
+
+        self.run_outbox(outbox, lambda: [outbox.enqueue(f"embed-{index}", ["mod"]) for index in range(23)])
+
+        self.assertEqual([len(message) for message in channel.messages], [10, 10, 3])
+        self.assertEqual(channel.messages[0][0], "embed-0")
+        self.assertEqual(outbox.stats()["sent_messages"], 3)
+        self.assertEqual(outbox.stats()["sent_embeds"], 23)
+        self.assertEqual(outbox.queue_depth, 0)
+
+    def test_respects_the_per_message_embed_character_limit(self):
+        channel = FakeDestination()
+        outbox = self.make_outbox({"mod": channel})
+        large = "x" * 4000
+
+        self.run_outbox(outbox, lambda: [outbox.enqueue(large, ["mod"]) for _ in range(3)])
+
+        self.assertEqual([len(message) for message in channel.messages], [1, 1, 1])
+
+    def test_fallback_is_used_only_when_every_destination_fails(self):
+        broken = FakeDestination(fail=True)
+        working = FakeDestination()
+        owner = FakeDestination()
+        outbox = self.make_outbox({"broken": broken, "working": working, "owner": owner})
+
+        def enqueue():
+            outbox.enqueue("partial", ["broken", "working"], fallback="owner")
+            outbox.enqueue("failed", ["broken"], fallback="owner")
+
+        self.run_outbox(outbox, enqueue)
+
+        self.assertEqual(working.messages, [["partial"]])
+        self.assertEqual(owner.messages, [["failed"]])
+        self.assertEqual(outbox.stats()["failed_embeds"], 2)
+
+    def test_enqueue_returns_before_anything_is_sent(self):
+        channel = FakeDestination()
+        outbox = self.make_outbox({"mod": channel})
+
+        async def run():
+            outbox.enqueue("embed", ["mod"])
+            depth = outbox.queue_depth
+            await outbox.flush()
+            return depth
+
+        self.assertEqual(asyncio.run(run()), 1)
+        self.assertEqual(channel.messages, [["embed"]])
+        self.assertIsNotNone(outbox.stats()["last_latency"])
+
+    def assert_rate_limit_requeues(self, error):
+        class ThrottledOnce(FakeDestination):
+            async def send(self, embed=None, embeds=None):
+                if not self.messages and not getattr(self, "throttled", False):
+                    self.throttled = True
+                    # A warning arrives while Discord is throttling the channel.
+                    outbox.enqueue("warning", ["mod"], priority=delivery.PRIORITY_HIGH)
+                    raise error
+                await super().send(embed=embed, embeds=embeds)
+
+        channel = ThrottledOnce()
+        outbox = self.make_outbox({"mod": channel})
+
+        self.run_outbox(outbox, lambda: outbox.enqueue("routine", ["mod"], priority=delivery.PRIORITY_LOW))
+
+        self.assertEqual(channel.messages, [["warning", "routine"]])
+        self.assertEqual(outbox.stats()["failed_embeds"], 0)
+
+    def test_rate_limited_batch_is_retried_after_more_urgent_embeds(self):
+        # The exception discord.py raises instead of sleeping out a long 429.
+        self.assert_rate_limit_requeues(delivery.discord.RateLimited(0.01))
+
+    def test_http_429_is_retried_like_a_rate_limit(self):
+        response = types.SimpleNamespace(status=429, reason="Too Many Requests")
+        original_backoff = delivery.DEFAULT_RATE_LIMIT_BACKOFF_SECONDS
+        delivery.DEFAULT_RATE_LIMIT_BACKOFF_SECONDS = 0.01
+        try:
+            self.assert_rate_limit_requeues(delivery.discord.HTTPException(response, "You are being rate limited."))
+        finally:
+            delivery.DEFAULT_RATE_LIMIT_BACKOFF_SECONDS = original_backoff
+
+    def test_other_http_errors_are_not_retried(self):
+        response = types.SimpleNamespace(status=403, reason="Forbidden")
+
+        self.assertIsNone(delivery.rate_limit_retry_after(delivery.discord.HTTPException(response, "Missing Access")))
+        self.assertIsNone(delivery.rate_limit_retry_after(RuntimeError("cannot send")))
+
+    def test_lower_ranked_item_never_replaces_a_newer_queued_one(self):
+        channel = FakeDestination()
+        outbox = self.make_outbox({"mod": channel})
+
+        def enqueue():
+            outbox.enqueue("24h", ["mod"], coalesce_key="alpha", rank=3)
+            outbox.enqueue("23h", ["mod"], coalesce_key="alpha", rank=2)
+
+        self.run_outbox(outbox, enqueue)
+
+        self.assertEqual(channel.messages, [["24h"]])
+        self.assertEqual(outbox.stats()["superseded_embeds"], 1)
+
+
+class FakeStatusError(Exception):
+    def __init__(self, status):
+        super().__init__(f"HTTP {status}")
+        self.status = status
+
+
+class DestinationCacheTest(unittest.TestCase):
+    def make_bot(self):
+        bot = types.SimpleNamespace(lookups=[])
+        dm_channel = FakeDestination()
+
+        class User:
+            dm_channel = None
+
+            async def create_dm(self):
+                bot.lookups.append("create_dm")
+                return dm_channel
+
+        async def fetch_channel(channel_id):
+            bot.lookups.append(("channel", channel_id))
+            return FakeDestination()
+
+        async def fetch_user(user_id):
+            bot.lookups.append(("user", user_id))
+            return User()
+
+        bot.get_channel = lambda channel_id: None
+        bot.fetch_channel = fetch_channel
+        bot.fetch_user = fetch_user
+        return bot, dm_channel
+
+    def test_cache_is_shared_per_bot_and_resolves_each_destination_once(self):
+        bot, dm_channel = self.make_bot()
+        cache = delivery.DestinationCache.for_bot(bot)
+
+        async def resolve():
+            for _ in range(3):
+                await delivery.DestinationCache.for_bot(bot).channel(111)
+                await delivery.DestinationCache.for_bot(bot).user_dm(222)
+            return await cache.user_dm(222)
+
+        self.assertIs(asyncio.run(resolve()), dm_channel)
+        self.assertEqual(bot.lookups, [("channel", 111), ("user", 222), "create_dm"])
+
+    def test_only_forbidden_or_not_found_invalidates(self):
+        bot, _dm_channel = self.make_bot()
+        cache = delivery.DestinationCache.for_bot(bot)
+
+        async def resolve_after(exc):
+            await cache.channel(111)
+            cache.invalidate(("channel", 111), exc)
+            await cache.channel(111)
+
+        asyncio.run(resolve_after(FakeStatusError(500)))
+        self.assertEqual(bot.lookups, [("channel", 111)])
+        asyncio.run(resolve_after(FakeStatusError(404)))
+        self.assertEqual(bot.lookups, [("channel", 111), ("channel", 111)])
+
+
+class WebhookDeliveryTest(unittest.TestCase):
+    def make_channel(self, webhook_status=None):
+        channel = FakeDestination()
+        channel.id = 111
+        channel.created = []
+
+        class Webhook:
+            name = delivery.WEBHOOK_NAME
+            token = "token"
+
+            def __init__(self):
+                self.messages = []
+
+            async def send(self, **kwargs):
+                if webhook_status is not None:
+                    raise FakeStatusError(webhook_status)
+                self.messages.append(kwargs)
+
+        async def webhooks():
+            return []
+
+        async def create_webhook(name, reason=None):
+            webhook = Webhook()
+            channel.created.append(webhook)
+            return webhook
+
+        channel.webhooks = webhooks
+        channel.create_webhook = create_webhook
+        return channel
+
+    def make_bot(self, channel):
+        return types.SimpleNamespace(get_channel=lambda channel_id: channel if channel_id == channel.id else None)
+
+    def test_webhook_is_created_once_and_reused_for_every_send(self):
+        channel = self.make_channel()
+        bot = self.make_bot(channel)
+
+        async def send_twice():
+            destination = await delivery.DestinationCache.for_bot(bot).resolve(("webhook", 111))
+            await destination.send(embed="first")
+            await destination.send(embeds=["second", "third"])
+
+        asyncio.run(send_twice())
+
+        self.assertEqual(len(channel.created), 1)
+        self.assertEqual(channel.created[0].messages, [{"embed": "first"}, {"embeds": ["second", "third"]}])
+        self.assertEqual(channel.messages, [])
+
+    def test_deleted_webhook_falls_back_to_a_normal_channel_send(self):
+        channel = self.make_channel(webhook_status=404)
+        bot = self.make_bot(channel)
+
+        async def send():
+            destination = await delivery.DestinationCache.for_bot(bot).resolve(("webhook", 111))
+            await destination.send(embed="alert")
+
+        asyncio.run(send())
+
+        self.assertEqual(channel.messages, [["alert"]])
+        self.assertNotIn(111, delivery.WebhookPool.for_bot(bot)._webhooks)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+"""Unit tests for the Habbo ID tracker's per-field change index."""
+
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+import sys
+import unittest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from COGS._habbo_history import ChangeIndex  # noqa: E402
+
+START = datetime(2026, 3, 1, tzinfo=timezone.utc)
+ALPHA = "hhus-aaaaaaaaaaaaaaaa"
+BETA = "hhus-bbbbbbbbbbbbbbbb"
+
+
+def entry(habbo_id, day, *fields):
+    return {
+        "habbo_id": habbo_id,
+        "detected_at": (START + timedelta(days=day)).isoformat(),
+        "changes": {field: {"old": day - 1, "new": day} for field in fields},
+    }
+
+
+class ChangeIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.log = [
+            entry(ALPHA, 0, "motto"),
+            entry(BETA, 1, "motto", "name"),
+            entry(ALPHA, 2, "name"),
+            entry(ALPHA, 3, "motto", "online"),
+        ]
+        self.index = ChangeIndex(self.log)
+
+    def test_queries_by_id_field_and_since_newest_first(self):
+        self.assertEqual(list(self.index.query(ALPHA)), [self.log[3], self.log[2], self.log[0]])
+        self.assertEqual(list(self.index.query(ALPHA, "motto")), [self.log[3], self.log[0]])
+        since = (START + timedelta(days=1)).timestamp()
+        self.assertEqual(list(self.index.query(ALPHA, "motto", since)), [self.log[3]])
+        self.assertEqual(self.index.count(ALPHA, since=since), 2)
+        self.assertEqual(self.index.count(BETA, "online"), 0)
+        self.assertEqual(self.index.fields(ALPHA), ["motto", "name", "online"])
+
+    def test_discard_forgets_trimmed_head_entries(self):
+        self.index.discard(self.log[:2])
+        self.assertEqual(list(self.index.query(ALPHA, "motto")), [self.log[3]])
+        self.assertEqual(self.index.count(BETA), 0)
+        self.assertEqual(self.index.fields(BETA), [])
+
+    def test_out_of_order_and_malformed_entries(self):
+        late = entry(ALPHA, 1, "motto")
+        self.index.add(late)
+        self.index.add({"habbo_id": ALPHA, "detected_at": "not a time", "changes": {}})
+        self.assertEqual(list(self.index.query(ALPHA, "motto")), [self.log[3], late, self.log[0]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+"""Unit tests for the tracker's sorted ID index."""
+
+from pathlib import Path
+import sys
+import unittest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from COGS._habbo_id_index import TrackedIdIndex  # noqa: E402
+
+
+class TrackedIdIndexTest(unittest.TestCase):
+    def setUp(self):
+        tracked = {f"hhus-{number:016x}": {"name": f"User{number:03d}"} for number in range(45)}
+        tracked["hhde-ffffffffffffffff"] = {"name": "alpha"}
+        tracked["hhus-eeeeeeeeeeeeeeee"] = {"name": None}
+        self.index = TrackedIdIndex(tracked)
+
+    def test_pages_are_sorted_and_clamped(self):
+        first = self.index.page("name", page=0, page_size=20)
+        self.assertEqual((first.total, first.pages), (47, 3))
+        # Unknown names sort first, then case-insensitively by name.
+        self.assertEqual(first.habbo_ids[:2], ["hhus-eeeeeeeeeeeeeeee", "hhde-ffffffffffffffff"])
+        last = self.index.page("name", page=99, page_size=20)
+        self.assertEqual((last.page, len(last.habbo_ids)), (2, 7))
+        self.assertEqual(self.index.page("id", page_size=1).habbo_ids, ["hhde-ffffffffffffffff"])
+
+    def test_prefix_filters_by_the_sort_key(self):
+        page = self.index.page("name", "user04", page_size=20)
+        self.assertEqual(page.total, 5)
+        self.assertEqual(page.habbo_ids[0], "hhus-0000000000000028")
+        self.assertEqual(self.index.page("id", "hhde-").habbo_ids, ["hhde-ffffffffffffffff"])
+        self.assertEqual(self.index.page("name", "zzz").total, 0)
+
+    def test_add_remove_and_rename_keep_both_orders(self):
+        self.index.rename("hhde-ffffffffffffffff", "Zed")
+        self.index.remove("hhus-eeeeeeeeeeeeeeee")
+        self.index.add("hhus-dddddddddddddddd", "Aardvark")
+        self.assertEqual(len(self.index), 47)
+        self.assertEqual(self.index.page("name", page_size=1).habbo_ids, ["hhus-dddddddddddddddd"])
+        self.assertEqual(self.index.page("name", "z").habbo_ids, ["hhde-ffffffffffffffff"])
+        self.assertEqual(self.index.page("id", "hhus-e").total, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
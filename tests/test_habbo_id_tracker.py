@@ -1,10 +1,14 @@
 """Focused unit tests for Habbo ID validation and change detection."""
 
 import importlib.util
+import json
 from pathlib import Path
+import shutil
 import sys
+import tempfile
 import types
 import unittest
+from unittest import mock
 
 
 def load_tracker_module():
@@ -16,10 +20,18 @@ def load_tracker_module():
 
     discord = types.ModuleType("discord")
     discord.TextChannel = object
-    discord.AllowedMentions = object
+    discord.AllowedMentions = lambda **kwargs: kwargs
     discord.HTTPException = type("HTTPException", (Exception,), {})
     discord.NotFound = type("NotFound", (Exception,), {})
     discord.Forbidden = type("Forbidden", (Exception,), {})
+    discord.RateLimited = type("RateLimited", (Exception,), {})
+    discord.ButtonStyle = types.SimpleNamespace(secondary=2)
+
+    class ViewStub:
+        def __init__(self, timeout=None):
+            self.timeout = timeout
+
+    discord.ui = types.SimpleNamespace(View=ViewStub, Button=object, button=lambda **kwargs: (lambda function: function))
 
     commands = types.ModuleType("discord.ext.commands")
     commands.Cog = object
@@ -49,14 +61,54 @@ def load_tracker_module():
     sys.modules.update({"aiohttp": aiohttp, "discord": discord, "discord.ext": ext,
                         "discord.ext.commands": commands, "discord.ext.tasks": tasks})
 
-    path = Path(__file__).resolve().parents[1] / "COGS" / "HabboIdTracker.py"
+    # Shared COGS helpers are imported by package path, as bot.py does. Drop any
+    # copies cached by another test module so they bind to these stubs.
+    repo_root = Path(__file__).resolve().parents[1]
+    if str(repo_root) not in sys.path:
+        sys.path.insert(0, str(repo_root))
+    for module_name in [name for name in sys.modules if name == "COGS" or name.startswith("COGS.")]:
+        del sys.modules[module_name]
+
+    path = repo_root / "COGS" / "HabboIdTracker.py"
     spec = importlib.util.spec_from_file_location("habbo_id_tracker_under_test", path)
     module = importlib.util.module_from_spec(spec)
     spec.loader.exec_module(module)
     return module
 
 
-HabboIdTracker = load_tracker_module().HabboIdTracker
+tracker_module = load_tracker_module()
+HabboIdTracker = tracker_module.HabboIdTracker
+
+
+class NoDetailsApi:
+    """Answers every badge and group request with an empty list."""
+
+    async def get_json(self, url, params=None, priority=None):
+        return 200, []
+
+
+def build_tracker(test, bot=None, *, api=None, tracked_ids=None, snapshots=None, changes=None, collections=None, config=None):
+    """Run the real constructor with its JSON files in a temporary directory.
+
+    Seeded state is written to those files first, so it loads and is indexed
+    as it would be on startup. The bot gets its own observation bus on ``api``.
+    """
+    directory = Path(tempfile.mkdtemp())
+    test.addCleanup(shutil.rmtree, directory, True)
+    seeds = {
+        "habbo_tracked_ids": tracked_ids,
+        "habbo_id_snapshots": snapshots,
+        "habbo_id_changes": changes,
+        "habbo_id_collections": collections,
+        "habbo_id_tracker_config": config,
+    }
+    for name, value in seeds.items():
+        if value is not None:
+            (directory / f"{name}.json").write_text(json.dumps(value), encoding="utf-8")
+    bot = bot if bot is not None else types.SimpleNamespace()
+    bot.habbo_observation_bus = tracker_module.ProfileObservationBus(api=api or NoDetailsApi())
+    with mock.patch.object(tracker_module, "JSON_DIR", directory):
+        return HabboIdTracker(bot)
 
 
 class HabboIdTrackerHelpersTest(unittest.TestCase):
@@ -67,7 +119,7 @@ class HabboIdTrackerHelpersTest(unittest.TestCase):
         )
 
     def test_normalize_habbo_id_rejects_names_and_urls(self):
-        for invalid in ("Noah", "hhus-short", "https://www.habbo.com/profile/test"):
+        for invalid in ("Noah", "hhus-short", "https://www.habbo.com/profile/test", "hhzz-452093bfeba8168bb70ea408bea12112"):
             with self.subTest(invalid=invalid), self.assertRaises(ValueError):
                 HabboIdTracker.normalize_habbo_id(invalid)
 
@@ -109,5 +161,523 @@ class HabboIdTrackerHelpersTest(unittest.TestCase):
         self.assertEqual(HabboIdTracker.compare_snapshots(snapshot, snapshot.copy()), {})
 
 
+class HabboIdTrackerObservationTest(unittest.TestCase):
+    def test_profiles_fetched_by_another_cog_are_diffed_once(self):
+        import asyncio
+
+        habbo_id = "hhus-452093bfeba8168bb70ea408bea12112"
+        sent = []
+
+        tracker = build_tracker(
+            self,
+            tracked_ids={habbo_id: {"name": "Before"}},
+            snapshots={habbo_id: {"name": "Before", "motto": "Old"}},
+        )
+        tracker.outbox = types.SimpleNamespace(enqueue=lambda embed, destinations: sent.append(embed))
+        tracker.build_change_embed = lambda habbo_id, profile, differences: sorted(differences)
+        bus = tracker.observations
+        profile = {"uniqueId": habbo_id, "name": "Before", "motto": "New"}
+
+        async def observe_then_scan():
+            # The watcher's name lookup publishes the profile first...
+            bus.publish(profile, "com")
+            await bus.drain()
+            # ...and the tracker's scan reuses it instead of calling Habbo.
+            return await tracker.scan_profiles()
+
+        self.assertEqual(asyncio.run(observe_then_scan()), 0)
+        self.assertEqual(sent, [["motto"]])
+        self.assertEqual(tracker.snapshots[habbo_id]["motto"], "New")
+        self.assertEqual(len(tracker.changes), 1)
+
+    def test_fresh_scan_fetches_are_not_diffed_again_by_the_subscriber(self):
+        import asyncio
+
+        habbo_id = "hhus-452093bfeba8168bb70ea408bea12112"
+        profile = {"uniqueId": habbo_id, "name": "Alpha", "selectedBadges": [{"code": "B"}]}
+        sent = []
+
+        class Api:
+            async def get_json(self, url, params=None, priority=None):
+                await asyncio.sleep(0)
+                if url.endswith(habbo_id):
+                    return 200, dict(profile)
+                return 200, []
+
+        tracker = build_tracker(
+            self,
+            api=Api(),
+            tracked_ids={habbo_id: {"name": "Alpha"}},
+            snapshots={habbo_id: {"name": "Alpha"}},
+            collections={habbo_id: {"selectedBadges": ["A"], "badges": [], "groups": []}},
+        )
+        tracker.outbox = types.SimpleNamespace(enqueue=lambda embed, destinations: sent.append(embed))
+        tracker.build_change_embed = lambda habbo_id, profile, differences: sorted(differences)
+        bus = tracker.observations
+
+        async def scan():
+            posted = await tracker.scan_profiles(due_only=False, max_age=0)
+            await bus.drain()
+            return posted
+
+        self.assertEqual(asyncio.run(scan()), 1)
+        self.assertEqual(sent, [["selectedBadges"]])
+        self.assertEqual(len(tracker.changes), 1)
+        self.assertEqual(tracker._scan_ids, set())
+
+
+class HabboIdTrackerScanEngineTest(unittest.TestCase):
+    def make_tracker(self, ids):
+        return build_tracker(self, tracked_ids={habbo_id: {"name": None} for habbo_id in ids}, config={"scan_concurrency": 2})
+
+    def test_scan_bounds_concurrency_and_retries_rate_limited_ids_once(self):
+        import asyncio
+
+        ids = [f"hhus-{index:016x}" for index in range(6)]
+        in_flight = []
+        peak = []
+        calls = []
+        tracker = self.make_tracker(ids)
+
+        async def fetch_profile_result(habbo_id, max_age=0.0):
+            calls.append(habbo_id)
+            in_flight.append(habbo_id)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.remove(habbo_id)
+            if habbo_id == ids[0] and calls.count(habbo_id) == 1:
+                return 429, None
+            if habbo_id == ids[1]:
+                return 429, None
+            return 200, {"uniqueId": habbo_id, "name": habbo_id[-4:]}
+
+        tracker.fetch_profile_result = fetch_profile_result
+        asyncio.run(tracker.scan_profiles(due_only=False))
+
+        self.assertLessEqual(max(peak), 2)
+        self.assertEqual(calls.count(ids[0]), 2)
+        # Retried once, then left for the next scan.
+        self.assertEqual(calls.count(ids[1]), 2)
+        self.assertEqual(set(tracker.snapshots), set(ids) - {ids[1]})
+        self.assertEqual(set(json.loads(tracker.snapshots_file.read_text())), set(ids) - {ids[1]})
+
+    def test_removing_an_id_during_a_scan_does_not_wait_for_it(self):
+        import asyncio
+
+        ids = [f"hhus-{index:016x}" for index in range(3)]
+        tracker = self.make_tracker(ids)
+
+        async def run():
+            gate = asyncio.Event()
+
+            async def fetch_profile_result(habbo_id, max_age=0.0):
+                await gate.wait()
+                return 200, {"uniqueId": habbo_id, "name": "Name"}
+
+            tracker.fetch_profile_result = fetch_profile_result
+            scan = asyncio.create_task(tracker.scan_profiles(due_only=False))
+            await asyncio.sleep(0)
+            # habboidremove's state update completes while lookups are in flight.
+            tracker.tracked_ids.pop(ids[0])
+            await asyncio.wait_for(tracker.save_state(include_changes=False), timeout=1)
+            gate.set()
+            await scan
+
+        asyncio.run(run())
+        self.assertNotIn(ids[0], tracker.snapshots)
+        self.assertEqual(set(tracker.snapshots), set(ids[1:]))
+
+
+class HabboIdTrackerPollTierTest(unittest.TestCase):
+    def make_tracker(self, changes, config=None):
+        added_at = {"added_at": "2026-01-01T00:00:00+00:00"}
+        tracked_ids = {habbo_id: dict(added_at) for habbo_id in ("hhus-hot", "hhus-warm", "hhus-cold")}
+        return build_tracker(self, tracked_ids=tracked_ids, changes=changes, config=config or {})
+
+    def test_tiers_come_from_the_change_log_and_changes_promote_immediately(self):
+        from datetime import datetime, timedelta, timezone
+
+        now = datetime(2026, 3, 1, tzinfo=timezone.utc)
+        tracker = self.make_tracker(
+            [
+                {"habbo_id": "hhus-hot", "detected_at": (now - timedelta(hours=3)).isoformat()},
+                {"habbo_id": "hhus-warm", "detected_at": (now - timedelta(days=3)).isoformat()},
+                {"habbo_id": "hhus-gone", "detected_at": now.isoformat()},
+            ],
+            {"poll_intervals_minutes": {"cold": 240}},
+        )
+        now = now.timestamp()
+
+        self.assertEqual(
+            {habbo_id: tracker.poll_tier(habbo_id, now) for habbo_id in tracker.tracked_ids},
+            {"hhus-hot": "hot", "hhus-warm": "warm", "hhus-cold": "cold"},
+        )
+        self.assertEqual(tracker.tier_counts(now), {"hot": 1, "warm": 1, "cold": 1})
+        # After a restart each ID falls due somewhere within its own interval,
+        # not all at once, then only as its tier allows.
+        tracker.rebuild_poll_schedule(now)
+        for habbo_id, minutes in (("hhus-hot", 2), ("hhus-warm", 15), ("hhus-cold", 240)):
+            self.assertLessEqual(tracker._next_poll_at[habbo_id], now + minutes * 60)
+        self.assertEqual(len(tracker.due_ids(now + 240 * 60)), 3)
+        for habbo_id in tracker.tracked_ids:
+            tracker.schedule_poll(habbo_id, now)
+        self.assertEqual(tracker.due_ids(now + 60), [])
+        self.assertEqual(tracker.due_ids(now + 2 * 60), ["hhus-hot"])
+        self.assertEqual(tracker.due_ids(now + 15 * 60), ["hhus-hot", "hhus-warm"])
+        self.assertNotIn("hhus-cold", tracker.due_ids(now + 120 * 60))
+        self.assertIn("hhus-cold", tracker.due_ids(now + 240 * 60))
+
+        tracker.record_change("hhus-cold", now + 60)
+        self.assertEqual(tracker.poll_tier("hhus-cold", now + 60), "hot")
+        self.assertIn("hhus-cold", tracker.due_ids(now + 3 * 60))
+
+
+    def test_newly_added_ids_start_warm_with_spread_first_polls(self):
+        import time
+
+        tracker = self.make_tracker([])
+        now = time.time()
+        new_ids = [f"hhus-{index:016x}" for index in range(200)]
+        for habbo_id in new_ids:
+            tracker.start_tracking(habbo_id, {"uniqueId": habbo_id, "name": habbo_id[-4:]})
+
+        self.assertEqual({tracker.poll_tier(habbo_id) for habbo_id in new_ids}, {"warm"})
+        next_polls = [tracker._next_poll_at[habbo_id] - now for habbo_id in new_ids]
+        self.assertLessEqual(max(next_polls), 15 * 60 + 1)
+        # Spread over the interval instead of 200 lookups falling due together.
+        self.assertLess(len(tracker.due_ids(now + 5 * 60)), 150)
+        # A reload derives the same tier from added_at.
+        tracker.rebuild_poll_schedule()
+        self.assertEqual(tracker.poll_tier(new_ids[0]), "warm")
+
+
+class HabboIdTrackerNotificationChannelTest(unittest.TestCase):
+    def test_notification_channel_is_fetched_once_and_reused(self):
+        import asyncio
+
+        fetched = []
+
+        class Bot:
+            def get_channel(self, channel_id):
+                return None
+
+            async def fetch_channel(self, channel_id):
+                fetched.append(channel_id)
+                return f"channel-{channel_id}"
+
+        tracker = build_tracker(self, Bot(), config={"channel_id": 555})
+
+        async def resolve_twice():
+            destination = ("channel", tracker._notification_channel_id())
+            return [(await tracker.resolve_alert_destination(destination)).channel for _ in range(2)]
+
+        self.assertEqual(asyncio.run(resolve_twice()), ["channel-555", "channel-555"])
+        self.assertEqual(fetched, [555])
+
+    def test_scan_alerts_are_grouped_with_one_mention(self):
+        import asyncio
+
+        from COGS._habbo_delivery import NotificationOutbox
+
+        messages = []
+
+        class Channel:
+            async def send(self, **kwargs):
+                messages.append(kwargs)
+
+        class Bot:
+            def get_channel(self, channel_id):
+                return Channel()
+
+        tracker = build_tracker(self, Bot(), config={"channel_id": 555, "mention_user_id": 7})
+        tracker.build_change_embed = lambda habbo_id, profile, differences: f"change-{habbo_id}"
+        tracker.build_trivial_summary_embed = lambda trivial: f"summary-{len(trivial)}"
+
+        async def scan():
+            tracker.outbox = NotificationOutbox(tracker.resolve_alert_destination, coalesce_seconds=0)
+            async with tracker._scan_lock:
+                for number in range(12):
+                    self.assertTrue(tracker.queue_alert(f"id{number}", {"name": "n"}, {"motto": {}}))
+                for number in range(3):
+                    self.assertFalse(tracker.queue_alert(f"idle{number}", {"name": "n"}, {"online": {}, "lastAccessTime": {}}))
+                # Nothing is sent while the scan is still running.
+                self.assertEqual(tracker.outbox.queue_depth, 0)
+            self.assertEqual(tracker.flush_alerts(), 13)
+            await tracker.outbox.flush()
+
+        asyncio.run(scan())
+        self.assertEqual([len(message.get("embeds", [message.get("embed")])) for message in messages], [10, 3])
+        self.assertEqual(messages[0]["content"], "<@7>")
+        self.assertNotIn("content", messages[1])
+        self.assertEqual(messages[1]["embeds"][-1], "summary-3")
+
+        # "filter" drops activity-only changes entirely.
+        tracker.config["trivial_changes"] = "filter"
+        tracker.queue_alert("idle", {}, {"online": {}})
+        self.assertEqual(tracker._trivial_alerts, [])
+
+
+class HabboIdTrackerCollectionTest(unittest.TestCase):
+    def test_details_are_fetched_only_when_the_digest_changes(self):
+        import asyncio
+
+        habbo_id = "hhus-452093bfeba8168bb70ea408bea12112"
+        details = {
+            "badges": [{"code": "ACH_1"}],
+            "groups": [{"id": "g-hhus-1", "name": "Old group"}],
+        }
+        requests = []
+
+        class Api:
+            async def get_json(self, url, params=None):
+                endpoint = url.rsplit("/", 1)[1]
+                requests.append(endpoint)
+                return 200, details[endpoint]
+
+        tracker = build_tracker(self, api=Api(), tracked_ids={habbo_id: {"name": "Alpha"}})
+        posted = []
+        tracker.build_change_embed = lambda habbo_id, profile, differences: differences
+        tracker.outbox = types.SimpleNamespace(enqueue=lambda embed, destinations: posted.append(embed))
+        profile = {"uniqueId": habbo_id, "name": "Alpha", "totalExperience": 10, "selectedBadges": [{"code": "ACH_1"}]}
+
+        async def observe(*profiles):
+            for observed in profiles:
+                await tracker.process_profile(habbo_id, observed)
+
+        # Baseline, then an unchanged profile: two detail requests in total.
+        asyncio.run(observe(profile, dict(profile)))
+        self.assertEqual(requests, ["badges", "groups"])
+        self.assertEqual(posted, [])
+
+        # Experience moved: details are refetched and diffed as sets.
+        details["badges"] = [{"code": "ACH_1"}, {"code": "ACH_2"}]
+        details["groups"] = [{"id": "g-hhus-2", "name": "New group"}]
+        asyncio.run(observe({**profile, "totalExperience": 20, "selectedBadges": []}))
+        self.assertEqual(len(requests), 4)
+        self.assertEqual(posted[-1]["badges"], {"added": ["ACH_2"], "removed": []})
+        self.assertEqual(posted[-1]["groups"], {"added": ["New group (g-hhus-2)"], "removed": ["Old group (g-hhus-1)"]})
+        self.assertEqual(posted[-1]["selectedBadges"], {"added": [], "removed": ["ACH_1"]})
+        self.assertEqual(tracker.collections[habbo_id]["groups"], ["g-hhus-2"])
+
+
+    def make_detail_tracker(self, habbo_id, responses, requests):
+        class Api:
+            async def get_json(self, url, params=None):
+                endpoint = url.rsplit("/", 1)[1]
+                requests.append(endpoint)
+                return responses[endpoint]
+
+        return build_tracker(self, api=Api(), tracked_ids={habbo_id: {"name": "Alpha"}})
+
+    def test_observation_during_a_detail_fetch_reports_nothing(self):
+        import asyncio
+
+        habbo_id = "hhus-452093bfeba8168bb70ea408bea12112"
+        requests = []
+        tracker = self.make_detail_tracker(habbo_id, {}, requests)
+        tracker.collections[habbo_id] = {"selectedBadges": ["A"]}
+        tracker._collections_in_flight.add(habbo_id)
+        profile = {"uniqueId": habbo_id, "name": "Alpha", "selectedBadges": [{"code": "B"}]}
+
+        self.assertEqual(asyncio.run(tracker.collection_changes(habbo_id, profile)), {})
+        self.assertEqual(requests, [])
+        self.assertEqual(tracker.collections[habbo_id], {"selectedBadges": ["A"]})
+
+    def test_failed_or_refused_details_are_not_refetched_on_every_observation(self):
+        import asyncio
+
+        habbo_id = "hhus-452093bfeba8168bb70ea408bea12112"
+        profile = {"uniqueId": habbo_id, "name": "Alpha", "totalExperience": 10}
+        requests = []
+        responses = {"badges": (200, []), "groups": (500, None)}
+        tracker = self.make_detail_tracker(habbo_id, responses, requests)
+
+        async def observe(*profiles):
+            for observed in profiles:
+                await tracker.collection_changes(habbo_id, observed)
+
+        # A failing endpoint backs off, even when the digest changes meanwhile.
+        asyncio.run(observe(profile, {**profile, "totalExperience": 20}))
+        self.assertEqual(requests, ["badges", "groups"])
+        state = tracker.collections[habbo_id]
+        self.assertEqual(state["failures"], 1)
+        self.assertIn("checked_at", state)
+        self.assertAlmostEqual(
+            HabboIdTracker._parse_time(state["retry_at"]) - HabboIdTracker._parse_time(state["checked_at"]),
+            tracker_module.COLLECTION_RETRY_MINUTES * 60,
+        )
+
+        # Once the backoff has passed the retry goes out; 403 marks the details hidden.
+        state["retry_at"] = "2000-01-01T00:00:00+00:00"
+        responses.update(badges=(403, None), groups=(404, None))
+        asyncio.run(observe(profile, {**profile, "totalExperience": 30}))
+        self.assertEqual(requests, ["badges", "groups", "badges", "groups"])
+        self.assertEqual(tracker.collections[habbo_id]["unavailable"], ["badges", "groups"])
+        self.assertNotIn("retry_at", tracker.collections[habbo_id])
+        self.assertEqual(tracker.collections[habbo_id]["badges"], [])
+        # Hidden details wait for the refresh interval, not the next digest change.
+        asyncio.run(observe({**profile, "totalExperience": 40}))
+        self.assertEqual(len(requests), 4)
+
+
+class HabboIdTrackerBulkTest(unittest.TestCase):
+    def make_tracker(self):
+        import asyncio
+
+        tracker = build_tracker(self, tracked_ids={"hhus-aaaaaaaaaaaaaaaa": {"name": "Known"}}, config={"scan_concurrency": 2})
+        tracker.saves = 0
+        tracker.in_flight = tracker.peak = 0
+
+        async def save_state(include_changes=True):
+            tracker.saves += 1
+
+        async def fetch_profile_result(habbo_id, max_age=0.0):
+            tracker.in_flight += 1
+            tracker.peak = max(tracker.peak, tracker.in_flight)
+            await asyncio.sleep(0)
+            tracker.in_flight -= 1
+            if habbo_id.endswith("0000"):
+                return 404, None
+            return 200, {"uniqueId": habbo_id, "name": habbo_id[-4:]}
+
+        tracker.save_state = save_state
+        tracker.fetch_profile_result = fetch_profile_result
+        return tracker
+
+    def test_bulk_add_fetches_concurrently_and_saves_once(self):
+        import asyncio
+
+        tracker = self.make_tracker()
+        raw = HabboIdTracker.split_id_list(
+            "hhus-bbbbbbbbbbbb1111, HHUS-bbbbbbbbbbbb1111\nhhus-aaaaaaaaaaaaaaaa;nonsense "
+            "hhus-cccccccccccc2222 hhus-dddddddddddd0000 hhus-bbbbbbbbbbbb1111"
+        )
+        results = asyncio.run(tracker.add_many(raw))
+        self.assertEqual(results, {
+            "hhus-bbbbbbbbbbbb1111": "added (1111)",
+            "HHUS-bbbbbbbbbbbb1111": "duplicate",
+            "hhus-aaaaaaaaaaaaaaaa": "already tracked",
+            "nonsense": "invalid ID",
+            "hhus-cccccccccccc2222": "added (2222)",
+            "hhus-dddddddddddd0000": "no public profile",
+        })
+        self.assertEqual(tracker.saves, 1)
+        self.assertEqual(tracker.peak, 2)
+        self.assertIn("hhus-cccccccccccc2222", tracker._next_poll_at)
+        summary = HabboIdTracker.format_bulk_summary(results)
+        self.assertTrue(summary.startswith("Checked 6 ID(s): 2 added, 1 duplicate"))
+
+    def test_bulk_add_defers_before_reading_the_attachment_and_reports_download_errors(self):
+        import asyncio
+
+        tracker = self.make_tracker()
+        events = []
+
+        class Attachment:
+            size = 100
+
+            async def read(self):
+                events.append("read")
+                raise tracker_module.discord.HTTPException("download failed")
+
+        class Context:
+            message = None
+
+            async def defer(self, ephemeral=False):
+                events.append("defer")
+
+            async def send(self, content, ephemeral=False):
+                events.append(content)
+
+        asyncio.run(tracker.add_habbo_ids(Context(), Attachment(), habbo_ids=""))
+
+        self.assertEqual(events[:2], ["defer", "read"])
+        self.assertTrue(events[2].startswith("I could not download the attached file"))
+        self.assertEqual(tracker.saves, 0)
+
+    def test_bulk_remove_saves_once(self):
+        import asyncio
+
+        tracker = self.make_tracker()
+        results = asyncio.run(tracker.remove_many(["hhus-aaaaaaaaaaaaaaaa", "hhus-eeeeeeeeeeeeeeee", "x"]))
+        self.assertEqual(list(results.values()), ["removed", "not tracked", "invalid ID"])
+        self.assertEqual((tracker.tracked_ids, tracker.saves), ({}, 1))
+
+
+class HabboIdTrackerListTest(unittest.TestCase):
+    def test_list_pages_follow_adds_and_renames(self):
+        import asyncio
+
+        tracker = build_tracker(self, tracked_ids={f"hhus-{number:016x}": {"name": f"User{number:02d}"} for number in range(30)})
+        tracker.render_id_page = lambda order, prefix, page: (
+            tracker.id_index.page(order, prefix, page, tracker_module.LIST_PAGE_SIZE).habbo_ids,
+            tracker.id_index.page(order, prefix, page, tracker_module.LIST_PAGE_SIZE),
+        )
+        sent = []
+
+        class Context:
+            author = types.SimpleNamespace(id=9)
+
+            async def send(self, content=None, embed=None, view=None, ephemeral=False):
+                sent.append((content, embed, view))
+
+        asyncio.run(tracker.list_habbo_ids(Context(), "name", None))
+        self.assertEqual(len(sent[0][1]), 20)
+        self.assertIsInstance(sent[0][2], tracker_module.TrackedIdListView)
+
+        tracker.tracked_ids["hhus-000000000000000a"]["name"] = "Zed"
+        tracker.id_index.rename("hhus-000000000000000a", "Zed")
+        asyncio.run(tracker.list_habbo_ids(Context(), "name", "z"))
+        self.assertEqual(sent[1][1], ["hhus-000000000000000a"])
+        self.assertIsNone(sent[1][2])
+        asyncio.run(tracker.list_habbo_ids(Context(), "name", "nobody"))
+        self.assertIn("No tracked Habbo IDs", sent[2][0])
+
+
+class HabboIdTrackerHistoryTest(unittest.TestCase):
+    def test_history_command_pages_only_matching_entries(self):
+        import asyncio
+
+        habbo_id = "hhus-452093bfeba8168bb70ea408bea12112"
+        changes = [
+            {"habbo_id": habbo_id, "detected_at": f"2026-03-01T00:{minute:02d}:00+00:00",
+             "changes": {"motto" if minute % 2 else "online": {"old": minute - 1, "new": minute}}}
+            for minute in range(60)
+        ]
+        tracker = build_tracker(self, tracked_ids={habbo_id: {"name": "Alpha"}}, changes=changes)
+        tracker.build_history_embed = lambda habbo_id, entries, field, page, pages, total: (
+            [entry["detected_at"][14:16] for entry in entries], field, page, pages, total
+        )
+        sent = []
+
+        class Context:
+            async def send(self, content=None, embed=None, ephemeral=False):
+                sent.append(embed or content)
+
+        asyncio.run(tracker.habbo_id_history(Context(), habbo_id.upper(), "Motto", "2026-03-01T00:20:00"))
+        self.assertEqual(len(sent), 2)
+        self.assertEqual(sent[0][1:], ("motto", 1, 2, 20))
+        self.assertEqual(sent[0][0][:2], ["59", "57"])
+        self.assertEqual(sent[1][0][-1], "21")
+
+        sent.clear()
+        asyncio.run(tracker.habbo_id_history(Context(), habbo_id))
+        self.assertEqual([page[2] for page in sent[:-1]], [1, 2, 3, 4, 5])
+        self.assertIn("newest 50 of 60", sent[-1])
+
+        sent.clear()
+        asyncio.run(tracker.habbo_id_history(Context(), habbo_id, "colour"))
+        self.assertIn("Unknown field", sent[0])
+
+    def test_parse_since_accepts_relative_ages_and_dates(self):
+        from datetime import datetime, timezone
+
+        now = datetime(2026, 3, 8, tzinfo=timezone.utc)
+        self.assertEqual(HabboIdTracker.parse_since("7d", now), datetime(2026, 3, 1, tzinfo=timezone.utc).timestamp())
+        self.assertEqual(HabboIdTracker.parse_since("2026-03-01"), datetime(2026, 3, 1, tzinfo=timezone.utc).timestamp())
+        with self.assertRaises(ValueError):
+            HabboIdTracker.parse_since("last tuesday")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,75 @@
+"""Unit tests for roster-wide milestone batch evaluation."""
+
+from pathlib import Path
+import random
+import sys
+import unittest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from COGS import _habbo_milestones as milestones  # noqa: E402
+from COGS._habbo_policies import DEFAULT_POLICY_CONFIG, compile_policies  # noqa: E402
+
+NOW = 1_800_000_000.0
+HOUR = 3600.0
+
+
+class MilestoneBatchTest(unittest.TestCase):
+    def setUp(self):
+        self.policies = compile_policies(DEFAULT_POLICY_CONFIG)
+
+    def make_batch(self, use_numpy=False):
+        batch = milestones.MilestoneBatch(self.policies, use_numpy=use_numpy)
+        batch.update("online", "MOD", None, 0)
+        batch.update("fresh", "OOA", NOW - 2 * HOUR, 0)
+        batch.update("ooa23", "OOA", NOW - 23.5 * HOUR, 0)
+        batch.update("mod3d", "MOD", NOW - 73 * HOUR, 0)
+        batch.update("reported", "MOD", NOW - 49 * HOUR, 1)
+        return batch
+
+    def test_due_reports_highest_unsent_milestone_only(self):
+        batch = self.make_batch()
+
+        self.assertEqual(sorted(batch.due(NOW)), [("mod3d", "MOD", 3), ("ooa23", "OOA", 2)])
+
+        batch.mark_sent("ooa23", 2)
+        self.assertEqual(batch.due(NOW), [("mod3d", "MOD", 3)])
+        self.assertEqual(sorted(batch.due(NOW + HOUR)), [("mod3d", "MOD", 3), ("ooa23", "OOA", 3)])
+
+    def test_remove_and_retain_keep_slots_consistent(self):
+        batch = self.make_batch()
+
+        batch.remove("fresh")
+        batch.retain(["ooa23", "mod3d", "online"])
+
+        self.assertEqual(sorted(batch.members), ["mod3d", "online", "ooa23"])
+        self.assertEqual(sorted(batch.due(NOW)), [("mod3d", "MOD", 3), ("ooa23", "OOA", 2)])
+        batch.update("ooa23", "OOA", None, 0)
+        self.assertEqual(batch.due(NOW), [("mod3d", "MOD", 3)])
+
+    def test_policy_reload_repoints_members(self):
+        batch = self.make_batch()
+        reloaded = {"OOA": self.policies["OOA"]}
+
+        batch.set_policies(reloaded)
+
+        self.assertEqual(batch.due(NOW), [("ooa23", "OOA", 2)])
+
+    @unittest.skipIf(milestones.np is None, "NumPy is not installed")
+    def test_numpy_pass_matches_array_fallback(self):
+        rng = random.Random(7)
+        rows = [
+            (f"user{index}", rng.choice(["MOD", "OOA"]), None if rng.random() < 0.2 else NOW - rng.uniform(0, 90) * HOUR, rng.randint(0, 2))
+            for index in range(5000)
+        ]
+        batches = [milestones.MilestoneBatch(self.policies, use_numpy=flag) for flag in (False, True)]
+        for batch in batches:
+            for row in rows:
+                batch.update(*row)
+
+        self.assertEqual(sorted(batches[0].due(NOW)), sorted(batches[1].due(NOW)))
+
+if __name__ == "__main__":
+    unittest.main()
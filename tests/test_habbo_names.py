@@ -0,0 +1,49 @@
+"""Unit tests for the username autocomplete prefix index."""
+
+from pathlib import Path
+import sys
+import time
+import unittest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from COGS._habbo_names import NamePrefixIndex  # noqa: E402
+
+
+class NamePrefixIndexTest(unittest.TestCase):
+    def test_completion_is_case_insensitive_and_capped(self):
+        index = NamePrefixIndex()
+        index.update_source("roster", ["Alpha", "alpine", "Bravo", "ALPACA"])
+        self.assertEqual(index.complete("al"), ["ALPACA", "Alpha", "alpine"])
+        self.assertEqual(index.complete("ALPH"), ["Alpha"])
+        self.assertEqual(index.complete("al", limit=2), ["ALPACA", "Alpha"])
+        self.assertEqual(index.complete("z"), [])
+        self.assertEqual(len(index.complete("")), 4)
+
+    def test_sources_are_updated_incrementally_and_reference_counted(self):
+        index = NamePrefixIndex()
+        index.update_source("roster", ["Alpha", "Bravo"])
+        index.add("records", "alpha")
+        index.update_source("roster", ["Bravo", "Charlie"])
+        # Still recorded in offline_records, so it stays.
+        self.assertIn("Alpha", index)
+        index.discard("records", "Alpha")
+        self.assertEqual(index.complete(""), ["Bravo", "Charlie"])
+
+    def test_large_rosters_complete_quickly(self):
+        index = NamePrefixIndex()
+        index.update_source("roster", [f"Member{number:05d}" for number in range(10_000)])
+        index.update_source("roster", [f"Member{number:05d}" for number in range(5, 10_005)])
+        self.assertEqual(len(index), 10_000)
+        started = time.perf_counter()
+        for _ in range(100):
+            matches = index.complete("member0999")
+        self.assertEqual(len(matches), 10)
+        # A hundred completions finish far inside Discord's autocomplete deadline.
+        self.assertLess(time.perf_counter() - started, 0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
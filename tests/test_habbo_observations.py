@@ -0,0 +1,142 @@
+"""Unit tests for the shared Habbo profile observation bus."""
+
+import asyncio
+from pathlib import Path
+import sys
+import unittest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from COGS import _habbo_observations as observations  # noqa: E402
+
+PROFILE = {"uniqueId": "hhus-0123456789abcdef", "name": "Alpha", "online": True}
+
+
+class FakeApi:
+    def __init__(self, responses):
+        self.responses = responses
+        self.requests = []
+
+    async def get_json(self, url, params=None, priority=None):
+        self.requests.append((url, params))
+        await asyncio.sleep(0)
+        return self.responses.pop(0)
+
+
+class ObservationBusTest(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrent_lookups_share_one_request_and_publish_once(self):
+        api = FakeApi([(200, dict(PROFILE))])
+        bus = observations.ProfileObservationBus(api)
+        published = []
+
+        async def subscriber(observation):
+            published.append(observation.profile["name"])
+
+        bus.subscribe(subscriber)
+        results = await asyncio.gather(bus.fetch_user("Alpha"), bus.fetch_user("alpha"))
+
+        self.assertEqual(results, [(200, PROFILE), (200, PROFILE)])
+        self.assertEqual(len(api.requests), 1)
+        self.assertEqual(published, ["Alpha"])
+
+    async def test_joiners_fetch_for_themselves_when_the_first_caller_is_cancelled(self):
+        class StalledApi(FakeApi):
+            async def get_json(self, url, params=None, priority=None):
+                if not self.requests:
+                    # The first request never answers.
+                    self.requests.append((url, params))
+                    await asyncio.Event().wait()
+                return await super().get_json(url, params, priority)
+
+        api = StalledApi([(200, dict(PROFILE))])
+        bus = observations.ProfileObservationBus(api)
+
+        first = asyncio.ensure_future(bus.fetch_user("Alpha"))
+        await asyncio.sleep(0)
+        joiner = asyncio.ensure_future(bus.fetch_user("alpha"))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        self.assertEqual(await joiner, (200, PROFILE))
+        self.assertTrue(first.cancelled())
+        self.assertEqual(len(api.requests), 2)
+
+    async def test_a_name_lookup_satisfies_a_later_unique_id_lookup(self):
+        api = FakeApi([(200, dict(PROFILE)), (200, dict(PROFILE))])
+        bus = observations.ProfileObservationBus(api)
+
+        await bus.fetch_user("Alpha")
+        self.assertEqual(await bus.fetch_unique_id(PROFILE["uniqueId"], max_age=60), (200, PROFILE))
+        self.assertEqual(len(api.requests), 1)
+        # Callers that need a fresh profile still get one.
+        await bus.fetch_unique_id(PROFILE["uniqueId"])
+        self.assertEqual(api.requests[-1][0], f"https://www.habbo.com/api/public/users/{PROFILE['uniqueId']}")
+        self.assertEqual(bus.stats()["requests"], 2)
+
+    async def test_failures_are_not_cached_and_subscriber_errors_are_contained(self):
+        api = FakeApi([(404, None), (200, dict(PROFILE))])
+        bus = observations.ProfileObservationBus(api)
+
+        async def broken(observation):
+            raise RuntimeError("subscriber bug")
+
+        unsubscribe = bus.subscribe(broken)
+        self.assertEqual(await bus.fetch_user("Alpha", max_age=60), (404, None))
+        with self.assertLogs(observations.LOGGER, level="ERROR"):
+            self.assertEqual(await bus.fetch_user("Alpha", max_age=60), (200, PROFILE))
+            await bus.drain()
+        unsubscribe()
+        self.assertEqual(len(api.requests), 2)
+
+    async def test_lookup_returns_before_a_slow_subscriber_finishes(self):
+        api = FakeApi([(200, dict(PROFILE))])
+        bus = observations.ProfileObservationBus(api)
+        release = asyncio.Event()
+        handled = []
+
+        async def slow_subscriber(observation):
+            await release.wait()
+            handled.append(observation.profile["name"])
+
+        bus.subscribe(slow_subscriber)
+        self.assertEqual(await asyncio.wait_for(bus.fetch_user("Alpha"), timeout=1), (200, PROFILE))
+        self.assertEqual(handled, [])
+
+        release.set()
+        await bus.drain()
+        self.assertEqual(handled, ["Alpha"])
+
+    async def test_sessions_close_once_the_last_subscriber_leaves(self):
+        class ClosingApi(FakeApi):
+            closed = 0
+
+            async def close(self):
+                self.closed += 1
+
+        api = ClosingApi([])
+        bus = observations.ProfileObservationBus(api)
+
+        async def subscriber(observation):
+            pass
+
+        unsubscribe_watcher = bus.subscribe(subscriber)
+        unsubscribe_tracker = bus.subscribe(subscriber)
+        unsubscribe_watcher()
+        await bus.close_when_unused()
+        self.assertEqual(api.closed, 0)
+        unsubscribe_tracker()
+        await bus.close_when_unused()
+        self.assertEqual(api.closed, 1)
+
+    def test_for_bot_returns_one_bus_per_bot(self):
+        class Bot:
+            pass
+
+        bot = Bot()
+        self.assertIs(observations.ProfileObservationBus.for_bot(bot), observations.ProfileObservationBus.for_bot(bot))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+"""Unit tests for the config-driven Habbo watcher policy tables."""
+
+import json
+from pathlib import Path
+import sys
+import tempfile
+import unittest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from COGS import _habbo_policies as policies  # noqa: E402
+
+
+class PolicyCompileTest(unittest.TestCase):
+    def test_default_tables_keep_the_original_thresholds(self):
+        compiled = policies.compile_policies(policies.DEFAULT_POLICY_CONFIG)
+
+        self.assertEqual(list(compiled), ["MOD", "OOA"])
+        self.assertEqual(compiled["MOD"].allowed_days, 3.0)
+        self.assertEqual(
+            [(round(milestone.threshold_days * 24, 6), milestone.key) for milestone in compiled["OOA"].milestones],
+            [(16, "offline_ooa_16h"), (23, "offline_ooa_23h"), (24, "offline_ooa_24h")],
+        )
+        self.assertAlmostEqual(compiled["MOD"].milestones[1].threshold_days, 2 + 23 / 24)
+
+    def test_bisect_lookup_matches_a_linear_scan(self):
+        policy = policies.compile_policies(
+            {
+                "FINE": {
+                    "milestones": [
+                        {"after_hours": hour, "title": f"{hour}h", "key": f"fine_{hour}h"}
+                        # Deliberately unsorted; compilation sorts by threshold.
+                        for hour in (30, 1, 12, 6, 48, 24)
+                    ]
+                }
+            }
+        )["FINE"]
+
+        for hours in (0, 0.5, 1, 5.9, 6, 11, 12, 23.99, 24, 29, 30, 47, 48, 100):
+            days = hours / 24
+            reached = [milestone for milestone in policy.milestones if days >= milestone.threshold_days]
+            self.assertEqual(policy.resolve(days), reached[-1] if reached else None, hours)
+        self.assertIsNone(policy.resolve(None))
+        self.assertEqual(policy.next_after(13 / 24).key, "fine_24h")
+        self.assertIsNone(policy.next_after(3))
+        self.assertEqual(policy.rank("fine_6h"), 2)
+        self.assertEqual(policy.rank("unknown"), 0)
+
+    def test_invalid_configs_are_rejected(self):
+        invalid_configs = (
+            {},
+            {"MOD": {"milestones": [{"after_days": 1, "title": "x"}]}},
+            {"MOD": {"milestones": [{"title": "x", "key": "k"}]}},
+            {"MOD": {"milestones": [{"after_days": 1, "title": "x", "key": "k", "severity": "panic"}]}},
+            {
+                "MOD": {"milestones": [{"after_days": 1, "title": "x", "key": "k"}]},
+                "OOA": {"milestones": [{"after_days": 2, "title": "y", "key": "k"}]},
+            },
+        )
+        for config in invalid_configs:
+            with self.subTest(config=config), self.assertRaises(ValueError):
+                policies.compile_policies(config)
+
+    def test_load_policies_reads_config_and_falls_back_to_defaults(self):
+        with tempfile.TemporaryDirectory() as directory:
+            config_file = Path(directory) / "habbo_policies.json"
+            self.assertEqual(list(policies.load_policies(config_file)), ["MOD", "OOA"])
+
+            config_file.write_text(
+                json.dumps(
+                    {
+                        "trial": {
+                            "allowed_days": 7,
+                            "channels": ["123"],
+                            "milestones": [
+                                {"after_days": 6, "title": "Trial Notice", "key": "trial_6d", "severity": "notice", "colour": "orange"}
+                            ],
+                        }
+                    }
+                ),
+                encoding="utf-8",
+            )
+            loaded = policies.load_policies(config_file)
+            self.assertEqual(list(loaded), ["TRIAL"])
+            self.assertEqual(loaded["TRIAL"].channels, [123])
+            self.assertEqual(loaded["TRIAL"].milestone("trial_6d").colour, "orange")
+
+            config_file.write_text("{not json", encoding="utf-8")
+            with self.assertLogs(policies.LOGGER, level="ERROR"):
+                self.assertEqual(list(policies.load_policies(config_file)), ["MOD", "OOA"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,12 @@
 import importlib.util
+import shutil
 import sys
+import tempfile
 import types
 import unittest
 from pathlib import Path
+from typing import NamedTuple
+from unittest import mock
 
 
 def load_watcher_module():
@@ -37,8 +41,25 @@ def load_watcher_module():
         green=lambda: "green",
     )
     discord_stub.Interaction = object
+    discord_stub.HTTPException = type("HTTPException", (Exception,), {})
+    discord_stub.NotFound = type("NotFound", (discord_stub.HTTPException,), {})
+    discord_stub.RateLimited = type("RateLimited", (Exception,), {})
     app_commands_stub = types.ModuleType("discord.app_commands")
-    app_commands_stub.command = lambda *args, **kwargs: (lambda func: func)
+
+    def command_stub(*args, **kwargs):
+        def decorator(func):
+            func.autocomplete = lambda name: (lambda callback: callback)
+            return func
+
+        return decorator
+
+    app_commands_stub.command = command_stub
+
+    class ChoiceStub(NamedTuple):
+        name: str
+        value: str
+
+    app_commands_stub.Choice = ChoiceStub
     app_commands_stub.describe = lambda *args, **kwargs: (lambda func: func)
 
     ext_stub = types.ModuleType("discord.ext")
@@ -48,6 +69,8 @@ def load_watcher_module():
     commands_stub.Context = object
     commands_stub.command = lambda *args, **kwargs: (lambda func: func)
     commands_stub.is_owner = lambda *args, **kwargs: (lambda func: func)
+    commands_stub.guild_only = lambda *args, **kwargs: (lambda func: func)
+    commands_stub.has_guild_permissions = lambda *args, **kwargs: (lambda func: func)
     tasks_stub = types.ModuleType("discord.ext.tasks")
 
     class LoopStub:
@@ -81,13 +104,29 @@ def load_watcher_module():
     ext_stub.commands = commands_stub
     ext_stub.tasks = tasks_stub
 
-    module_path = Path(__file__).resolve().parents[1] / "COGS" / "HabboProfileWatcher.py"
+    # Shared COGS helpers are imported by package path, as bot.py does. Drop any
+    # copies cached by another test module so they bind to these stubs.
+    repo_root = Path(__file__).resolve().parents[1]
+    if str(repo_root) not in sys.path:
+        sys.path.insert(0, str(repo_root))
+    for module_name in [name for name in sys.modules if name == "COGS" or name.startswith("COGS.")]:
+        del sys.modules[module_name]
+
+    module_path = repo_root / "COGS" / "HabboProfileWatcher.py"
     spec = importlib.util.spec_from_file_location("habbo_profile_watcher_under_test", module_path)
     module = importlib.util.module_from_spec(spec)
     spec.loader.exec_module(module)
     return module
 
 
+def build_watch(test, module, bot=None):
+    """Run the real constructor with its JSON files in a temporary directory."""
+    directory = Path(tempfile.mkdtemp())
+    test.addCleanup(shutil.rmtree, directory, True)
+    with mock.patch.object(module, "JSON_DIR", directory):
+        return module.HabboWatch(bot if bot is not None else types.SimpleNamespace())
+
+
 class HabboGroupMemberHelpersTest(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
@@ -104,7 +143,7 @@ class HabboGroupMemberHelpersTest(unittest.TestCase):
     def test_fetch_user_policy_map_preserves_roster_casing_for_lookup(self):
         import asyncio
 
-        watch = self.watch.__new__(self.watch)
+        watch = build_watch(self, self.module)
 
         async def fetch_group_members(group_id):
             if group_id == self.module.MOD_GROUP_ID:
@@ -118,6 +157,99 @@ class HabboGroupMemberHelpersTest(unittest.TestCase):
             {"ilegendarygoat": ("iLegendaryGOAT", "MOD")},
         )
 
+    def test_fetch_user_policy_map_loads_groups_concurrently_and_applies_precedence(self):
+        import asyncio
+
+        watch = build_watch(self, self.module)
+        watch.watched_groups = [
+            self.module.WatchedGroup("g-senior", "MOD", 30),
+            self.module.WatchedGroup("g-mod", "MOD", 10),
+            self.module.WatchedGroup("g-ooa", "OOA", 20),
+        ]
+        rosters = {"g-senior": ["Alpha"], "g-mod": ["Alpha", "Bravo", "charlie"], "g-ooa": ["alpha", "Charlie"]}
+        in_flight = []
+
+        async def fetch_group_members(group_id):
+            in_flight.append(group_id)
+            # Every group must be requested before any of them finishes.
+            while len(in_flight) < len(rosters):
+                await asyncio.sleep(0)
+            return rosters[group_id]
+
+        watch.fetch_group_members = fetch_group_members
+
+        policy_map = asyncio.run(asyncio.wait_for(watch.fetch_user_policy_map(), timeout=1))
+
+        self.assertEqual(
+            policy_map,
+            {"alpha": ("Alpha", "MOD"), "bravo": ("Bravo", "MOD"), "charlie": ("Charlie", "OOA")},
+        )
+
+    def test_groups_on_other_hotels_get_hotel_scoped_member_keys(self):
+        merged = self.watch.merge_group_rosters(
+            [self.module.WatchedGroup("g-hhus-01", "MOD", 10), self.module.WatchedGroup("g-hhde-02", "OOA", 20)],
+            [["Alpha"], ["Alpha", "Bravo"]],
+        )
+
+        self.assertEqual(
+            merged,
+            {"alpha": ("Alpha", "MOD"), "de/alpha": ("Alpha", "OOA"), "de/bravo": ("Bravo", "OOA")},
+        )
+        self.assertEqual(self.watch.member_hotel("de/alpha"), "de")
+        self.assertEqual(self.watch.member_hotel("alpha"), "com")
+        self.assertEqual(self.watch.avatar_url_for({"uniqueId": "hhde-01"}, "Alpha")[:21], "https://www.habbo.de/")
+
+    def test_group_roster_probe_reuses_cached_roster_when_page_one_is_unchanged(self):
+        import asyncio
+
+        watch = build_watch(self, self.module)
+        pages = {
+            1: {"members": [{"name": f"Member{index}"} for index in range(100)], "totalPages": 2},
+            2: {"members": [{"name": "Tail"}], "totalPages": 2},
+        }
+        requests = []
+
+        async def fetch_json(url, params=None):
+            requests.append(params["pageNumber"])
+            return pages[params["pageNumber"]]
+
+        watch.fetch_json = fetch_json
+
+        first = asyncio.run(watch.fetch_group_roster("g-mod"))
+        second = asyncio.run(watch.fetch_group_roster("g-mod"))
+        pages[1] = {"members": [{"name": "Newcomer"}] + pages[1]["members"][:99], "totalPages": 2}
+        third = asyncio.run(watch.fetch_group_roster("g-mod"))
+
+        self.assertEqual(len(first), 101)
+        self.assertIs(second, first)
+        self.assertIn("Newcomer", third)
+        # Full fetch, one probe, then a changed probe whose page one is reused.
+        self.assertEqual(requests, [1, 2, 1, 1, 2])
+
+    def test_failed_later_page_keeps_the_last_complete_roster(self):
+        import asyncio
+
+        watch = build_watch(self, self.module)
+        pages = {
+            1: {"members": [{"name": f"Member{index}"} for index in range(100)], "totalPages": 2},
+            2: {"members": [{"name": "Tail"}], "totalPages": 2},
+        }
+
+        async def fetch_json(url, params=None):
+            return pages[params["pageNumber"]]
+
+        watch.fetch_json = fetch_json
+        complete = asyncio.run(watch.fetch_group_members("g-mod"))
+        pages[1] = {"members": [{"name": "Newcomer"}] + pages[1]["members"][:99], "totalPages": 2}
+        pages[2] = None
+
+        with self.assertLogs(self.module.LOGGER, level="WARNING"):
+            after_failure = asyncio.run(watch.fetch_group_roster("g-mod"))
+
+        self.assertIs(after_failure, complete)
+        self.assertIn("Tail", watch._group_roster_cache["g-mod"]["members"])
+        self.assertNotIn("Newcomer", watch._group_roster_cache["g-mod"]["members"])
+
     def test_group_members_has_next_page_uses_metadata_or_full_page(self):
         self.assertTrue(self.watch.group_members_has_next_page({"totalPages": 3}, 2, 40, 100))
         self.assertFalse(self.watch.group_members_has_next_page({"totalPages": 3}, 3, 40, 100))
@@ -127,7 +259,7 @@ class HabboGroupMemberHelpersTest(unittest.TestCase):
 
     def test_api_request_and_periodic_intervals_are_conservative(self):
         """Guard against accidentally restoring the previous high-frequency polling."""
-        self.assertGreaterEqual(self.module.API_REQUEST_INTERVAL_SECONDS, 1.0)
+        self.assertGreaterEqual(self.module.ProfileObservationBus().api.request_interval, 1.0)
         self.assertGreaterEqual(self.module.PERIODIC_CHECK_INTERVAL_MINUTES, 5)
         self.assertGreaterEqual(self.module.PROFILE_FAILURE_ALERT_THRESHOLD, 3)
 
@@ -139,10 +271,7 @@ class HabboManualJsonUpdateTest(unittest.TestCase):
         cls.watch_cls = cls.module.HabboWatch
 
     def make_watch(self):
-        watch = self.watch_cls.__new__(self.watch_cls)
-        watch.last_online_times = {}
-        watch.logoff_times = {}
-        watch.offline_records = {}
+        watch = build_watch(self, self.module)
         watch._state = {"alpha": {"was_online": False}}
         watch.save_last_online_times = lambda: None
         watch.save_logoff_times = lambda: None
@@ -210,8 +339,8 @@ class FakeAlertDestination:
     def __init__(self):
         self.sent_embeds = []
 
-    async def send(self, embed=None):
-        self.sent_embeds.append(embed)
+    async def send(self, embed=None, embeds=None):
+        self.sent_embeds.extend([embed] if embeds is None else embeds)
 
 
 class FakeAlertBot:
@@ -242,12 +371,24 @@ class HabboAlertRoutingTest(unittest.TestCase):
         cls.watch_cls = cls.module.HabboWatch
 
     def make_watch(self, bot):
-        watch = self.watch_cls.__new__(self.watch_cls)
-        watch.bot = bot
+        watch = build_watch(self, self.module, bot)
         watch.alert_channel_ids = {"MOD": [], "OOA": []}
         watch.save_alert_channel_ids = lambda: None
+        watch.outbox = self.module.NotificationOutbox(watch.resolve_alert_destination, coalesce_seconds=0)
         return watch
 
+    @staticmethod
+    def run_and_deliver(watch, *coroutines):
+        """Run alert-producing coroutines, then wait for the outbox to send."""
+        import asyncio
+
+        async def run():
+            for coroutine in coroutines:
+                await coroutine
+            await watch.outbox.flush()
+
+        asyncio.run(run())
+
     def test_alert_channel_ids_for_policy_uses_separate_mod_and_ooa_channels(self):
         watch = self.make_watch(FakeAlertBot())
         watch.alert_channel_ids = {"MOD": [111, 112], "OOA": [222]}
@@ -262,47 +403,96 @@ class HabboAlertRoutingTest(unittest.TestCase):
         self.assertEqual(watch.alert_channel_ids_for_policy("MOD"), [])
 
     def test_notify_user_sends_to_configured_policy_channel(self):
-        import asyncio
-
         channel = FakeAlertDestination()
         bot = FakeAlertBot(cached_channel=channel)
         watch = self.make_watch(bot)
         watch.alert_channel_ids["MOD"] = [333]
 
-        asyncio.run(watch.notify_user("embed-payload", "MOD"))
+        self.run_and_deliver(watch, watch.notify_user("embed-payload", "MOD"))
 
         self.assertEqual(channel.sent_embeds, ["embed-payload"])
         self.assertEqual(bot.dm_user.sent_embeds, [])
         self.assertEqual(bot.requested_channel_ids, [("get", 333)])
 
     def test_notify_user_falls_back_to_dm_when_policy_channel_unset(self):
-        import asyncio
-
         bot = FakeAlertBot()
         watch = self.make_watch(bot)
         watch.alert_channel_ids["OOA"] = []
 
-        asyncio.run(watch.notify_user("embed-payload", "OOA"))
+        self.run_and_deliver(watch, watch.notify_user("embed-payload", "OOA"))
 
         self.assertEqual(bot.dm_user.sent_embeds, ["embed-payload"])
         self.assertEqual(bot.requested_channel_ids, [])
 
     def test_notify_user_sends_to_all_configured_policy_channels(self):
-        import asyncio
-
         first_channel = FakeAlertDestination()
         second_channel = FakeAlertDestination()
         bot = FakeAlertBot(cached_channel={333: first_channel, 334: second_channel})
         watch = self.make_watch(bot)
         watch.alert_channel_ids["MOD"] = [333, 334]
 
-        asyncio.run(watch.notify_user("embed-payload", "MOD"))
+        self.run_and_deliver(watch, watch.notify_user("embed-payload", "MOD"))
 
         self.assertEqual(first_channel.sent_embeds, ["embed-payload"])
         self.assertEqual(second_channel.sent_embeds, ["embed-payload"])
         self.assertEqual(bot.dm_user.sent_embeds, [])
         self.assertEqual(bot.requested_channel_ids, [("get", 333), ("get", 334)])
 
+    def test_notify_user_coalesces_superseded_milestones_for_the_same_user(self):
+        channel = FakeAlertDestination()
+        bot = FakeAlertBot(cached_channel=channel)
+        watch = self.make_watch(bot)
+        watch.alert_channel_ids["OOA"] = [333]
+
+        async def queue_alerts():
+            await watch.notify_user("back-online", "OOA")
+            await watch.notify_user("ooa-23h", "OOA", alert_key="offline_ooa_23h", username_lc="alpha")
+            await watch.notify_user("ooa-24h", "OOA", alert_key="offline_ooa_24h", username_lc="alpha")
+
+        self.run_and_deliver(watch, queue_alerts())
+
+        # The 24h warning replaced the queued 23h one and overtook the routine embed.
+        self.assertEqual(channel.sent_embeds, ["ooa-24h", "back-online"])
+
+    def test_alert_priority_puts_final_warnings_ahead_of_routine_embeds(self):
+        self.assertLess(self.watch_cls.alert_priority("offline_mod_3d"), self.watch_cls.alert_priority("offline_mod_2d"))
+        self.assertLess(self.watch_cls.alert_priority("offline_ooa_16h"), self.watch_cls.alert_priority(None))
+        self.assertEqual(self.watch_cls.milestone_rank("OOA", "offline_ooa_24h"), 3)
+        self.assertEqual(self.watch_cls.milestone_rank("MOD", None), 0)
+
+    def test_alert_severity_and_colour_come_from_policy_data(self):
+        self.assertEqual(self.watch_cls.alert_severity("offline_mod_2d"), "notice")
+        self.assertEqual(self.watch_cls.alert_severity("offline_ooa_24h", "OOA"), "warning")
+        self.assertEqual(self.watch_cls.alert_severity("profile_hidden"), "warning")
+        self.assertIsNone(self.watch_cls.alert_severity(None))
+        self.assertEqual(self.watch_cls.alert_colour("MOD", "offline_mod_3d"), "red")
+        self.assertEqual(self.watch_cls.alert_colour("MOD", None), "blurple")
+
+    def test_notify_user_routes_webhook_policies_through_webhook_destinations(self):
+        import asyncio
+
+        watch = self.make_watch(FakeAlertBot())
+        watch.alert_channel_ids = {"MOD": [333], "OOA": [444]}
+        watch.configure_alert_channels("mod", [333], "webhook")
+        queued = []
+        watch.outbox.enqueue = lambda embed, destinations, **kwargs: queued.append(destinations)
+
+        asyncio.run(watch.notify_user("embed", "MOD"))
+        asyncio.run(watch.notify_user("embed", "OOA"))
+
+        self.assertEqual(queued, [[("webhook", 333)], [("channel", 444)]])
+        with self.assertRaises(ValueError):
+            watch.configure_alert_channels("MOD", [333], "carrier-pigeon")
+
+    def test_webhook_delivery_mode_round_trips_through_alert_channel_json(self):
+        watch = build_watch(self, self.module)
+        watch.alert_channel_ids = {"MOD": [333], "OOA": []}
+        watch.alert_delivery_modes = {"MOD": "webhook", "OOA": "bot"}
+        watch.save_alert_channel_ids()
+
+        self.assertEqual(watch.load_alert_channel_ids()["MOD"], [333])
+        self.assertEqual(watch.load_alert_delivery_modes(), {"MOD": "webhook"})
+
     def test_configure_alert_channels_accepts_multiple_mentions_and_saves_policy(self):
         saved = []
         watch = self.make_watch(FakeAlertBot())
@@ -317,16 +507,17 @@ class HabboAlertRoutingTest(unittest.TestCase):
 
 
     def test_message_error_to_owner_throttles_repeated_error_key(self):
-        import asyncio
-
         dm_user = FakeAlertDestination()
         bot = FakeAlertBot(dm_user=dm_user)
         bot.user = types.SimpleNamespace(name="TestBot")
         watch = self.make_watch(bot)
         watch._last_error_notifications = {}
 
-        asyncio.run(watch.message_error_to_owner("First error", dedupe_key="same-error"))
-        asyncio.run(watch.message_error_to_owner("Second error", dedupe_key="same-error"))
+        self.run_and_deliver(
+            watch,
+            watch.message_error_to_owner("First error", dedupe_key="same-error"),
+            watch.message_error_to_owner("Second error", dedupe_key="same-error"),
+        )
 
         self.assertEqual(len(dm_user.sent_embeds), 1)
         self.assertEqual(dm_user.sent_embeds[0].description, "First error")
@@ -338,14 +529,9 @@ class HabboPeriodicNotificationTest(unittest.TestCase):
         cls.module = load_watcher_module()
         cls.watch_cls = cls.module.HabboWatch
 
-    def make_watch(self, members_by_group, users_by_name):
-        watch = self.watch_cls.__new__(self.watch_cls)
-        watch.bot = types.SimpleNamespace(user=types.SimpleNamespace(name="TestBot"))
-        watch._state = {}
-        watch._profile_failure_streaks = {}
-        watch.last_online_times = {}
-        watch.logoff_times = {}
-        watch.offline_records = {}
+    def make_watch(self, members_by_group, users_by_name, bot=None):
+        bot = bot if bot is not None else types.SimpleNamespace(user=types.SimpleNamespace(name="TestBot"))
+        watch = build_watch(self, self.module, bot)
         watch.notifications = []
         watch.errors = []
         watch.saved = []
@@ -356,10 +542,10 @@ class HabboPeriodicNotificationTest(unittest.TestCase):
         async def fetch_group_members(group_id):
             return members_by_group.get(group_id, [])
 
-        async def fetch_habbo_user(username):
+        async def fetch_habbo_user(username, hotel=None, max_age=0.0, priority=None):
             return users_by_name.get(username.lower())
 
-        async def notify_user(embed, policy_name=None):
+        async def notify_user(embed, policy_name=None, **kwargs):
             watch.notifications.append((embed.title, policy_name))
 
         async def message_error_to_owner(message, **kwargs):
@@ -407,7 +593,7 @@ class HabboPeriodicNotificationTest(unittest.TestCase):
             users,
         )
 
-        async def fetch_habbo_user(username):
+        async def fetch_habbo_user(username, hotel=None, max_age=0.0, priority=None):
             checked.append(username)
             return users[username.lower()]
 
@@ -494,7 +680,7 @@ class HabboPeriodicNotificationTest(unittest.TestCase):
         attempts = []
         watch = self.make_watch({self.module.MOD_GROUP_ID: ["Alpha"], self.module.OOA_GROUP_ID: []}, {})
 
-        async def fetch_habbo_user(username):
+        async def fetch_habbo_user(username, hotel=None, max_age=0.0, priority=None):
             attempts.append(username)
             return None
 
@@ -505,6 +691,87 @@ class HabboPeriodicNotificationTest(unittest.TestCase):
         self.assertEqual(attempts, ["Alpha"])
         self.assertEqual(watch.errors, [])
 
+    def test_periodic_check_fetches_shared_members_once_and_fans_out_per_tenant(self):
+        fetched_groups = []
+        fetched_users = []
+        tenant_alerts = []
+        users = {
+            "alpha": {"name": "Alpha", "online": False, "profileVisible": False},
+            "zulu": {"name": "Zulu", "online": False, "profileVisible": False, "lastAccessTime": "2026-01-01T00:00:00+00:00"},
+        }
+        watch = self.make_watch({self.module.MOD_GROUP_ID: ["Alpha"], "g-hhus-tenant": ["Zulu"]}, users)
+        watch.tenants = {
+            42: self.module.WatchTenant(
+                42,
+                (
+                    self.module.WatchedGroup(self.module.MOD_GROUP_ID, "OOA"),
+                    self.module.WatchedGroup("g-hhus-tenant", "MOD"),
+                ),
+                {"MOD": [4201], "OOA": [4202]},
+            )
+        }
+        watch.save_tenant_alerts = lambda: None
+        fetch_group_members = watch.fetch_group_members
+        fetch_habbo_user = watch.fetch_habbo_user
+
+        async def counting_group_members(group_id):
+            fetched_groups.append(group_id)
+            return await fetch_group_members(group_id)
+
+        async def counting_habbo_user(username, hotel=None, max_age=0.0, priority=None):
+            fetched_users.append(username)
+            return await fetch_habbo_user(username, hotel, max_age)
+
+        def notify_tenant(tenant, embed, policy_name, alert_key=None, username_lc=None):
+            tenant_alerts.append((tenant.guild_id, username_lc, policy_name, alert_key))
+
+        watch.fetch_group_members = counting_group_members
+        watch.fetch_habbo_user = counting_habbo_user
+        watch.notify_tenant = notify_tenant
+
+        self.run_periodic_once(watch)
+        self.run_periodic_once(watch)
+
+        # The MOD group is shared with the tenant but loaded once per roster refresh.
+        self.assertEqual(fetched_groups.count(self.module.MOD_GROUP_ID), fetched_groups.count("g-hhus-tenant"))
+        self.assertEqual(sorted(fetched_users), ["Alpha", "Alpha", "Zulu", "Zulu"])
+        # Only the default tenant's own member reaches the owner's alerts.
+        self.assertEqual([policy_name for _title, policy_name in watch.notifications], ["MOD"])
+        self.assertCountEqual(
+            tenant_alerts,
+            [(42, "alpha", "OOA", "profile_hidden"), (42, "zulu", "MOD", "profile_hidden")],
+        )
+        self.assertIsNone(watch._state["zulu"]["policy"])
+        # Tenant-only members never reach the owner's audit JSON.
+        for records in (watch.offline_records, watch.last_online_times, watch.logoff_times):
+            self.assertNotIn("zulu", records)
+
+    def test_habbowatch_refuses_groups_past_the_tenant_limits(self):
+        import asyncio
+
+        watch = self.make_watch({self.module.MOD_GROUP_ID: ["Alpha"]}, {})
+        watch.tenants = {}
+        watch.save_tenants = lambda: None
+        sent = []
+
+        async def fetch_group_roster(group_id):
+            return [f"Member{index}" for index in range(self.module.TENANT_MAX_MEMBERS + 1)] if group_id == "g-hhus-big" else ["Alpha"]
+
+        async def send(content, delete_after=None):
+            sent.append(content)
+
+        watch.fetch_group_roster = fetch_group_roster
+        ctx = types.SimpleNamespace(guild=types.SimpleNamespace(id=42), send=send)
+
+        asyncio.run(watch.manage_tenant(ctx, "group", "g-hhus-big", "MOD"))
+        self.assertIn("the limit is", sent[-1])
+        self.assertNotIn(42, watch.tenants)
+
+        for index in range(self.module.TENANT_MAX_GROUPS + 1):
+            asyncio.run(watch.manage_tenant(ctx, "group", f"g-hhus-{index:02d}", "MOD"))
+        self.assertEqual(len(watch.tenants[42].groups), self.module.TENANT_MAX_GROUPS)
+        self.assertIn("remove one first", sent[-1])
+
     def test_profile_lookup_retries_use_configured_backoff(self):
         import asyncio
         from unittest.mock import AsyncMock, patch
@@ -645,6 +912,73 @@ class HabboPeriodicNotificationTest(unittest.TestCase):
 
         self.assertEqual(watch.notifications, [("OOA Offline Warning (23 Hours)", "OOA")])
 
+    def test_periodic_check_renders_embeds_only_for_alerts_being_sent(self):
+        from datetime import datetime, timedelta, timezone
+
+        users = {
+            "alpha": {"name": "Alpha", "online": False, "profileVisible": True},
+            "bravo": {"name": "Bravo", "online": True, "profileVisible": True},
+        }
+        watch = self.make_watch({self.module.MOD_GROUP_ID: ["Alpha", "Bravo"], self.module.OOA_GROUP_ID: []}, users)
+        watch._state["alpha"] = {
+            "was_online": False,
+            "offline_since": datetime.now(timezone.utc) - timedelta(days=3, hours=1),
+            "sent_alerts": set(),
+        }
+        rendered = []
+        render = watch.render_status_embed
+
+        def render_status_embed(user_json, status, *args):
+            rendered.append(status.name)
+            return render(user_json, status, *args)
+
+        watch.render_status_embed = render_status_embed
+
+        self.run_periodic_once(watch)
+        self.run_periodic_once(watch)
+
+        self.assertEqual(rendered, ["Alpha"])
+        self.assertEqual(watch.notifications, [("Offline Warning (3 Days)", "MOD")])
+
+    def test_milestone_tick_alerts_between_sweeps_without_refetching(self):
+        import asyncio
+        import time
+
+        users = {"alpha": {"name": "Alpha", "online": True, "profileVisible": True}}
+        watch = self.make_watch({self.module.MOD_GROUP_ID: [], self.module.OOA_GROUP_ID: ["Alpha"]}, users)
+        self.run_periodic_once(watch)
+        users["alpha"]["online"] = False
+        self.run_periodic_once(watch)
+        offline_since = watch._state["alpha"]["offline_since"].timestamp()
+
+        async def fetch_habbo_user(username, hotel=None, max_age=0.0, priority=None):
+            raise AssertionError("the tick must not call Habbo")
+
+        watch.fetch_habbo_user = fetch_habbo_user
+        sent_now = asyncio.run(watch.send_due_milestones(time.time()))
+        sent_later = asyncio.run(watch.send_due_milestones(offline_since + 16.5 * 3600))
+        sent_again = asyncio.run(watch.send_due_milestones(offline_since + 16.6 * 3600))
+
+        self.assertEqual((sent_now, sent_later, sent_again), (0, 1, 0))
+        self.assertEqual(watch.notifications, [("Approaching 16 Hours", "OOA")])
+        self.assertEqual(watch._state["alpha"]["sent_alerts"], {"offline_ooa_16h"})
+        self.assertEqual(watch.offline_records["alpha"]["sent_alerts"], ["offline_ooa_16h"])
+
+    def test_evaluate_status_classifies_without_rendering(self):
+        from datetime import datetime, timedelta, timezone
+
+        watch = self.make_watch({self.module.MOD_GROUP_ID: [], self.module.OOA_GROUP_ID: []}, {})
+        offline_since = datetime.now(timezone.utc) - timedelta(hours=23, minutes=5)
+
+        status = watch.evaluate_status({"name": "Alpha", "online": False, "profileVisible": True}, "alpha", offline_since, "OOA")
+        hidden = watch.evaluate_status({"name": "Bravo", "online": True, "profileVisible": False}, "bravo", None, "MOD")
+
+        self.assertEqual(
+            status,
+            self.module.MemberStatus("Alpha", False, True, "OOA Offline Warning (23 Hours)", "offline_ooa_23h"),
+        )
+        self.assertEqual((hidden.online, hidden.title, hidden.alert_key), (True, "Profile Hidden", "profile_hidden"))
+
     def test_evaluate_user_uses_discord_relative_times_for_offline_status(self):
         from datetime import datetime, timedelta, timezone
 
@@ -668,7 +1002,7 @@ class HabboPeriodicNotificationTest(unittest.TestCase):
         watch = self.make_watch({self.module.MOD_GROUP_ID: ["Alpha"], self.module.OOA_GROUP_ID: []}, users)
         interaction = FakeInteraction()
 
-        asyncio.run(watch.habbo_check(interaction))
+        asyncio.run(watch.habbo_check(interaction, digest=False))
 
         self.assertEqual(watch.notifications, [("Online", "MOD")])
         self.assertEqual(interaction.response.deferred, [{"thinking": True, "ephemeral": True}])
@@ -681,6 +1015,159 @@ class HabboPeriodicNotificationTest(unittest.TestCase):
         )
 
 
+    def test_check_slash_digest_reuses_fresh_sweep_state_and_expands_only_warnings(self):
+        import asyncio
+        import time
+        from datetime import datetime, timedelta, timezone
+
+        users = {"bravo": {"name": "Bravo", "online": True, "profileVisible": True}}
+        watch = self.make_watch({self.module.MOD_GROUP_ID: ["Alpha", "Bravo"], self.module.OOA_GROUP_ID: []}, users)
+        fetched = []
+        original_fetch = watch.fetch_habbo_user
+
+        async def fetch_habbo_user(username, hotel=None, max_age=0.0, priority=None):
+            fetched.append(username)
+            return await original_fetch(username)
+
+        watch.fetch_habbo_user = fetch_habbo_user
+        watch._state["alpha"] = {
+            "was_online": False,
+            "offline_since": datetime.now(timezone.utc) - timedelta(days=3, hours=1),
+            "sent_alerts": set(),
+            "profile": {"name": "Alpha", "online": False, "profileVisible": True},
+        }
+        watch._last_checked = {"alpha": time.time()}
+        interaction = FakeInteraction()
+
+        asyncio.run(watch.habbo_check(interaction))
+
+        self.assertEqual(fetched, ["Bravo"])
+        self.assertEqual(
+            watch.notifications,
+            [("MOD Roster Digest (1/1)", "MOD"), ("Offline Warning (3 Days)", "MOD")],
+        )
+        self.assertEqual(
+            interaction.followup.messages,
+            [(
+                (
+                    "Digest Complete: posted 2 member(s) across 1 page(s) and 1 warning embed(s); "
+                    "refreshed 1 profile(s) from Habbo.",
+                ),
+                {"ephemeral": True},
+            )],
+        )
+
+    def test_status_digest_pages_group_members_by_severity(self):
+        watch = self.make_watch({self.module.MOD_GROUP_ID: [], self.module.OOA_GROUP_ID: []}, {})
+        roster = {f"user{index}": (f"User{index}", "MOD") for index in range(150)}
+        for username_lc, (name, _policy) in roster.items():
+            watch._state[username_lc] = {"was_online": True, "offline_since": None, "sent_alerts": set(), "profile": {"name": name}}
+
+        pages_by_policy, warnings = watch.build_status_digest(roster, {"user0"})
+
+        pages = pages_by_policy["MOD"]
+        self.assertGreater(len(pages), 1)
+        self.assertTrue(all(len(page.description) <= self.module.DIGEST_PAGE_CHARACTERS for page in pages))
+        self.assertTrue(pages[0].description.startswith("### Unavailable (1)"))
+        self.assertIn("### Online (149)", pages[0].description)
+        self.assertEqual(warnings, [])
+
+    def make_board_channel(self):
+        channel = types.SimpleNamespace(id=555, writes=[], pinned=[])
+
+        class Message:
+            def __init__(self, message_id):
+                self.id = message_id
+
+            async def edit(self, embeds):
+                channel.writes.append(("edit", self.id, [embed.title for embed in embeds]))
+
+            async def pin(self):
+                channel.pinned.append(self.id)
+
+        async def send(embeds):
+            message = Message(900 + len(channel.writes))
+            channel.writes.append(("send", message.id, [embed.title for embed in embeds]))
+            return message
+
+        channel.send = send
+        channel.get_partial_message = Message
+        return channel
+
+    def test_status_board_edits_only_when_content_changes(self):
+        import asyncio
+        from datetime import datetime, timedelta, timezone
+
+        channel = self.make_board_channel()
+        watch = self.make_watch({self.module.MOD_GROUP_ID: [], self.module.OOA_GROUP_ID: []}, {})
+        watch.bot.get_channel = lambda channel_id: channel if channel_id == 555 else None
+        watch.status_boards = {"MOD": {"channel_id": 555, "message_ids": [], "hashes": []}}
+        watch.save_status_boards = lambda: watch.saved.append("status_board")
+        roster = {"alpha": ("Alpha", "MOD")}
+        watch._state["alpha"] = {
+            "was_online": False,
+            "offline_since": datetime.now(timezone.utc) - timedelta(hours=5),
+            "sent_alerts": set(),
+            "profile": {"name": "Alpha"},
+        }
+
+        _severity, text, _alert_key = watch.digest_status("alpha", "MOD", include_next_milestone=True)
+        self.assertIn("next: Offline Notice (2 Days) <t:", text)
+
+        self.assertEqual(asyncio.run(watch.refresh_status_boards(roster)), 1)
+        self.assertEqual(asyncio.run(watch.refresh_status_boards(roster)), 0)
+        watch._state["alpha"]["was_online"] = True
+        self.assertEqual(asyncio.run(watch.refresh_status_boards(roster)), 1)
+
+        self.assertEqual([write[0] for write in channel.writes], ["send", "edit"])
+        self.assertEqual(channel.pinned, [900])
+        self.assertEqual(watch.status_boards["MOD"]["message_ids"], [900])
+
+    def test_status_board_caps_discord_writes_per_cycle(self):
+        import asyncio
+
+        channel = self.make_board_channel()
+        watch = self.make_watch({self.module.MOD_GROUP_ID: [], self.module.OOA_GROUP_ID: []}, {})
+        watch.bot.get_channel = lambda channel_id: channel
+        watch.status_boards = {"MOD": {"channel_id": 555, "message_ids": [], "hashes": []}}
+        watch.save_status_boards = lambda: None
+        roster = {f"user{index}": (f"User{index}", "MOD") for index in range(1500)}
+        for username_lc, (name, _policy) in roster.items():
+            watch._state[username_lc] = {"was_online": True, "offline_since": None, "sent_alerts": set(), "profile": {"name": name}}
+
+        message_count = len(watch.render_status_board("MOD", watch.group_status_lines(roster)[0]["MOD"]))
+        writes = [asyncio.run(watch.refresh_status_boards(roster)) for _ in range(3)]
+
+        self.assertGreater(message_count, self.module.STATUS_BOARD_MAX_WRITES_PER_CYCLE)
+        self.assertEqual(writes[0], self.module.STATUS_BOARD_MAX_WRITES_PER_CYCLE)
+        self.assertEqual(sum(writes), message_count)
+        self.assertEqual(len(watch.status_boards["MOD"]["message_ids"]), message_count)
+
+    def test_status_board_skips_a_channel_that_cannot_be_resolved(self):
+        import asyncio
+
+        channel = self.make_board_channel()
+        watch = self.make_watch({self.module.MOD_GROUP_ID: [], self.module.OOA_GROUP_ID: []}, {})
+        watch.bot.get_channel = lambda channel_id: channel if channel_id == 555 else None
+
+        async def fetch_channel(channel_id):
+            raise self.module.discord.NotFound("Unknown Channel")
+
+        watch.bot.fetch_channel = fetch_channel
+        watch.status_boards = {
+            "OOA": {"channel_id": 404, "message_ids": [], "hashes": []},
+            "MOD": {"channel_id": 555, "message_ids": [], "hashes": []},
+        }
+        watch.save_status_boards = lambda: None
+        roster = {"alpha": ("Alpha", "MOD")}
+        watch._state["alpha"] = {"was_online": True, "offline_since": None, "sent_alerts": set(), "profile": {"name": "Alpha"}}
+
+        with self.assertLogs(self.module.LOGGER, level="WARNING"):
+            self.assertEqual(asyncio.run(watch.refresh_status_boards(roster)), 1)
+
+        self.assertEqual(watch.status_boards["MOD"]["message_ids"], [900])
+        self.assertEqual(watch.status_boards["OOA"]["message_ids"], [])
+
     def test_check_slash_with_username_posts_current_embed_even_without_warning(self):
         import asyncio
 
@@ -755,7 +1242,7 @@ class HabboPeriodicNotificationTest(unittest.TestCase):
             {},
         )
 
-        async def fetch_habbo_user(username):
+        async def fetch_habbo_user(username, hotel=None, max_age=0.0, priority=None):
             attempts.append(username)
             if len(attempts) == 3:
                 return {"name": "Alpha", "online": True, "profileVisible": True}
@@ -791,6 +1278,204 @@ class HabboPeriodicNotificationTest(unittest.TestCase):
             [("Habbo profile lookup failed for watched user Missing during forced embed upload; posted a fallback embed instead.", {})],
         )
 
+    def test_sweep_checkpoint_round_trip_restores_cursor_and_cooldown(self):
+        import time
+
+        watch = self.make_watch({}, {})
+        watch._last_checked = {"alpha": 100.0}
+        watch.api.limiter("com").defer(30)
+        watch.api.limiter("de").defer(60)
+        watch._sweep = {"started_at": time.time(), "roster": {"alpha": ("Alpha", "MOD")}, "completed": {"alpha"}}
+
+        restored = self.make_watch({}, {})
+        restored.apply_sweep_checkpoint(watch.build_sweep_checkpoint())
+
+        self.assertEqual(restored._last_checked, {"alpha": 100.0})
+        self.assertEqual(restored._sweep["roster"], {"alpha": ("Alpha", "MOD")})
+        self.assertEqual(restored._sweep["completed"], {"alpha"})
+        cooldowns = restored.api.cooldowns()
+        self.assertGreater(cooldowns["com"], 25)
+        self.assertGreater(cooldowns["de"], 55)
+        self.assertNotIn("fr", cooldowns)
+
+    def test_legacy_checkpoint_cooldown_applies_to_the_default_hotel(self):
+        import time
+
+        restored = self.make_watch({}, {})
+        restored.apply_sweep_checkpoint({"saved_at": time.time(), "next_api_request_at": time.time() + 30})
+
+        self.assertGreater(restored.api.cooldowns()["com"], 25)
+
+    def test_periodic_check_resumes_interrupted_sweep_without_refetching_roster(self):
+        import time
+
+        checked = []
+        roster_fetches = []
+        users = {
+            "alpha": {"name": "Alpha", "online": True, "profileVisible": True},
+            "bravo": {"name": "Bravo", "online": True, "profileVisible": True},
+            "charlie": {"name": "Charlie", "online": True, "profileVisible": True},
+        }
+        watch = self.make_watch({self.module.MOD_GROUP_ID: ["Alpha", "Bravo", "Charlie"]}, users)
+
+        async def fetch_group_members(group_id):
+            roster_fetches.append(group_id)
+            return []
+
+        async def fetch_habbo_user(username, hotel=None, max_age=0.0, priority=None):
+            checked.append(username)
+            return users[username.lower()]
+
+        watch.fetch_group_members = fetch_group_members
+        watch.fetch_habbo_user = fetch_habbo_user
+        watch.save_sweep_checkpoint = lambda: None
+        watch._last_checked = {"alpha": 10.0, "bravo": 500.0, "charlie": 5.0}
+        watch._sweep = {
+            "started_at": time.time(),
+            "roster": {"alpha": ("Alpha", "MOD"), "bravo": ("Bravo", "MOD"), "charlie": ("Charlie", "MOD")},
+            "completed": {"alpha"},
+        }
+
+        self.run_periodic_once(watch)
+
+        self.assertEqual(roster_fetches, [])
+        self.assertEqual(checked, ["Charlie", "Bravo"])
+        self.assertIsNone(watch._sweep)
+
+    def test_stale_sweep_checkpoint_is_not_resumed(self):
+        import time
+
+        watch = self.make_watch({}, {})
+        watch._sweep = None
+        watch.apply_sweep_checkpoint(
+            {
+                "sweep": {
+                    "started_at": time.time() - self.module.SWEEP_RESUME_MAX_AGE_SECONDS - 60,
+                    "roster": {"alpha": ["Alpha", "MOD"]},
+                    "completed": [],
+                }
+            }
+        )
+
+        self.assertIsNone(watch._sweep)
+
+    def test_reload_hands_live_state_to_the_next_instance(self):
+        users = {"alpha": {"name": "Alpha", "online": False, "profileVisible": True}}
+        outgoing = self.make_watch({self.module.MOD_GROUP_ID: ["Alpha"]}, users)
+        outgoing._state["alpha"] = {"was_online": True, "offline_since": None, "sent_alerts": set()}
+        outgoing._profile_failure_streaks = {"bravo": 2}
+        outgoing.export_warm_state()
+
+        # The constructor adopts the handoff, and only once.
+        incoming = self.make_watch({self.module.MOD_GROUP_ID: ["Alpha"]}, users, bot=outgoing.bot)
+        incoming.save_sweep_checkpoint = lambda: None
+
+        self.assertFalse(incoming.adopt_warm_state())
+        self.assertEqual(incoming._profile_failure_streaks, {"bravo": 2})
+
+        # The adopted was_online baseline lets the first sweep see the logoff.
+        self.run_periodic_once(incoming)
+        self.assertIn("alpha", incoming.logoff_times)
+        self.assertFalse(incoming._state["alpha"]["was_online"])
+
+    def test_stale_warm_state_handoff_is_ignored(self):
+        watch = self.make_watch({}, {})
+        setattr(
+            watch.bot,
+            self.module.STATE_HANDOFF_ATTRIBUTE,
+            {self.module.STATE_HANDOFF_KEY: {"exported_at": -self.module.STATE_HANDOFF_MAX_AGE_SECONDS * 2, "state": {"alpha": {}}}},
+        )
+
+        self.assertFalse(watch.adopt_warm_state())
+        self.assertEqual(watch._state, {})
+
+    def test_rosters_naming_a_removed_policy_fall_back_to_the_default(self):
+        import asyncio
+        import time
+        from datetime import datetime, timedelta, timezone
+
+        watch = self.make_watch({}, {})
+        offline_since = datetime.now(timezone.utc) - timedelta(days=3)
+        watch._state["alpha"] = {"was_online": False, "offline_since": offline_since, "sent_alerts": set(), "profile": {"name": "Alpha"}}
+
+        self.assertEqual(watch.digest_status("alpha", "RETIRED"), watch.digest_status("alpha", "MOD"))
+        self.assertEqual(watch.evaluate_status({"name": "Alpha", "online": False, "profileVisible": True}, "Alpha", offline_since, "RETIRED").alert_key, "offline_mod_3d")
+
+        # habbopolicies drops the rosters that carry policy names.
+        watch._status_board_roster = {"alpha": ("Alpha", "RETIRED")}
+        watch._sweep = {"started_at": time.time(), "roster": {"alpha": ("Alpha", "RETIRED")}, "tenants": {}, "completed": set()}
+
+        class Context:
+            async def send(self, content, delete_after=None):
+                pass
+
+        asyncio.run(watch.reload_policies(Context()))
+        self.assertIsNone(watch._status_board_roster)
+        self.assertIsNone(watch._sweep)
+
+    def test_warm_state_handoff_missing_a_field_fails_loudly(self):
+        watch = self.make_watch({}, {})
+        watch.export_warm_state()
+        del getattr(watch.bot, self.module.STATE_HANDOFF_ATTRIBUTE)[self.module.STATE_HANDOFF_KEY]["last_checked"]
+
+        with self.assertRaises(KeyError):
+            watch.adopt_warm_state()
+
+    def test_username_autocomplete_follows_roster_and_records(self):
+        import asyncio
+
+        users = {
+            "alpha": {"name": "Alpha", "online": True, "profileVisible": True, "lastAccessTime": "2026-01-01T00:00:00+00:00"},
+            "alfred": {"name": "Alfred", "online": True, "profileVisible": True, "lastAccessTime": "2026-01-01T00:00:00+00:00"},
+        }
+        watch = self.make_watch({self.module.MOD_GROUP_ID: ["Alpha", "Alfred"]}, users)
+        watch.offline_records = {"zulu": {"display_name": "Zulu"}}
+        watch.name_index.update_source("records", ["Zulu"])
+        self.run_periodic_once(watch)
+
+        self.assertEqual(watch.username_choices("al"), ["Alfred", "Alpha"])
+        self.assertEqual(watch.username_choices("Zulu, alp"), ["Zulu, Alpha"])
+        choices = asyncio.run(watch.username_autocomplete(None, "z"))
+        self.assertEqual([choice.value for choice in choices], ["Zulu"])
+
+    def test_multi_user_check_replies_once_with_embeds_in_input_order(self):
+        import asyncio
+
+        users = {"alpha": {"name": "Alpha", "online": True, "profileVisible": True}}
+        watch = self.make_watch({}, users)
+        requested = []
+
+        async def fetch_habbo_user(username, hotel=None, max_age=0.0, priority=None):
+            requested.append((username, max_age, priority))
+            # Later names finish first.
+            await asyncio.sleep(0.01 * (3 - len(requested)))
+            return users.get(username.lower())
+
+        watch.fetch_habbo_user = fetch_habbo_user
+        edits = []
+
+        class Message:
+            async def edit(self, content=None, embeds=None):
+                edits.append((content, embeds))
+
+        class Followup:
+            async def send(self, content=None, ephemeral=False, wait=False):
+                edits.append((content, None))
+                return Message()
+
+        interaction = FakeInteraction()
+        interaction.followup = Followup()
+        asyncio.run(watch.habbo_check(interaction, username="Alpha, ghost alpha", hotel=None))
+
+        self.assertEqual([name for name, _age, _priority in requested], ["Alpha", "ghost"])
+        self.assertTrue(all(priority == self.module.PRIORITY_INTERACTIVE for _name, _age, priority in requested))
+        self.assertEqual(edits[0][0], "Checking 2 user(s)…")
+        content, embeds = edits[-1]
+        self.assertEqual(content, "Check Complete")
+        self.assertEqual(len(embeds), 2)
+        self.assertEqual(embeds[1].title, "Profile Not Found")
+        self.assertIn("ghost", embeds[1].description)
+
     def test_format_force_check_summary_lists_fallback_profiles(self):
         message = self.watch_cls.format_force_check_summary(20, [f"user{i}" for i in range(12)])
 
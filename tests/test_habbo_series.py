@@ -0,0 +1,78 @@
+"""Unit tests for the tracker's binary numeric time series."""
+
+from pathlib import Path
+import sys
+import tempfile
+import unittest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from COGS import _habbo_series as series  # noqa: E402
+
+HABBO_ID = "hhus-aaaaaaaaaaaaaaaa"
+DAY = 24 * 60 * 60
+HOUR = 60 * 60
+
+
+def profile(experience, gems=3):
+    return {"totalExperience": experience, "currentLevel": 5, "starGemCount": gems, "online": True}
+
+
+class SeriesStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.store = series.SeriesStore(Path(self.directory.name))
+
+    def flush(self, now):
+        pending = self.store.take_pending()
+        self.store.write(pending, now)
+        self.store.finish_write(pending)
+
+    def test_rows_are_appended_only_for_spaced_changes(self):
+        self.assertTrue(self.store.record(HABBO_ID, profile(100), 0))
+        self.assertFalse(self.store.record(HABBO_ID, profile(100), HOUR))  # unchanged
+        self.assertFalse(self.store.record(HABBO_ID, profile(101), 60))  # too soon
+        self.assertTrue(self.store.record(HABBO_ID, profile(110), HOUR))
+        self.assertFalse(self.store.record(HABBO_ID, {"online": False}, 2 * HOUR))
+        self.flush(2 * HOUR)
+        self.assertEqual(self.store.path(HABBO_ID).stat().st_size, series.HEADER.size + 2 * series.ROW_BYTES)
+        # A fresh store picks the last row up from the file.
+        reopened = series.SeriesStore(Path(self.directory.name))
+        self.assertFalse(reopened.record(HABBO_ID, profile(110), 3 * HOUR))
+
+    def test_window_reads_from_file_and_buffer(self):
+        for hour in range(10):
+            self.store.record(HABBO_ID, profile(100 + hour * 10), hour * HOUR)
+        self.flush(10 * HOUR)
+        self.store.record(HABBO_ID, profile(500), 20 * HOUR)
+        rows = self.store.window(HABBO_ID, 7.5 * HOUR)
+        self.assertEqual(rows[::series.ROW_WIDTH].tolist(), [8 * HOUR, 9 * HOUR, 20 * HOUR])
+        trend = self.store.trend(HABBO_ID, 8 * HOUR)["totalExperience"]
+        self.assertEqual((trend["first"], trend["last"], trend["delta"]), (180.0, 500.0, 320.0))
+        self.assertAlmostEqual(trend["per_day"], 320 / 12 * 24)
+        self.assertNotIn("currentLevelCompletePercent", self.store.trend(HABBO_ID, 0))
+        self.assertEqual(self.store.trend("hhus-bbbbbbbbbbbbbbbb", 0), {})
+
+    def test_old_rows_are_downsampled(self):
+        now = 100 * DAY
+        # Every 30 minutes for the last 40 days.
+        times = [now - step * 30 * 60 for step in range(40 * 48, 0, -1)]
+        rows = series.array("d")
+        for step, observed_at in enumerate(times):
+            rows.extend(series.profile_row(profile(step), observed_at))
+        kept = series.downsample(rows, now)[::series.ROW_WIDTH].tolist()
+        self.assertEqual(kept, sorted(kept))
+        self.assertEqual([t for t in kept if now - t < 2 * DAY], [t for t in times if now - t < 2 * DAY])
+        hourly = [t for t in kept if 2 * DAY <= now - t < 30 * DAY]
+        self.assertEqual(len(hourly), len({t // HOUR for t in hourly}))
+        daily = [t for t in kept if now - t >= 30 * DAY]
+        self.assertEqual(len(daily), len({t // DAY for t in daily}))
+        # The last row of each bucket survives.
+        self.assertIn(times[-1], kept)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+"""Unit tests for per-guild watcher tenant configuration and dedupe."""
+
+from pathlib import Path
+import sys
+import unittest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from COGS import _habbo_tenants as tenants  # noqa: E402
+
+POLICIES = {"MOD": object(), "OOA": object()}
+
+
+class TenantConfigTest(unittest.TestCase):
+    def test_parse_skips_malformed_entries_and_round_trips(self):
+        data = {
+            "42": {
+                "groups": [
+                    {"group_id": "g-hhus-01", "policy": "mod", "precedence": 5},
+                    {"group_id": "g-hhus-02", "policy": "unknown"},
+                    {"policy": "OOA"},
+                ],
+                "channels": {"mod": [111, "not-an-id"], "trial": [222]},
+            },
+            "not-a-guild": {"groups": []},
+        }
+
+        parsed = tenants.parse_tenants(data, POLICIES)
+
+        self.assertEqual(list(parsed), [42])
+        self.assertEqual(parsed[42].groups, (tenants.WatchedGroup("g-hhus-01", "MOD", 5),))
+        self.assertEqual(parsed[42].channels, {"MOD": [111]})
+        self.assertEqual(tenants.parse_tenants(tenants.dump_tenants(parsed), POLICIES), parsed)
+
+
+    def test_cap_counts_only_members_the_owner_does_not_watch(self):
+        roster = {name: (name.title(), "MOD") for name in ("alpha", "bravo", "charlie", "delta")}
+
+        capped, dropped = tenants.cap_tenant_roster(roster, {"alpha": ("Alpha", "MOD")}, limit=2)
+
+        self.assertEqual(sorted(capped), ["alpha", "bravo", "charlie"])
+        self.assertEqual(dropped, 1)
+        self.assertIs(tenants.cap_tenant_roster(roster, {}, limit=4)[0], roster)
+
+
+class TenantAlertLogTest(unittest.TestCase):
+    def test_alerts_are_deduped_per_tenant_and_offline_window(self):
+        log = tenants.TenantAlertLog()
+
+        self.assertTrue(log.mark_sent(1, "alpha", "2026-01-01T00:00:00+00:00", "offline_ooa_16h"))
+        self.assertFalse(log.mark_sent(1, "alpha", "2026-01-01T00:00:00+00:00", "offline_ooa_16h"))
+        # Another tenant watching the same member keeps its own dedupe.
+        self.assertTrue(log.mark_sent(2, "alpha", "2026-01-01T00:00:00+00:00", "offline_ooa_16h"))
+        # A new offline window starts a fresh bucket.
+        self.assertTrue(log.mark_sent(1, "alpha", "2026-01-03T00:00:00+00:00", "offline_ooa_16h"))
+
+        restored = tenants.TenantAlertLog(log.to_json())
+        self.assertFalse(restored.mark_sent(2, "alpha", "2026-01-01T00:00:00+00:00", "offline_ooa_16h"))
+
+        restored.retain({1: {"alpha": ("Alpha", "OOA")}})
+        self.assertEqual(list(restored.to_json()), ["1"])
+
+
+if __name__ == "__main__":
+    unittest.main()